@@ -1,15 +1,25 @@
-"""Standalone CLI (replaces `flask` commands)."""
+"""Standalone CLI (replaces `flask` commands).
+
+Commands import what they use inside their own bodies, and the app (DB engine,
+metrics, tracing, event handlers) is only initialised by commands that open a
+session, so ``sea --help``, ``sea db ...`` and ``sea scheduler list`` start
+without loading the web stack.
+"""
 
 from __future__ import annotations
 
 from contextvars import Token
+from functools import cache
+from typing import TYPE_CHECKING
 
 import click
-from sqlalchemy.orm import Session
 
-import app.core.config  # noqa: F401 - load .env
 from app.core.config import PROJECT_ROOT
-from app.db import db, init_db, reset_current_session, set_current_session
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from sqlalchemy.orm import Session
 
 ALEMBIC_INI = PROJECT_ROOT / "migrations" / "alembic.ini"
 
@@ -19,9 +29,25 @@ SCHEDULED_JOBS: tuple[str, ...] = (
 )
 
 
+@cache
+def _init_app() -> None:
+    from app.core.config import get_settings
+    from app.db import init_db
+    from app.events.handlers import connect_handlers
+    from app.metrics import REGISTRY
+    from app.tracing import configure as configure_tracing
+
+    settings = get_settings()
+    init_db()
+    REGISTRY.configure(settings.metrics_multiproc_dir)
+    configure_tracing(settings.trace_export, sample_ratio=settings.trace_sample_ratio)
+    connect_handlers()
+
+
 def _open_cli_session() -> tuple[Session | None, Token | None]:
-    from app.db import get_current_session
+    from app.db import db, get_current_session, set_current_session
 
+    _init_app()
     try:
         get_current_session()
         return None, None
@@ -33,6 +59,7 @@ def _open_cli_session() -> tuple[Session | None, Token | None]:
 
 def _close_cli_session(session: Session | None, token: Token | None) -> None:
     if session is not None and token is not None:
+        from app.db import reset_current_session
         from app.events.background import flush_deferred_handlers
 
         flush_deferred_handlers()
@@ -55,10 +82,6 @@ def _resolve_job(job_name: str):
 @click.group()
 def cli() -> None:
     """South East Archers management commands."""
-    init_db()
-    from app.events.handlers import connect_handlers
-
-    connect_handlers()
 
 
 def main() -> None:
@@ -70,6 +93,37 @@ def db_cli() -> None:
     """Database migrations."""
 
 
+@db_cli.command("wait")
+@click.option("--timeout", default=60.0, show_default=True, type=click.FloatRange(min=0), help="Seconds to keep retrying.")
+@click.option("--interval", default=2.0, show_default=True, type=click.FloatRange(min=0, min_open=True), help="Seconds between attempts.")
+def db_wait(timeout: float, interval: float) -> None:
+    """Wait until the database accepts connections (retries in one process)."""
+    import time
+
+    from sqlalchemy import text
+    from sqlalchemy.exc import SQLAlchemyError
+
+    from app.db import db, init_db
+
+    init_db()
+    assert db.engine is not None
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            with db.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except SQLAlchemyError as exc:
+            if time.monotonic() + interval > deadline:
+                raise click.ClickException(f"Database not ready after {attempt} attempt(s): {exc}") from exc
+            click.echo(f"  Database not ready yet (attempt {attempt})...", err=True)
+            time.sleep(interval)
+            continue
+        click.echo("✓ Database is ready.")
+        return
+
+
 @db_cli.command("upgrade")
 def db_upgrade() -> None:
     """Run Alembic migrations."""
@@ -183,6 +237,48 @@ def users_create() -> None:
         _close_cli_session(session, token)
 
 
+@users_cli.command("reindex-search")
+def users_reindex_search() -> None:
+    """Rebuild the member search index from the users table."""
+    from app.services import users
+
+    session, token = _open_cli_session()
+    try:
+        count = users.rebuild_search_index()
+        click.echo(f"✓ Search index rebuilt for {count} users.")
+    finally:
+        _close_cli_session(session, token)
+
+
+@cli.group("credits")
+def credits_cli() -> None:
+    """Credit ledger maintenance."""
+
+
+@credits_cli.command("reconcile")
+@click.option("--fix", is_flag=True, help="Rewrite drifted balances from the ledger.")
+def credits_reconcile(fix: bool) -> None:
+    """Compare membership credit balances with the credit ledger."""
+    from app.services import credits
+
+    session, token = _open_cli_session()
+    try:
+        mismatches = credits.reconcile_balances() if fix else credits.find_balance_mismatches()
+        for mismatch in mismatches:
+            click.echo(
+                f"  membership {mismatch.membership_id} (user {mismatch.user_id}) {mismatch.bucket}: balance {mismatch.balance}, ledger {mismatch.ledger_total}"
+            )
+        if not mismatches:
+            click.echo("✓ All credit balances match the ledger.")
+        elif fix:
+            click.echo(f"✓ Rebuilt {len(mismatches)} balance(s) from the ledger.")
+        else:
+            click.echo(f"✗ {len(mismatches)} balance(s) differ from the ledger; rerun with --fix to rebuild them.", err=True)
+            raise SystemExit(1)
+    finally:
+        _close_cli_session(session, token)
+
+
 @cli.group("rbac")
 def rbac_cli() -> None:
     """RBAC management."""
@@ -201,6 +297,117 @@ def rbac_seed() -> None:
         _close_cli_session(session, token)
 
 
+@cli.group("dev")
+def dev_cli() -> None:
+    """Development and load-testing helpers."""
+
+
+@dev_cli.command("seed")
+@click.option("--members", default=1000, show_default=True, type=click.IntRange(min=1), help="Members to generate.")
+@click.option("--years", default=3, show_default=True, type=click.IntRange(1, 25), help="Membership years of history.")
+@click.option("--admins", default=2, show_default=True, type=click.IntRange(min=0), help="Admin accounts to generate.")
+@click.option("--seed", "seed_value", default=1, show_default=True, type=int, help="Random seed; the same seed gives the same data.")
+@click.option("--password", default="password", show_default=True, help="Password for every generated account.")
+@click.option(
+    "--as-of", "as_of", type=click.DateTime(formats=["%Y-%m-%d"]), default=None, show_default="today", help="Last day of generated history (YYYY-MM-DD)."
+)
+def dev_seed(members: int, years: int, admins: int, seed_value: int, password: str, as_of: datetime | None) -> None:
+    """Generate a realistic club (memberships, shoots, payments, ledger) with bulk inserts."""
+    import time
+
+    from app.cli.seed import seed_club, seed_email
+    from app.core.config import get_settings
+    from app.db import db
+
+    if get_settings().is_production:
+        raise click.ClickException("Refusing to generate synthetic data in production.")
+
+    session, token = _open_cli_session()
+    try:
+        started = time.perf_counter()
+        try:
+            summary = seed_club(
+                db.session,
+                members=members,
+                years=years,
+                admins=admins,
+                seed=seed_value,
+                password=password,
+                as_of=as_of.date() if as_of else None,
+            )
+        except ValueError as exc:
+            db.session.rollback()
+            raise click.ClickException(str(exc)) from exc
+        db.session.commit()
+        elapsed = time.perf_counter() - started
+        click.echo(f"✓ Generated {summary.rows} rows in {elapsed:.1f}s ({summary.first_date} to {summary.last_date}):")
+        click.echo(f"  {summary.members} members, {summary.admins} admins, {summary.memberships} memberships")
+        click.echo(f"  {summary.shoots} shoots, {summary.attendances} attendances, {summary.visitors} visitors")
+        click.echo(f"  {summary.payments} payments, {summary.ledger_rows} ledger rows, {summary.transactions} finance transactions")
+        if admins:
+            click.echo(f"  Log in as {seed_email('admin', 0, seed_value)} or {seed_email('member', 0, seed_value)} with the given password.")
+    finally:
+        _close_cli_session(session, token)
+
+
+@cli.group("bench")
+def bench_cli() -> None:
+    """Load testing."""
+
+
+@bench_cli.command("http")
+@click.option("--url", default=None, help="Base URL of a running server; omit to drive app.main:app in-process.")
+@click.option("--concurrency", "-c", default=10, show_default=True, type=click.IntRange(min=1), help="Virtual users.")
+@click.option("--duration", "-d", default=30.0, show_default=True, type=click.FloatRange(min=0, min_open=True), help="Seconds to run.")
+@click.option("--requests", "max_requests", default=None, type=click.IntRange(min=1), help="Stop after this many requests.")
+@click.option("--admin-share", default=0.2, show_default=True, type=click.FloatRange(0, 1), help="Fraction of virtual users logged in as admins.")
+@click.option("--members", default=1000, show_default=True, type=click.IntRange(min=1), help="Seeded members to log in as.")
+@click.option("--admins", default=2, show_default=True, type=click.IntRange(min=0), help="Seeded admins to log in as.")
+@click.option("--seed", "seed_value", default=1, show_default=True, type=int, help="The --seed given to `sea dev seed`.")
+@click.option("--password", default="password", show_default=True, help="The --password given to `sea dev seed`.")
+@click.option("--json", "json_path", default=None, type=click.Path(dir_okay=False), help="Also write the report to this JSON file.")
+def bench_http(
+    url: str | None,
+    concurrency: int,
+    duration: float,
+    max_requests: int | None,
+    admin_share: float,
+    members: int,
+    admins: int,
+    seed_value: int,
+    password: str,
+    json_path: str | None,
+) -> None:
+    """Load-test the app as seeded members and admins; report req/s and p50/p95/p99 per route."""
+    import asyncio
+    import json
+    from pathlib import Path
+
+    from app.cli.bench import run_load
+
+    report = asyncio.run(
+        run_load(
+            url=url,
+            concurrency=concurrency,
+            duration=duration,
+            max_requests=max_requests,
+            admin_share=admin_share,
+            members=members,
+            admins=admins,
+            seed=seed_value,
+            password=password,
+        )
+    )
+    click.echo(report.format())
+    if json_path:
+        Path(json_path).write_text(json.dumps(report.as_dict(), indent=2) + "\n")
+    if report.login_failures:
+        raise click.ClickException(
+            f"{len(report.login_failures)} virtual user(s) could not log in (e.g. {report.login_failures[0]}); "
+            "run `sea dev seed` with the same --seed/--password first. Over plain http, set SESSION_SECURE_COOKIE=false."
+        )
+
+
 @cli.group("scheduler")
 def scheduler_cli() -> None:
     """Scheduled maintenance jobs (intended for external cron)."""
@@ -229,8 +436,12 @@ def scheduler_run(job_name: str) -> None:
     register_route_names([type("Route", (), {"name": name, "path": path})() for name, path in FALLBACK_ROUTES.items()])
     setup_template_globals()
 
+    from app.metrics import SCHEDULER_JOB_DURATION, observe_duration
+    from app.tracing import start_span
+
     session, token = _open_cli_session()
     try:
-        job()  # type: ignore[operator]
+        with start_span(f"job {job_name}"), observe_duration(SCHEDULER_JOB_DURATION, job=job_name):
+            job()  # type: ignore[operator]
     finally:
         _close_cli_session(session, token)
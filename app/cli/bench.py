@@ -0,0 +1,262 @@
+"""HTTP load test (``sea bench http``).
+
+Virtual users log in as accounts generated by ``sea dev seed`` and then loop
+over a weighted mix of member or admin pages until the time or request budget
+runs out. Requests go to ``app.main:app`` in-process through an ASGI
+transport, or to a running server with ``--url``. Each virtual user has its
+own cookie jar and client address (``X-Forwarded-For`` against a server), so
+sessions and the login rate limit behave as they would for real visitors.
+Latencies are grouped by the route name from ``app/routes_map.py`` for
+throughput and p50/p95/p99.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any
+
+import httpx
+
+from app.cli.seed import LAST_NAMES, active_member_count, seed_email
+
+_CSRF_RE = re.compile(r'name="csrf_token" value="([^"]+)"')
+IN_PROCESS_URL = "https://bench.local"
+
+
+@dataclass(frozen=True, slots=True)
+class Step:
+    route: str
+    method: str
+    path: str
+    weight: int
+
+
+MEMBER_STEPS = (
+    Step("member.dashboard", "GET", "/member/dashboard", 4),
+    Step("member.shoots", "GET", "/member/shoots", 2),
+    Step("member.credits", "GET", "/member/credits", 1),
+    Step("public.index", "GET", "/", 2),
+    Step("public.about", "GET", "/about", 1),
+)
+ADMIN_STEPS = (
+    Step("admin.dashboard", "GET", "/admin/dashboard", 3),
+    Step("admin.members", "GET", "/admin/members", 2),
+    Step("admin.members", "GET", "/admin/members?search={surname}", 2),
+    Step("admin.finance", "GET", "/admin/finance", 1),
+    Step("admin.shoots", "GET", "/admin/shoots", 1),
+    Step("admin.financial_statement_post", "POST", "/admin/finance/statement", 1),
+    Step("admin.financial_statement_pdf", "GET", "/admin/finance/statement/pdf?start_date={start}&end_date={end}", 1),
+)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+@dataclass(slots=True)
+class RouteStats:
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    busy: int = 0
+
+
+@dataclass(slots=True)
+class LoadReport:
+    elapsed_seconds: float = 0.0
+    routes: dict[str, RouteStats] = field(default_factory=dict)
+    login_failures: list[str] = field(default_factory=list)
+
+    def record(self, route: str, latency_ms: float, *, ok: bool, busy: bool = False) -> None:
+        stats = self.routes.setdefault(route, RouteStats())
+        stats.latencies_ms.append(latency_ms)
+        if busy:
+            stats.busy += 1
+        elif not ok:
+            stats.errors += 1
+
+    @property
+    def total_requests(self) -> int:
+        return sum(len(stats.latencies_ms) for stats in self.routes.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        elapsed = self.elapsed_seconds or 1e-9
+        routes = {}
+        for name, stats in sorted(self.routes.items()):
+            latencies = sorted(stats.latencies_ms)
+            routes[name] = {
+                "requests": len(latencies),
+                "errors": stats.errors,
+                "busy": stats.busy,
+                "rps": round(len(latencies) / elapsed, 2),
+                "p50_ms": round(percentile(latencies, 50), 2),
+                "p95_ms": round(percentile(latencies, 95), 2),
+                "p99_ms": round(percentile(latencies, 99), 2),
+            }
+        return {
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "requests": self.total_requests,
+            "rps": round(self.total_requests / elapsed, 2),
+            "login_failures": self.login_failures,
+            "routes": routes,
+        }
+
+    def format(self) -> str:
+        data = self.as_dict()
+        lines = [f"{'route':<36} {'reqs':>7} {'errs':>5} {'503s':>5} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"]
+        for name, row in data["routes"].items():
+            lines.append(
+                f"{name:<36} {row['requests']:>7} {row['errors']:>5} {row['busy']:>5} {row['rps']:>8.1f} {row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f}"
+            )
+        lines.append(f"{data['requests']} requests in {data['elapsed_seconds']:.1f}s ({data['rps']:.1f} req/s)")
+        return "\n".join(lines)
+
+
+@dataclass(slots=True)
+class _Budget:
+    deadline: float
+    remaining: int | None
+
+    def take(self) -> bool:
+        if time.monotonic() >= self.deadline:
+            return False
+        if self.remaining is not None:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+        return True
+
+
+def _statement_form(csrf_token: str) -> dict[str, str]:
+    today = date.today()
+    return {"csrf_token": csrf_token, "start_date": (today - timedelta(days=365)).isoformat(), "end_date": today.isoformat()}
+
+
+async def _timed(client: httpx.AsyncClient, report: LoadReport, route: str, method: str, path: str, **kwargs: Any) -> httpx.Response:
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, path, **kwargs)
+    except httpx.HTTPError:
+        report.record(route, (time.perf_counter() - started) * 1000, ok=False)
+        raise
+    # Bulkhead rejections (limit_concurrency) are 503s with a Retry-After, reported apart
+    # from errors; a 503 without one is a request that ran out of time.
+    busy = response.status_code == 503 and "retry-after" in response.headers
+    report.record(route, (time.perf_counter() - started) * 1000, ok=response.status_code < 400, busy=busy)
+    return response
+
+
+async def _csrf_token(client: httpx.AsyncClient, report: LoadReport, route: str, path: str) -> str | None:
+    response = await _timed(client, report, route, "GET", path)
+    match = _CSRF_RE.search(response.text)
+    return match.group(1) if match else None
+
+
+async def _virtual_user(
+    client: httpx.AsyncClient,
+    *,
+    email: str,
+    password: str,
+    steps: tuple[Step, ...],
+    rng: random.Random,
+    budget: _Budget,
+    report: LoadReport,
+) -> None:
+    try:
+        token = await _csrf_token(client, report, "auth.login", "/auth/login")
+        response = await _timed(
+            client, report, "auth.login_post", "POST", "/auth/login", data={"email": email, "password": password, "csrf_token": token or ""}
+        )
+    except httpx.HTTPError:
+        report.login_failures.append(email)
+        return
+    if response.status_code != 303 or response.headers.get("location", "").startswith("/auth/login"):
+        report.login_failures.append(email)
+        return
+
+    csrf_token: str | None = None
+    weights = [step.weight for step in steps]
+    today = date.today()
+    while budget.take():
+        step = rng.choices(steps, weights=weights)[0]
+        path = step.path.format(surname=rng.choice(LAST_NAMES).lower(), start=(today - timedelta(days=365)).isoformat(), end=today.isoformat())
+        try:
+            if step.method == "POST":
+                if csrf_token is None:
+                    # The session keeps one token, as tests/http_helpers.CSRFClient assumes.
+                    csrf_token = await _csrf_token(client, report, step.route.removesuffix("_post"), path)
+                await _timed(client, report, step.route, "POST", path, data=_statement_form(csrf_token or ""))
+            else:
+                await _timed(client, report, step.route, "GET", path)
+        except httpx.HTTPError:
+            continue
+
+
+async def run_load(
+    *,
+    url: str | None = None,
+    concurrency: int = 10,
+    duration: float = 30.0,
+    max_requests: int | None = None,
+    admin_share: float = 0.2,
+    members: int = 1000,
+    admins: int = 2,
+    seed: int = 1,
+    password: str = "password",
+    timeout: float = 30.0,
+    asgi_app: Any = None,
+) -> LoadReport:
+    """Run ``concurrency`` virtual users for ``duration`` seconds (or ``max_requests``)."""
+    if url is None and asgi_app is None:
+        from app.main import app as asgi_app
+
+    report = LoadReport()
+    admin_users = min(concurrency, round(concurrency * admin_share)) if admins else 0
+    # Unactivated sign-ups cannot log in, so members cycle through the active ones.
+    active_members = max(active_member_count(members), 1)
+
+    def _client(index: int) -> httpx.AsyncClient:
+        address = f"10.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}"
+        if url is None:
+            transport = httpx.ASGITransport(app=asgi_app, client=(address, 40000 + index % 20000))
+            return httpx.AsyncClient(transport=transport, base_url=IN_PROCESS_URL, timeout=timeout)
+        return httpx.AsyncClient(base_url=url, timeout=timeout, headers={"X-Forwarded-For": address})
+
+    async def _run() -> None:
+        budget = _Budget(deadline=time.monotonic() + duration, remaining=max_requests)
+        clients = [_client(index) for index in range(concurrency)]
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(
+                *(
+                    _virtual_user(
+                        client,
+                        email=seed_email("admin", index % admins, seed) if index < admin_users else seed_email("member", index % active_members, seed),
+                        password=password,
+                        steps=ADMIN_STEPS if index < admin_users else MEMBER_STEPS,
+                        rng=random.Random(f"{seed}-{index}"),
+                        budget=budget,
+                        report=report,
+                    )
+                    for index, client in enumerate(clients)
+                )
+            )
+        finally:
+            report.elapsed_seconds = time.perf_counter() - started
+            for client in clients:
+                await client.aclose()
+
+    if url is None:
+        async with asgi_app.router.lifespan_context(asgi_app):
+            await _run()
+    else:
+        await _run()
+    return report
@@ -0,0 +1,424 @@
+"""Synthetic club data for load testing and benchmarks (``sea dev seed``).
+
+Rows are built in Python and written with multi-row Core inserts, bypassing
+the ORM, so a hundred thousand rows take seconds. The simulation walks the
+club's history a membership year at a time: members join and renew (or lapse),
+shoots run twice a week with members and paying visitors, members who run out
+of credits buy more at the door, and every credit change is written to the
+ledger, so ``sea credits reconcile`` finds nothing to fix. A given ``seed``
+always produces the same rows.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import cast
+
+from sqlalchemy import Connection, Table, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.security import hash_password
+from app.enums import PaymentMethod, PaymentType
+from app.models import CreditLedgerEntry, FinancialTransaction, Membership, Payment, Role, Shoot, ShootLocation, ShootVisitor, User
+from app.models.rbac import user_roles
+from app.models.shoot import user_shoots
+from app.models.user_search import rebuild_user_search_tokens
+from app.services import settings as settings_service
+
+FIRST_NAMES = ("Sean", "Aoife", "Niamh", "Conor", "Ciara", "Padraig", "Siobhan", "Eoin", "Roisin", "Darragh", "Orla", "Cian")
+LAST_NAMES = ("Murphy", "Kelly", "O'Brien", "Walsh", "Byrne", "Ryan", "Doyle", "Kavanagh", "Nolan", "Brennan", "Kinsella", "Dunne")
+VISITOR_CLUBS = ("Wexford Archers", "Kilkenny Bowmen", "Carlow Archery Club", "Waterford Field Archers")
+SHOOT_WEEKDAYS = (2, 6)  # Wednesday evening and Sunday morning
+CREDIT_PACKS = (5, 10)
+BATCH_SIZE = 2000
+
+
+def seed_email(kind: str, index: int, seed: int) -> str:
+    """Login email of the ``index``-th seeded ``kind`` ("admin" or "member")."""
+    return f"{kind}{index}@seed{seed}.example.com"
+
+
+def active_member_count(members: int) -> int:
+    """Members ``0 .. n-1`` of a seeded club can log in; the last 5% are unactivated sign-ups."""
+    return members - members // 20
+
+
+@dataclass(slots=True)
+class SeedSummary:
+    members: int = 0
+    admins: int = 0
+    memberships: int = 0
+    shoots: int = 0
+    attendances: int = 0
+    visitors: int = 0
+    payments: int = 0
+    ledger_rows: int = 0
+    transactions: int = 0
+    first_date: date = field(default_factory=date.today)
+    last_date: date = field(default_factory=date.today)
+
+    @property
+    def rows(self) -> int:
+        return (
+            self.members
+            + self.admins
+            + self.memberships
+            + self.shoots
+            + self.attendances
+            + self.visitors
+            + self.payments
+            + self.ledger_rows
+            + self.transactions
+        )
+
+
+@dataclass(slots=True)
+class _Member:
+    user_id: int
+    joined_year: int
+    last_year: int
+    membership_id: int | None = None
+    initial: int = 0
+    purchased: int = 0
+    status: str = "pending"
+    start_date: date | None = None
+    expiry_date: date | None = None
+
+
+class _Writer:
+    """Collects rows per table and tracks the next primary key for explicit ids."""
+
+    def __init__(self, connection: Connection) -> None:
+        self.connection = connection
+        self.rows: dict[Table, list[dict]] = {}
+        self._next_ids: dict[Table, int] = {}
+
+    def next_id(self, table: Table) -> int:
+        if table not in self._next_ids:
+            self._next_ids[table] = (self.connection.scalar(select(func.max(table.c.id))) or 0) + 1
+        value = self._next_ids[table]
+        self._next_ids[table] = value + 1
+        return value
+
+    def add(self, table: Table, row: dict) -> dict:
+        self.rows.setdefault(table, []).append(row)
+        return row
+
+    def flush(self, *tables: Table) -> None:
+        for table in tables:
+            rows = self.rows.pop(table, [])
+            for start in range(0, len(rows), BATCH_SIZE):
+                self.connection.execute(insert(table), rows[start : start + BATCH_SIZE])
+
+
+def _at(day: date, hour: int = 19) -> datetime:
+    return datetime.combine(day, time(hour))
+
+
+def _year_start(base: date, years_back: int) -> date:
+    try:
+        return base.replace(year=base.year - years_back)
+    except ValueError:  # 29 February
+        return base.replace(year=base.year - years_back, day=28)
+
+
+def seed_club(
+    session: Session,
+    *,
+    members: int,
+    years: int = 3,
+    admins: int = 2,
+    seed: int = 1,
+    password: str = "password",
+    as_of: date | None = None,
+) -> SeedSummary:
+    """Generate ``years`` membership years of club history up to ``as_of`` (default today) and flush it.
+
+    Every date is derived from ``as_of``, so a fixed ``as_of`` and ``seed``
+    produce the same history whatever day the command runs.
+
+    The caller commits. Raises ``ValueError`` when this ``seed`` was already
+    used on this database or the RBAC roles have not been seeded.
+    """
+    connection = session.connection()
+    if connection.scalar(select(User.id).where(User.email == seed_email("member", 0, seed))) is not None:
+        raise ValueError(f"Seed {seed} has already been generated on this database; pick another --seed.")
+    admin_role_id = connection.scalar(select(Role.id).where(Role.name == "Admin"))
+    if admins and admin_role_id is None:
+        raise ValueError("The Admin role is missing; run `sea rbac seed` first.")
+
+    rng = random.Random(seed)
+    as_of = as_of or date.today()
+    current_year_start = settings_service.get_membership_year_start(as_of)
+    year_starts = [_year_start(current_year_start, years - 1 - offset) for offset in range(years)]
+    visitor_fee = settings_service.get("visitor_shoot_fee")
+    membership_fee = settings_service.get("annual_membership_cost")
+    credit_price = settings_service.get("additional_shoot_cost")
+    password_hash = hash_password(password)
+
+    writer = _Writer(connection)
+    users, memberships, shoots, payments = (cast(Table, model.__table__) for model in (User, Membership, Shoot, Payment))
+    ledger, visitors, transactions = (cast(Table, model.__table__) for model in (CreditLedgerEntry, ShootVisitor, FinancialTransaction))
+    summary = SeedSummary(first_date=year_starts[0], last_date=as_of)
+
+    def payment(user_id: int, payment_type: PaymentType, amount_cents: int, day: date, status: str = "completed") -> dict:
+        method = PaymentMethod.ONLINE if rng.random() < 0.6 else PaymentMethod.CASH
+        payment_id = writer.next_id(payments)
+        row = writer.add(
+            payments,
+            {
+                "id": payment_id,
+                "user_id": user_id,
+                "amount_cents": amount_cents,
+                "currency": "EUR",
+                "payment_type": payment_type,
+                "payment_method": method,
+                "status": status,
+                "description": f"{payment_type.value.title()} payment",
+                "payment_processor": "sumup" if method == PaymentMethod.ONLINE else "cash",
+                "sumup_checkout_id": f"seed{seed}-checkout-{payment_id}" if method == PaymentMethod.ONLINE else None,
+                "external_transaction_id": f"seed{seed}-txn-{payment_id}" if method == PaymentMethod.ONLINE and status == "completed" else None,
+                "created_at": _at(day, rng.randrange(8, 22)),
+                "updated_at": _at(day, 22),
+            },
+        )
+        summary.payments += 1
+        if status == "completed":
+            income(
+                day,
+                amount_cents,
+                "membership_fees" if payment_type == PaymentType.MEMBERSHIP else "shoot_fees",
+                row["description"],
+                source="SumUp" if method == PaymentMethod.ONLINE else "Cash",
+                receipt_reference=row["external_transaction_id"] or f"cash-payment-{payment_id}",
+                created_by_id=user_id,
+            )
+        return row
+
+    def income(day: date, amount_cents: int, category: str, description: str, *, source: str, created_by_id: int, receipt_reference: str | None = None) -> None:
+        writer.add(
+            transactions,
+            {
+                "type": "income",
+                "date": day,
+                "amount_cents": amount_cents,
+                "currency": "EUR",
+                "category": category,
+                "description": description,
+                "source": source,
+                "receipt_reference": receipt_reference,
+                "created_by_id": created_by_id,
+                "created_at": _at(day, 22),
+                "updated_at": _at(day, 22),
+            },
+        )
+        summary.transactions += 1
+
+    def credit_change(member: _Member, bucket: str, new_balance: int, reason: str, day: date, **refs: int | None) -> None:
+        previous = member.initial if bucket == "initial" else member.purchased
+        if new_balance == previous:
+            return
+        if bucket == "initial":
+            member.initial = new_balance
+        else:
+            member.purchased = new_balance
+        writer.add(
+            ledger,
+            {
+                "membership_id": member.membership_id,
+                "user_id": member.user_id,
+                "bucket": bucket,
+                "delta": new_balance - previous,
+                "balance_after": new_balance,
+                "reason": reason,
+                "shoot_id": refs.get("shoot_id"),
+                "payment_id": refs.get("payment_id"),
+                "actor_id": None,
+                "created_at": _at(day),
+            },
+        )
+        summary.ledger_rows += 1
+
+    # Accounts: admins first, then members with the year they joined and the last year they renewed.
+    admin_ids: list[int] = []
+    roster: list[_Member] = []
+    for kind, count in (("admin", admins), ("member", members)):
+        for index in range(count):
+            user_id = writer.next_id(users)
+            # Most members joined recently; a long tail has been around since the first year.
+            joined = 0 if kind == "admin" else years - 1 - min(int(rng.expovariate(1.2) * years / 2), years - 1)
+            lapsed = kind == "member" and rng.random() < 0.25
+            last_year = rng.randrange(joined, years) if lapsed else years - 1
+            first = FIRST_NAMES[rng.randrange(len(FIRST_NAMES))]
+            last = LAST_NAMES[rng.randrange(len(LAST_NAMES))]
+            writer.add(
+                users,
+                {
+                    "id": user_id,
+                    "name": f"{first} {last}" if kind == "member" else f"Admin {first} {last}",
+                    "email": seed_email(kind, index, seed),
+                    "phone": f"08{rng.randrange(3, 8)} {rng.randrange(10**6, 10**7)}",
+                    "password_hash": password_hash,
+                    "qualification": rng.choice(("None", "Beginner Course", "Club Archer", "Coach")),
+                    "is_active": kind == "admin" or index < active_member_count(members),
+                    "created_at": _at(year_starts[joined] + timedelta(days=rng.randrange(0, 28)), 12),
+                    "updated_at": _at(year_starts[joined], 12),
+                },
+            )
+            if kind == "admin":
+                admin_ids.append(user_id)
+                writer.add(user_roles, {"user_id": user_id, "role_id": admin_role_id, "created_at": _at(year_starts[0], 12)})
+            elif rng.random() < 0.92:
+                roster.append(_Member(user_id, joined, last_year))
+            else:
+                # Signed up but never paid: a pending membership awaiting its first payment.
+                writer.add(
+                    memberships,
+                    {
+                        "id": writer.next_id(memberships),
+                        "user_id": user_id,
+                        "start_date": as_of,
+                        "expiry_date": as_of + timedelta(days=365),
+                        "initial_credits": 0,
+                        "purchased_credits": 0,
+                        "status": "pending",
+                        "created_at": _at(as_of, 12),
+                        "updated_at": _at(as_of, 12),
+                    },
+                )
+                summary.memberships += 1
+                payment(
+                    user_id,
+                    PaymentType.MEMBERSHIP,
+                    membership_fee,
+                    as_of - timedelta(days=rng.randrange(0, 14)),
+                    status=rng.choice(("pending", "failed", "cancelled")),
+                )
+    summary.members, summary.admins = members, admins
+    created_by = admin_ids[0] if admin_ids else roster[0].user_id
+    writer.flush(users, user_roles)
+    rebuild_user_search_tokens(connection)
+
+    for year, year_start in enumerate(year_starts):
+        year_end = min(_year_start(year_start, -1) - timedelta(days=1), as_of)
+        # Renewals (and first payments) in the first weeks of the membership year.
+        active: list[_Member] = []
+        for member in roster:
+            if not member.joined_year <= year <= member.last_year:
+                continue
+            paid_on = year_start + timedelta(days=rng.randrange(0, 28))
+            if paid_on > as_of:
+                paid_on = as_of
+            payment_row = payment(member.user_id, PaymentType.MEMBERSHIP, membership_fee, paid_on)
+            if member.membership_id is None:
+                member.membership_id = writer.next_id(memberships)
+                credit_change(member, "initial", 20, "opening_balance", paid_on)
+            else:
+                credit_change(member, "initial", 20, "renewal", paid_on, payment_id=payment_row["id"])
+            member.status, member.start_date, member.expiry_date = "active", paid_on, _year_start(year_start, -1) - timedelta(days=1)
+            active.append(member)
+            if rng.random() < 0.05:
+                payment(member.user_id, PaymentType.MEMBERSHIP, membership_fee, paid_on - timedelta(days=1), status=rng.choice(("failed", "cancelled")))
+
+        regulars = [member for member in active if rng.random() < 0.7]
+        day = year_start
+        while day <= year_end:
+            if day.weekday() in SHOOT_WEEKDAYS:
+                shoot_id = writer.next_id(shoots)
+                writer.add(
+                    shoots,
+                    {
+                        "id": shoot_id,
+                        "date": day,
+                        "location": ShootLocation.HALL if day.month in (10, 11, 12, 1, 2, 3) else rng.choice((ShootLocation.MEADOW, ShootLocation.WOODS)),
+                        "description": None,
+                        "created_at": _at(day, 21),
+                        "updated_at": _at(day, 21),
+                    },
+                )
+                summary.shoots += 1
+                pool = regulars if regulars and rng.random() < 0.8 else active
+                for member in rng.sample(pool, k=min(len(pool), rng.randrange(8, 30))):
+                    if member.initial + member.purchased <= 0 and rng.random() < 0.6:
+                        pack = rng.choice(CREDIT_PACKS)
+                        bought = payment(member.user_id, PaymentType.CREDITS, pack * credit_price, day)
+                        credit_change(member, "purchased", member.purchased + pack, "purchase", day, payment_id=bought["id"])
+                    if member.initial > 0 or member.purchased <= 0:
+                        credit_change(member, "initial", member.initial - 1, "shoot_attendance", day, shoot_id=shoot_id)
+                    else:
+                        credit_change(member, "purchased", member.purchased - 1, "shoot_attendance", day, shoot_id=shoot_id)
+                    writer.add(user_shoots, {"user_id": member.user_id, "shoot_id": shoot_id, "attended_at": _at(day)})
+                    summary.attendances += 1
+                for _ in range(rng.choice((0, 0, 1, 1, 2, 3))):
+                    name = f"{FIRST_NAMES[rng.randrange(len(FIRST_NAMES))]} {LAST_NAMES[rng.randrange(len(LAST_NAMES))]}"
+                    club = rng.choice(VISITOR_CLUBS)
+                    method = rng.choice(("cash", "sumup"))
+                    writer.add(
+                        visitors,
+                        {
+                            "shoot_id": shoot_id,
+                            "name": name,
+                            "club": club,
+                            "affiliation": rng.choice(("AI", "IFAF")),
+                            "payment_method": method,
+                            "created_at": _at(day),
+                        },
+                    )
+                    summary.visitors += 1
+                    income(
+                        day,
+                        visitor_fee,
+                        "shoot_fees",
+                        f"Visitor shoot fee - {name} ({club})",
+                        source="SumUp" if method == "sumup" else "Cash",
+                        created_by_id=created_by,
+                    )
+            day += timedelta(days=1)
+
+        for month in range(12):
+            paid_on = year_start + timedelta(days=30 * month + 5)
+            if paid_on > as_of:
+                break
+            writer.add(
+                transactions,
+                {
+                    "type": "expense",
+                    "date": paid_on,
+                    "amount_cents": rng.randrange(15000, 40000),
+                    "currency": "EUR",
+                    "category": "venue_hire",
+                    "description": "Hall hire",
+                    "source": None,
+                    "receipt_reference": None,
+                    "created_by_id": created_by,
+                    "created_at": _at(paid_on, 12),
+                    "updated_at": _at(paid_on, 12),
+                },
+            )
+            summary.transactions += 1
+
+    for member in roster:
+        if member.membership_id is None:
+            continue
+        status = member.status if member.expiry_date is not None and member.expiry_date >= as_of else "expired"
+        writer.add(
+            memberships,
+            {
+                "id": member.membership_id,
+                "user_id": member.user_id,
+                "start_date": member.start_date,
+                "expiry_date": member.expiry_date,
+                "initial_credits": member.initial,
+                "purchased_credits": member.purchased,
+                "status": status,
+                "created_at": _at(year_starts[member.joined_year], 12),
+                "updated_at": _at(as_of, 12),
+            },
+        )
+        summary.memberships += 1
+
+    writer.flush(memberships, shoots, payments, user_shoots, visitors, ledger, transactions)
+    session.flush()
+    return summary
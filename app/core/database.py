@@ -1,19 +1,56 @@
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
 
-from sqlalchemy.orm import Session
+from fastapi import Request
 
+from app.core.config import get_settings
 from app.db import db as database
 from app.db import init_db, reset_current_session, set_current_session
+from app.db.session import LazySession
 
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+PRIMARY_UNTIL_KEY = "_db_primary_until"
 
-async def get_db() -> AsyncGenerator[Session]:
-    """Open a request-scoped session.
+
+def read_only[F: Callable[..., Any]](endpoint: F) -> F:
+    """Give a non-GET route that only queries (e.g. a report form) a read-only session."""
+    endpoint.db_read_only = True  # type: ignore[attr-defined]
+    return endpoint
+
+
+def read_write[F: Callable[..., Any]](endpoint: F) -> F:
+    """Give a GET route that changes data a read-write session on the primary."""
+    endpoint.db_read_only = False  # type: ignore[attr-defined]
+    return endpoint
+
+
+def is_read_only_request(request: Request) -> bool:
+    """GET/HEAD requests are read-only unless the route is marked with ``@read_write``."""
+    endpoint = request.scope.get("endpoint")
+    return bool(getattr(endpoint, "db_read_only", request.method in READ_ONLY_METHODS))
+
+
+def _pinned_to_primary(request: Request) -> bool:
+    return float(request.session.get(PRIMARY_UNTIL_KEY, 0)) > time.time()
+
+
+async def get_db(request: Request) -> AsyncGenerator[LazySession]:
+    """Bind a request-scoped session, created the first time the request uses it.
 
     Does not auto-commit on success: services must call ``BaseRepository.save()``
     or ``with BaseRepository.transaction()`` so writes are persisted explicitly.
+    Read-only requests get a session that refuses writes, bound to the replica
+    when one is configured; a write pins the visitor's session to the primary
+    for ``database_replica_sticky_seconds`` so the page after the redirect
+    shows the change.
     """
     init_db()
-    session = database.create_session()
+    read_only_request = is_read_only_request(request)
+    if not read_only_request and database.has_replica:
+        request.session[PRIMARY_UNTIL_KEY] = time.time() + get_settings().database_replica_sticky_seconds
+    replica = read_only_request and database.has_replica and not _pinned_to_primary(request)
+    session = database.lazy_session(read_only=read_only_request, replica=replica)
     token = set_current_session(session)
     try:
         yield session
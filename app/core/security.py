@@ -1,17 +1,23 @@
 import os
-from typing import cast
+from functools import cache
+from typing import TYPE_CHECKING, cast
 
-from passlib.context import CryptContext
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
 
-if os.environ.get("APP_ENV") == "testing":
-    pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4, deprecated="auto")
-else:
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@cache
+def _pwd_context() -> CryptContext:
+    from passlib.context import CryptContext
+
+    if os.environ.get("APP_ENV") == "testing":
+        return CryptContext(schemes=["bcrypt"], bcrypt__rounds=4, deprecated="auto")
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def hash_password(password: str) -> str:
-    return cast(str, pwd_context.hash(password))
+    return cast(str, _pwd_context().hash(password))
 
 
 def verify_password(plain: str, hashed: str) -> bool:
-    return cast(bool, pwd_context.verify(plain, hashed))
+    return cast(bool, _pwd_context().verify(plain, hashed))
@@ -1,16 +1,24 @@
 """Standalone SQLAlchemy database layer (no Flask)."""
 
-from app.db.pagination import Pagination, paginate
+from app.db.pagination import Pagination, paginate, paginate_rows
+from app.db.read_only import ReadOnlySessionError, is_read_only, mark_read_only
 from app.db.session import Database, Model, db, get_current_session, init_db, reset_current_session, set_current_session
+from app.db.write_tracking import on_commit_tables, on_commit_writing
 
 __all__ = [
     "Database",
     "Model",
     "Pagination",
+    "ReadOnlySessionError",
     "db",
     "get_current_session",
     "init_db",
+    "is_read_only",
+    "mark_read_only",
+    "on_commit_tables",
+    "on_commit_writing",
     "paginate",
+    "paginate_rows",
     "reset_current_session",
     "set_current_session",
 ]
@@ -0,0 +1,50 @@
+"""Read-only sessions for requests that only query.
+
+A session marked with ``mark_read_only`` refuses to flush or run ``insert``,
+``update`` or ``delete`` statements, so it never builds a unit of work, and
+on MySQL each of its transactions starts with ``SET TRANSACTION READ ONLY``
+so InnoDB skips assigning it a transaction id. ``get_db`` hands these out to
+GET requests and, when ``DATABASE_REPLICA_URL`` is set, binds them to the
+replica.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction, UOWTransaction
+
+_READ_ONLY_KEY = "read_only"
+
+
+class ReadOnlySessionError(RuntimeError):
+    """Raised when a read-only session is asked to write."""
+
+
+def mark_read_only(session: Session, read_only: bool = True) -> Session:
+    session.info[_READ_ONLY_KEY] = read_only
+    return session
+
+
+def is_read_only(session: Session) -> bool:
+    return bool(session.info.get(_READ_ONLY_KEY))
+
+
+@event.listens_for(Session, "before_flush")
+def _refuse_flush(session: Session, _flush_context: UOWTransaction, _instances: object) -> None:
+    if is_read_only(session) and (session.new or session.dirty or session.deleted):
+        raise ReadOnlySessionError("This request has a read-only database session; mark the route with @read_write to change data.")
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _refuse_bulk_writes(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.statement.is_dml and is_read_only(orm_execute_state.session):
+        raise ReadOnlySessionError("This request has a read-only database session; mark the route with @read_write to change data.")
+
+
+@event.listens_for(Session, "after_begin")
+def _begin_read_only(session: Session, transaction: SessionTransaction, connection: Connection) -> None:
+    # MySQL applies SET TRANSACTION to the next transaction, which starts with
+    # the first query the session sends on this connection.
+    if is_read_only(session) and transaction.parent is None and connection.dialect.name == "mysql":
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY")
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import warnings
+from collections.abc import Callable
 from contextvars import ContextVar, Token
+from functools import partial
 from typing import Any
 
 from sqlalchemy import create_engine, or_
@@ -9,8 +11,47 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase, Query, Session, sessionmaker
 
 from app.core.config import Settings, get_settings
+from app.db.read_only import mark_read_only
+from app.db.statement_timeouts import apply_statement_timeouts
+from app.metrics.database import instrument_engine
+from app.tracing.instrumentation import instrument_engine as trace_engine
 
-_current_session: ContextVar[Session | None] = ContextVar("db_session", default=None)
+_current_session: ContextVar[Session | LazySession | None] = ContextVar("db_session", default=None)
+
+
+class LazySession:
+    """Stands in for a request's Session until something actually uses it.
+
+    ``db.session`` creates the real Session on first access, so requests that
+    never reach a repository skip building one; ``rollback`` and ``close`` only
+    act on a Session that was opened.
+    """
+
+    __slots__ = ("_factory", "_session")
+
+    def __init__(self, factory: Callable[[], Session]) -> None:
+        self._factory = factory
+        self._session: Session | None = None
+
+    @property
+    def opened(self) -> bool:
+        return self._session is not None
+
+    def get(self) -> Session:
+        if self._session is None:
+            self._session = self._factory()
+        return self._session
+
+    def rollback(self) -> None:
+        if self._session is not None:
+            self._session.rollback()
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get(), name)
 
 
 class Base(DeclarativeBase):
@@ -34,28 +75,53 @@ class Model(Base):
     query = _QueryProperty()
 
 
+def _create_engine(url: str) -> Engine:
+    connect_args: dict[str, Any] = {}
+    pool_args: dict[str, Any] = {}
+    if url.startswith("sqlite"):
+        connect_args["check_same_thread"] = False
+    else:
+        settings = get_settings()
+        pool_args = {"pool_size": settings.database_pool_size, "max_overflow": settings.database_max_overflow}
+    engine = create_engine(url, pool_pre_ping=True, connect_args=connect_args, **pool_args)
+    instrument_engine(engine)
+    trace_engine(engine)
+    apply_statement_timeouts(engine)
+    return engine
+
+
 class Database:
     def __init__(self) -> None:
         self.engine: Engine | None = None
         self._session_factory: sessionmaker[Session] | None = None
+        self.replica_engine: Engine | None = None
+        self._replica_session_factory: sessionmaker[Session] | None = None
 
-    def create_session(self) -> Session:
+    @property
+    def has_replica(self) -> bool:
+        return self._replica_session_factory is not None
+
+    def create_session(self, *, read_only: bool = False, replica: bool = False) -> Session:
+        """A new session; ``replica`` sessions are read-only and use the replica when one is configured."""
         if self._session_factory is None:
             init_db()
         assert self._session_factory is not None
-        return self._session_factory()
+        if replica and self._replica_session_factory is not None:
+            return mark_read_only(self._replica_session_factory())
+        session = self._session_factory()
+        return mark_read_only(session) if read_only or replica else session
+
+    def lazy_session(self, *, read_only: bool = False, replica: bool = False) -> LazySession:
+        """A session that is only created when first used."""
+        return LazySession(partial(self.create_session, read_only=read_only, replica=replica))
 
     def init(self, settings: Settings | None = None) -> None:
         settings = settings or get_settings()
-        connect_args: dict[str, Any] = {}
-        if settings.database_url.startswith("sqlite"):
-            connect_args["check_same_thread"] = False
-        self.engine = create_engine(
-            settings.database_url,
-            pool_pre_ping=True,
-            connect_args=connect_args,
-        )
+        self.engine = _create_engine(settings.database_url)
         self._session_factory = sessionmaker(bind=self.engine, autoflush=False, autocommit=False)
+        if settings.database_replica_url:
+            self.replica_engine = _create_engine(settings.database_replica_url)
+            self._replica_session_factory = sessionmaker(bind=self.replica_engine, autoflush=False, autocommit=False)
 
     @property
     def session(self) -> Session:
@@ -102,10 +168,12 @@ def get_current_session() -> Session:
     session = _current_session.get()
     if session is None:
         raise RuntimeError("No database session is active for this request.")
+    if isinstance(session, LazySession):
+        return session.get()
     return session
 
 
-def set_current_session(session: Session) -> Token:
+def set_current_session(session: Session | LazySession) -> Token:
     return _current_session.set(session)
 
 
@@ -0,0 +1,65 @@
+"""Cut SQL statements off when the current time budget runs out.
+
+Inside ``app.utils.deadline.deadline(...)`` (every HTTP request, every
+deferred handler) a statement is refused once the budget is spent; on MySQL
+each ``SELECT`` carries a ``MAX_EXECUTION_TIME`` hint for what is left of it,
+and on SQLite a progress handler interrupts a statement that overruns. Either
+way the caller gets ``DeadlineExceeded`` rather than a worker thread and a
+pooled connection held by one pathological query.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.exceptions import DeadlineExceeded
+from app.utils.deadline import check, expired, remaining
+
+_SELECT = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+# MySQL ER_QUERY_TIMEOUT: "maximum statement execution time exceeded".
+_MYSQL_QUERY_TIMEOUT = 3024
+# SQLite runs the progress handler every this many virtual machine instructions.
+_SQLITE_PROGRESS_STEPS = 10_000
+
+
+def _limit_statement(conn, _cursor, statement, parameters, _context, _executemany):
+    left = remaining()
+    if left is None:
+        return statement, parameters
+    check()
+    if conn.dialect.name == "mysql" and _SELECT.match(statement):
+        milliseconds = max(1, int(left * 1000))
+        statement = _SELECT.sub(f"SELECT /*+ MAX_EXECUTION_TIME({milliseconds}) */", statement, count=1)
+    return statement, parameters
+
+
+def _interrupt_when_expired() -> int:
+    return 1 if expired() else 0
+
+
+def _install_progress_handler(dbapi_connection, _connection_record) -> None:
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.set_progress_handler(_interrupt_when_expired, _SQLITE_PROGRESS_STEPS)
+
+
+def _is_timeout(error: BaseException | None) -> bool:
+    if isinstance(error, sqlite3.OperationalError):
+        return "interrupted" in str(error)
+    args: tuple[object, ...] = getattr(error, "args", ())
+    return bool(args) and args[0] == _MYSQL_QUERY_TIMEOUT
+
+
+def _raise_deadline_exceeded(exception_context) -> None:
+    if remaining() is not None and _is_timeout(exception_context.original_exception):
+        raise DeadlineExceeded() from exception_context.original_exception
+
+
+def apply_statement_timeouts(engine: Engine) -> None:
+    # First in line, so a statement refused up front never reaches the metrics and tracing hooks.
+    event.listen(engine, "before_cursor_execute", _limit_statement, retval=True, insert=True)
+    event.listen(engine, "handle_error", _raise_deadline_exceeded)
+    event.listen(engine, "connect", _install_progress_handler)
@@ -0,0 +1,78 @@
+"""Run callbacks after a commit that wrote to particular tables.
+
+Every session records which tables it flushed or bulk-wrote (``insert``,
+``update``, ``delete`` through ``Session.execute``); on commit, callbacks
+registered for any of those tables run. Rolled-back writes are forgotten. Used
+to drop in-process caches as soon as the data behind them changes; the
+``@cached`` service reads in ``app.utils.cache`` use the table names as their
+invalidation tags.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable
+from typing import cast
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+from sqlalchemy.sql import TableClause
+from sqlalchemy.sql.dml import UpdateBase
+
+logger = logging.getLogger(__name__)
+
+_WRITTEN_TABLES_KEY = "written_tables"
+_listeners: list[tuple[frozenset[str], Callable[[], None]]] = []
+_table_listeners: list[Callable[[frozenset[str]], None]] = []
+
+
+def on_commit_writing(tables: Iterable[str], callback: Callable[[], None]) -> None:
+    """Call ``callback`` after any commit that wrote to one of ``tables``."""
+    _listeners.append((frozenset(tables), callback))
+
+
+def on_commit_tables(callback: Callable[[frozenset[str]], None]) -> None:
+    """Call ``callback`` with the names of the tables written after every commit that wrote any."""
+    _table_listeners.append(callback)
+
+
+def _written_tables(session: Session) -> set[str]:
+    return cast(set[str], session.info.setdefault(_WRITTEN_TABLES_KEY, set()))
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_tables(session: Session, _flush_context: UOWTransaction) -> None:
+    written = _written_tables(session)
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        written.update(table.name for table in inspect(instance).mapper.tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_bulk_writes(orm_execute_state: ORMExecuteState) -> None:
+    statement = orm_execute_state.statement
+    if isinstance(statement, UpdateBase) and isinstance(statement.table, TableClause):
+        _written_tables(orm_execute_state.session).add(statement.table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_commit_listeners(session: Session) -> None:
+    written = session.info.pop(_WRITTEN_TABLES_KEY, None)
+    if not written:
+        return
+    for tables, callback in _listeners:
+        if tables & written:
+            try:
+                callback()
+            except Exception:
+                logger.exception("Commit listener %r failed", callback)
+    tables = frozenset(written)
+    for table_callback in _table_listeners:
+        try:
+            table_callback(tables)
+        except Exception:
+            logger.exception("Commit listener %r failed", table_callback)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_writes(session: Session) -> None:
+    session.info.pop(_WRITTEN_TABLES_KEY, None)
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import secrets
+from collections.abc import AsyncIterator
 from typing import Annotated
 
 from fastapi import Depends, Request
 from starlette.datastructures import UploadFile
 
-from app.exceptions import AlreadyAuthenticated, CsrfError, LoginRequired
+from app.exceptions import AlreadyAuthenticated, CsrfError, LoginRequired, RouteBusy
 from app.models.user import User
 from app.utils.formdata import MultiDict, request_form_data
 
@@ -45,6 +46,52 @@ def require_perms(*permission_names: str):
     return Depends(_dependency)
 
 
+async def request_deadline(request: Request) -> AsyncIterator[None]:
+    """Give the request its time budget: ``ROUTE_TIMEOUTS[route name]`` or ``REQUEST_TIMEOUT_SECONDS``."""
+    from app.core.config import get_settings
+    from app.utils.deadline import deadline
+
+    settings = get_settings()
+    name = getattr(request.scope.get("route"), "name", None)
+    with deadline(settings.route_timeouts.get(name or "", settings.request_timeout_seconds)):
+        yield
+
+
+def limit_concurrency(limit: int):
+    """Bulkhead for an expensive route: at most ``limit`` requests at once per worker, the rest get a 503."""
+
+    async def _dependency(request: Request) -> AsyncIterator[None]:
+        from app.core.config import get_settings
+        from app.utils.bulkhead import get_bulkhead
+
+        name = getattr(request.scope.get("route"), "name", None) or request.url.path
+        bulkhead = get_bulkhead(name, limit)
+        if not bulkhead.try_acquire():
+            raise RouteBusy(get_settings().route_busy_retry_after_seconds)
+        try:
+            yield
+        finally:
+            bulkhead.release()
+
+    # Release the slot when the endpoint returns, not after the response is sent.
+    return Depends(_dependency, scope="function")
+
+
+async def require_metrics_access(request: Request, user: OptionalUser) -> None:
+    """Scrapers send ``Authorization: Bearer $METRICS_TOKEN``; signed-in users need ``metrics.view``."""
+    from app.core.config import get_settings
+
+    token = get_settings().metrics_token
+    scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+    if token and scheme.lower() == "bearer" and secrets.compare_digest(credentials.strip(), token):
+        return
+    if user is None:
+        raise LoginRequired()
+    from app.policies import require_all_permissions
+
+    require_all_permissions(user, "metrics.view")
+
+
 def get_csrf_token(request: Request) -> str:
     token = request.session.get("csrf_token")
     if not token:
@@ -53,6 +100,26 @@ def get_csrf_token(request: Request) -> str:
     return token
 
 
+class LazyCsrfToken:
+    """Renders as the session's CSRF token, minting it only when a template outputs it.
+
+    Pages without a form then leave an anonymous visitor's session empty, so
+    they send no ``Set-Cookie`` and can be cached.
+    """
+
+    __slots__ = ("_request",)
+
+    def __init__(self, request: Request) -> None:
+        self._request = request
+
+    def __str__(self) -> str:
+        return get_csrf_token(self._request)
+
+    def __html__(self) -> str:
+        # token_urlsafe output needs no escaping.
+        return str(self)
+
+
 def verify_csrf(request: Request, token: str | UploadFile | None) -> None:
     if token is not None and not isinstance(token, str):
         token = None
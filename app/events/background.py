@@ -3,14 +3,39 @@
 from __future__ import annotations
 
 import logging
+import time
 from collections.abc import Callable
 from contextvars import ContextVar
-from typing import Any
+from enum import IntEnum
+from typing import Any, NamedTuple
+
+from app.metrics import DEFERRED_HANDLER_DURATION, DEFERRED_HANDLER_FAILURES, DEFERRED_HANDLERS_PENDING
+from app.tracing import SpanContext, current_span_context, start_span
 
 logger = logging.getLogger(__name__)
 
 _Handler = Callable[..., None]
-_Queue = list[tuple[_Handler, tuple[Any, ...], dict[str, Any]]]
+
+
+class Priority(IntEnum):
+    """Order in which queued side effects get a worker; lower runs first."""
+
+    LEDGER = 0  # receipts and ledger entries for payments
+    MEMBER = 1  # emails a member is waiting for
+    NOTIFICATION = 2  # admin notifications and welcome mail
+
+
+class DeferredHandler(NamedTuple):
+    handler: _Handler
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    priority: Priority = Priority.MEMBER
+    # The span that was current when the handler was queued (the request's,
+    # or a service span inside it), so the handler's span joins that trace.
+    trace_parent: SpanContext | None = None
+
+
+_Queue = list[DeferredHandler]
 _deferred: ContextVar[_Queue | None] = ContextVar("_deferred_event_handlers", default=None)
 
 
@@ -22,8 +47,18 @@ def _queue() -> _Queue:
     return handlers
 
 
-def defer_handler(handler: _Handler, *args: Any, **kwargs: Any) -> None:
-    _queue().append((handler, args, kwargs))
+def defer_handler(handler: _Handler, *args: Any, priority: Priority = Priority.MEMBER, **kwargs: Any) -> None:
+    _queue().append(DeferredHandler(handler, args, kwargs, priority, current_span_context()))
+
+
+def open_deferred_handlers() -> None:
+    """Start an empty queue in the caller's context.
+
+    Sync routes run in a copy of the request context on a worker thread; a
+    queue created there would be lost, so the middleware opens it up front and
+    the copies share the same list.
+    """
+    _deferred.set([])
 
 
 def take_deferred_handlers() -> _Queue:
@@ -56,22 +91,44 @@ def _log_handler_context(handler: _Handler, kwargs: dict[str, Any]) -> dict[str,
     return context
 
 
-def run_handler_safe(handler: _Handler, *args: Any, **kwargs: Any) -> None:
+def run_handler_safe(handler: _Handler, *args: Any, trace_parent: SpanContext | None = None, **kwargs: Any) -> None:
+    """Run ``handler``, logging and counting failures instead of raising.
+
+    ``trace_parent`` is the span the handler was queued under; without it the
+    handler's span is a child of whatever span is current here.
+    """
+    started = time.perf_counter()
     try:
         from app.db.session import has_current_session
 
-        if has_current_session():
-            handler(*args, **kwargs)
-        else:
-            run_handler_with_session(handler, *args, **kwargs)
+        with start_span(f"handler {handler.__name__}", attributes={"handler": handler.__name__}, parent=trace_parent):
+            if has_current_session():
+                handler(*args, **kwargs)
+            else:
+                run_handler_with_session(handler, *args, **kwargs)
     except Exception:
+        DEFERRED_HANDLER_FAILURES.inc(handler=handler.__name__)
         logger.exception(
             "Deferred event handler failed: %s",
             _log_handler_context(handler, kwargs),
         )
+    finally:
+        DEFERRED_HANDLER_DURATION.observe(time.perf_counter() - started, handler=handler.__name__)
+
+
+def mark_handler_pending() -> None:
+    """Count a handler handed to the side-effect executor; ``run_pending_handler`` uncounts it."""
+    DEFERRED_HANDLERS_PENDING.inc()
+
+
+def run_pending_handler(handler: _Handler, *args: Any, trace_parent: SpanContext | None = None, **kwargs: Any) -> None:
+    try:
+        run_handler_safe(handler, *args, trace_parent=trace_parent, **kwargs)
+    finally:
+        DEFERRED_HANDLERS_PENDING.dec()
 
 
 def flush_deferred_handlers() -> None:
     """Run queued handlers synchronously (for tests and CLI contexts)."""
-    for handler, args, kwargs in take_deferred_handlers():
-        run_handler_safe(handler, *args, **kwargs)
+    for handler, args, kwargs, _priority, trace_parent in take_deferred_handlers():
+        run_handler_safe(handler, *args, trace_parent=trace_parent, **kwargs)
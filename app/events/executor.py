@@ -0,0 +1,156 @@
+"""Bounded worker pool for deferred event handlers.
+
+Handlers queued during a request run here after the response, on
+``side_effect_workers`` threads of their own, so a burst of slow SMTP sends
+cannot starve the default executor that ``asyncio.to_thread`` and anyio's
+threadpool share. Jobs wait in a priority queue (receipts and ledger entries
+before member emails before admin notifications, first-in-first-out within
+a class) capped at ``side_effect_queue_limit``; a handler that arrives when
+the queue is full is dropped and counted, and a payment's side effects can
+be replayed with ``sea payments replay-side-effects``.
+
+Each handler runs inside ``deadline(timeout)``, so blocking calls that honour
+``app.utils.deadline.capped()`` (SMTP) give up when its budget is spent.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import itertools
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.events.background import DeferredHandler, Priority, mark_handler_pending, run_pending_handler
+from app.metrics import SIDE_EFFECT_QUEUE_WAIT, SIDE_EFFECT_TIMEOUTS, SIDE_EFFECTS_REJECTED
+from app.tracing import SpanContext
+from app.utils.deadline import deadline
+
+logger = logging.getLogger(__name__)
+
+_STOP = len(Priority)
+_Handler = Callable[..., None]
+
+
+@dataclass(order=True, slots=True)
+class _Job:
+    priority: int
+    sequence: int
+    enqueued_at: float = field(compare=False)
+    handler: _Handler | None = field(compare=False, default=None)
+    args: tuple[Any, ...] = field(compare=False, default=())
+    kwargs: dict[str, Any] = field(compare=False, default_factory=dict)
+    context: contextvars.Context | None = field(compare=False, default=None)
+    trace_parent: SpanContext | None = field(compare=False, default=None)
+
+
+class SideEffectExecutor:
+    def __init__(
+        self,
+        *,
+        workers: int,
+        queue_limit: int,
+        timeout_seconds: float,
+        handler_timeouts: Mapping[str, float] | None = None,
+    ) -> None:
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.timeout_seconds = timeout_seconds
+        self.handler_timeouts = dict(handler_timeouts or {})
+        self._queue: queue.PriorityQueue[_Job] = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def timeout_for(self, handler: _Handler) -> float:
+        return self.handler_timeouts.get(handler.__name__, self.timeout_seconds)
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, deferred: DeferredHandler) -> bool:
+        """Queue a handler for a worker; returns False when the queue is full and it was dropped."""
+        handler, args, kwargs, priority, trace_parent = deferred
+        if self._queue.qsize() >= self.queue_limit:
+            SIDE_EFFECTS_REJECTED.inc(handler=handler.__name__)
+            logger.error("Side-effect queue full, dropped deferred handler %s", handler.__name__)
+            return False
+        self._start()
+        mark_handler_pending()
+        self._queue.put(_Job(int(priority), next(self._sequence), time.monotonic(), handler, args, kwargs, contextvars.copy_context(), trace_parent))
+        return True
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Let queued handlers finish, then stop the workers (waiting up to ``timeout`` for each)."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(_Job(_STOP, next(self._sequence), time.monotonic()))
+        for thread in threads:
+            thread.join(timeout)
+
+    def _start(self) -> None:
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f"side-effect-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _work(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job.handler is None or job.context is None:
+                    return
+                SIDE_EFFECT_QUEUE_WAIT.observe(time.monotonic() - job.enqueued_at, priority=Priority(job.priority).name.lower())
+                job.context.run(self._run, job.handler, job.args, job.kwargs, job.trace_parent)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, handler: _Handler, args: tuple[Any, ...], kwargs: dict[str, Any], trace_parent: SpanContext | None) -> None:
+        timeout = self.timeout_for(handler)
+        started = time.monotonic()
+        with deadline(timeout):
+            run_pending_handler(handler, *args, trace_parent=trace_parent, **kwargs)
+        elapsed = time.monotonic() - started
+        if elapsed > timeout:
+            SIDE_EFFECT_TIMEOUTS.inc(handler=handler.__name__)
+            logger.warning("Deferred handler %s took %.1fs, over its %.1fs budget", handler.__name__, elapsed, timeout)
+
+
+_executor: SideEffectExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_side_effect_executor() -> SideEffectExecutor:
+    global _executor
+    if _executor is None:
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        with _executor_lock:
+            if _executor is None:
+                _executor = SideEffectExecutor(
+                    workers=settings.side_effect_workers,
+                    queue_limit=settings.side_effect_queue_limit,
+                    timeout_seconds=settings.side_effect_timeout_seconds,
+                    handler_timeouts=settings.side_effect_handler_timeouts,
+                )
+    return _executor
+
+
+def shutdown_side_effect_executor(timeout: float | None = None) -> None:
+    """Drain and stop the worker pool (lifespan shutdown); the next submit starts a fresh one."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(timeout)
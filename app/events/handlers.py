@@ -14,7 +14,7 @@ from app.events import (
     user_activated,
     user_registered,
 )
-from app.events.background import defer_handler
+from app.events.background import Priority, defer_handler
 from app.events.payloads import (
     CashPaymentSubmittedPayload,
     CreditPurchasedPayload,
@@ -146,7 +146,7 @@ def _record_payment_financial_transactions(payment_id: int, payment_type: str) -
         logger.exception("Failed to record financial transactions for payment_id=%s", payment_id)
 
 
-def _make_deferred_receiver(handler) -> Callable[..., None]:
+def _make_deferred_receiver(handler, priority: Priority) -> Callable[..., None]:
     def receiver(sender: Any, **kwargs: Any) -> None:
         from app.core.config import get_settings
         from app.events.background import run_handler_safe
@@ -154,7 +154,7 @@ def _make_deferred_receiver(handler) -> Callable[..., None]:
         if get_settings().is_testing:
             run_handler_safe(handler, sender, **kwargs)
         else:
-            defer_handler(handler, sender, **kwargs)
+            defer_handler(handler, sender, priority=priority, **kwargs)
 
     receiver.__name__ = f"deferred_{handler.__name__}"
     return receiver
@@ -162,13 +162,13 @@ def _make_deferred_receiver(handler) -> Callable[..., None]:
 
 # Strong references prevent blinker from garbage-collecting weak receiver refs.
 _RECEIVERS: list[tuple[Any, Callable[..., None]]] = [
-    (user_registered, _make_deferred_receiver(_on_user_registered)),
-    (user_activated, _make_deferred_receiver(_on_user_activated)),
-    (payment_completed, _make_deferred_receiver(_on_payment_completed)),
-    (credit_purchased, _make_deferred_receiver(_on_credit_purchased)),
-    (cash_payment_submitted, _make_deferred_receiver(_on_cash_payment_submitted)),
-    (password_reset_requested, _make_deferred_receiver(_on_password_reset_requested)),
-    (membership_activated, _make_deferred_receiver(_on_membership_activated)),
+    (user_registered, _make_deferred_receiver(_on_user_registered, Priority.NOTIFICATION)),
+    (user_activated, _make_deferred_receiver(_on_user_activated, Priority.NOTIFICATION)),
+    (payment_completed, _make_deferred_receiver(_on_payment_completed, Priority.LEDGER)),
+    (credit_purchased, _make_deferred_receiver(_on_credit_purchased, Priority.LEDGER)),
+    (cash_payment_submitted, _make_deferred_receiver(_on_cash_payment_submitted, Priority.MEMBER)),
+    (password_reset_requested, _make_deferred_receiver(_on_password_reset_requested, Priority.MEMBER)),
+    (membership_activated, _make_deferred_receiver(_on_membership_activated, Priority.LEDGER)),
 ]
 
 
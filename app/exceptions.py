@@ -15,3 +15,15 @@ class CsrfError(Exception):
 
 class AlreadyAuthenticated(Exception):
     pass
+
+
+class RouteBusy(Exception):
+    """A concurrency-limited route is at its limit; answered with a 503."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(f"Route busy, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(Exception):
+    """The request (or deferred handler) ran out of its time budget."""
@@ -5,7 +5,7 @@ from pathlib import Path
 from urllib.parse import quote
 
 from fastapi import FastAPI, Request
-from fastapi.responses import RedirectResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.sessions import SessionMiddleware
@@ -13,13 +13,24 @@ from starlette.middleware.sessions import SessionMiddleware
 from app.core.config import get_settings
 from app.db import db, init_db, reset_current_session, set_current_session
 from app.db.session import has_current_session
-from app.exceptions import AlreadyAuthenticated, AuthorizationError, CsrfError, LoginRequired
-from app.routes import api_router
-from app.templating import AnonymousUser, register_route_names, render, setup_template_globals
+from app.exceptions import AlreadyAuthenticated, AuthorizationError, CsrfError, DeadlineExceeded, LoginRequired, RouteBusy
+from app.metrics import REGISTRY as METRICS_REGISTRY
+from app.middleware import CompressionMiddleware, MetricsMiddleware, TracingMiddleware
+from app.routes import api_router, health_router
+from app.templating import AnonymousUser, register_route_names, render, render_anonymous_page, setup_template_globals
+from app.tracing import configure as configure_tracing
+from app.tracing.instrumentation import instrument_repositories, instrument_services
+from app.utils.cache import TTLCache
+from app.utils.rate_limit import check_rate_limit
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 init_db(settings)
+METRICS_REGISTRY.configure(settings.metrics_multiproc_dir)
+configure_tracing(settings.trace_export, sample_ratio=settings.trace_sample_ratio)
+if settings.trace_export:
+    instrument_services()
+    instrument_repositories()
 
 APP_DIR = Path(__file__).resolve().parent
 STATIC_DIR = APP_DIR / "resources" / "static"
@@ -45,14 +56,46 @@ def _configure_app_logging() -> None:
         app_logger.addHandler(handler)
 
 
+async def _refresh_health_probes() -> None:
+    """Keep the cached health report fresh so probe requests never do I/O."""
+    from app.services import health
+
+    while True:
+        try:
+            await asyncio.to_thread(health.refresh_probes)
+        except Exception:
+            logger.exception("Health probe refresh failed")
+        await asyncio.sleep(settings.health_probe_interval_seconds)
+
+
+async def _warm_up_then_refresh_probes(app: FastAPI) -> None:
+    from app.warmup import run_warmup
+
+    await asyncio.to_thread(run_warmup, app)
+    await _refresh_health_probes()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    from app.events.executor import shutdown_side_effect_executor
     from app.events.handlers import connect_handlers
+    from app.warmup import run_warmup
 
     _configure_app_logging()
     register_route_names(list(app.routes))
     connect_handlers()
+    # Warm up in the background so /health/live answers at once; /health/ready
+    # stays down until the worker is warm.
+    background = None
+    if settings.is_testing:
+        run_warmup(app)
+    else:
+        background = asyncio.create_task(_warm_up_then_refresh_probes(app))
     yield
+    if background is not None:
+        background.cancel()
+    # Give queued receipts and ledger entries a chance to finish before exit.
+    await asyncio.to_thread(shutdown_side_effect_executor, settings.side_effect_timeout_seconds)
 
 
 app = FastAPI(lifespan=lifespan, docs_url=None, redoc_url=None)
@@ -63,6 +106,14 @@ app.add_middleware(
     https_only=settings.session_secure_cookie,
     same_site=settings.session_same_site,
 )
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.compression_gzip_level,
+    brotli_quality=settings.compression_brotli_quality,
+)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
 
 # Built bundle first (more specific path), then raw files (images, etc.)
 if BUILT_ASSETS_DIR.is_dir():
@@ -71,21 +122,25 @@ if STATIC_DIR.is_dir():
     app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
 setup_template_globals()
+app.include_router(health_router)
 app.include_router(api_router)
 
 
 @app.middleware("http")
 async def run_deferred_event_handlers(request: Request, call_next):
-    from app.events.background import run_handler_safe, take_deferred_handlers
+    from app.events.background import open_deferred_handlers, run_handler_safe, take_deferred_handlers
+    from app.events.executor import get_side_effect_executor
 
+    open_deferred_handlers()
     response = await call_next(request)
     deferred = take_deferred_handlers()
     if settings.is_testing:
-        for handler, args, kwargs in deferred:
-            run_handler_safe(handler, *args, **kwargs)
-    else:
-        for handler, args, kwargs in deferred:
-            asyncio.create_task(asyncio.to_thread(run_handler_safe, handler, *args, **kwargs))
+        for handler, args, kwargs, _priority, trace_parent in deferred:
+            run_handler_safe(handler, *args, trace_parent=trace_parent, **kwargs)
+    elif deferred:
+        executor = get_side_effect_executor()
+        for item in deferred:
+            executor.submit(item)
     return response
 
 
@@ -114,14 +169,14 @@ def _error_page_db_session():
 
     Exception handlers run outside FastAPI's dependency injection lifecycle,
     so they have no session when a route never matched (e.g. 404 on /favicon.ico)
-    or after get_db() has already been torn down.  Open a fresh read session
-    only when one is not already present; always close it afterwards.
+    or after get_db() has already been torn down.  Bind a lazy read session
+    only when one is not already present; it is closed afterwards if used.
     """
     if has_current_session():
         yield
         return
 
-    session = db.create_session()
+    session = db.lazy_session(read_only=True)
     token = set_current_session(session)
     try:
         yield
@@ -157,8 +212,37 @@ async def csrf_error_handler(request: Request, _exc: CsrfError):
         return render(request, "errors/csrf.html", status_code=403, user=user)
 
 
+_not_found_page: TTLCache[bytes] = TTLCache(ttl_seconds=settings.not_found_page_ttl_seconds)
+
+
+def _render_anonymous_not_found() -> bytes:
+    with _error_page_db_session():
+        return render_anonymous_page("errors/404.html").encode()
+
+
+@app.exception_handler(RouteBusy)
+async def route_busy_handler(_request: Request, exc: RouteBusy):
+    # Deliberately cheap: no template or session, the route is already overloaded.
+    return PlainTextResponse("This page is busy, please try again shortly.", status_code=503, headers={"Retry-After": str(exc.retry_after)})
+
+
+@app.exception_handler(DeadlineExceeded)
+async def deadline_exceeded_handler(request: Request, _exc: DeadlineExceeded):
+    logger.warning("Request ran out of time: %s %s", request.method, request.url.path)
+    with _error_page_db_session():
+        user = _session_user_for_error_page(request)
+        return render(request, "errors/timeout.html", status_code=503, user=user)
+
+
 @app.exception_handler(404)
 async def not_found_handler(request: Request, _exc: StarletteHTTPException):
+    if not request.session.get("user_id"):
+        # Anonymous visitors and scanners: no user to load, so skip the DB and
+        # serve the shared page, throttling clients that keep missing.
+        window = settings.not_found_rate_window_seconds
+        if check_rate_limit(request, "not_found", max_attempts=settings.not_found_rate_limit, window_seconds=window):
+            return PlainTextResponse("Too many requests", status_code=429, headers={"Retry-After": str(window)})
+        return HTMLResponse(_not_found_page.get_or_set("page", _render_anonymous_not_found), status_code=404)
     with _error_page_db_session():
         user = _session_user_for_error_page(request)
         return render(request, "errors/404.html", status_code=404, user=user)
@@ -0,0 +1,164 @@
+"""Application metrics, exposed at ``/metrics`` in the Prometheus text format."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from app.metrics.registry import REGISTRY, Counter, Gauge, Histogram, Registry
+
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+JOB_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "sea_http_request_duration_seconds",
+    "HTTP request latency by route name.",
+    ["route", "method", "status"],
+)
+DB_STATEMENT_DURATION = Histogram(
+    "sea_db_statement_duration_seconds",
+    "Time spent executing SQL statements, by statement type.",
+    ["operation"],
+    buckets=DB_BUCKETS,
+)
+DB_CONNECTION_HOLD = Histogram(
+    "sea_db_connection_hold_seconds",
+    "Time a pooled connection stays checked out, by the route that held it.",
+    ["route"],
+)
+BULKHEAD_IN_FLIGHT = Gauge(
+    "sea_bulkhead_in_flight",
+    "Requests running in a concurrency-limited route.",
+    ["route"],
+)
+BULKHEAD_LIMIT = Gauge(
+    "sea_bulkhead_limit",
+    "Concurrent requests allowed per worker in a concurrency-limited route.",
+    ["route"],
+)
+BULKHEAD_REJECTIONS = Counter(
+    "sea_bulkhead_rejections_total",
+    "Requests turned away with a 503 because their route was at its concurrency limit.",
+    ["route"],
+)
+CACHE_HITS = Counter(
+    "sea_cache_hits_total",
+    "Service reads answered from the cache, by cached function and tier.",
+    ["function", "tier"],
+)
+CACHE_MISSES = Counter(
+    "sea_cache_misses_total",
+    "Service reads that had to run the cached function.",
+    ["function"],
+)
+CACHE_EVICTIONS = Counter(
+    "sea_cache_evictions_total",
+    "Cached values dropped because their function's cache was full.",
+    ["function"],
+)
+DEFERRED_HANDLERS_PENDING = Gauge(
+    "sea_deferred_handlers_pending",
+    "Deferred event handlers scheduled after a response and not yet finished.",
+)
+DEFERRED_HANDLER_DURATION = Histogram(
+    "sea_deferred_handler_duration_seconds",
+    "Deferred event handler run time.",
+    ["handler"],
+)
+DEFERRED_HANDLER_FAILURES = Counter(
+    "sea_deferred_handler_failures_total",
+    "Deferred event handlers that raised.",
+    ["handler"],
+)
+SIDE_EFFECT_QUEUE_WAIT = Histogram(
+    "sea_side_effect_queue_wait_seconds",
+    "Time a deferred handler waited for a side-effect worker, by priority class.",
+    ["priority"],
+)
+SIDE_EFFECTS_REJECTED = Counter(
+    "sea_side_effects_rejected_total",
+    "Deferred handlers dropped because the side-effect queue was full.",
+    ["handler"],
+)
+SIDE_EFFECT_TIMEOUTS = Counter(
+    "sea_side_effect_timeouts_total",
+    "Deferred handlers that ran past their time budget.",
+    ["handler"],
+)
+SMTP_SEND_DURATION = Histogram(
+    "sea_smtp_send_duration_seconds",
+    "Time to connect to the SMTP server and send one message.",
+    ["outcome"],
+)
+SUMUP_REQUEST_DURATION = Histogram(
+    "sea_sumup_request_duration_seconds",
+    "SumUp API call latency.",
+    ["operation", "outcome"],
+)
+SUMUP_ERRORS = Counter(
+    "sea_sumup_errors_total",
+    "SumUp API calls that failed.",
+    ["operation"],
+)
+SCHEDULER_JOB_DURATION = Histogram(
+    "sea_scheduler_job_duration_seconds",
+    "Scheduled task run time.",
+    ["job", "outcome"],
+    buckets=JOB_BUCKETS,
+)
+
+
+@contextmanager
+def observe_duration(histogram: Histogram, **labels: str) -> Iterator[dict[str, str]]:
+    """Time the block into ``histogram``.
+
+    Yields a dict of extra labels the block may fill in; ``outcome`` defaults to
+    ``ok`` or ``error`` depending on whether the block raised, when the
+    histogram has that label.
+    """
+    extra: dict[str, str] = {}
+    started = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield extra
+    except BaseException:
+        outcome = "error"
+        raise
+    finally:
+        if "outcome" in histogram.labelnames:
+            extra.setdefault("outcome", outcome)
+        histogram.observe(time.perf_counter() - started, **labels, **extra)
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
+
+
+__all__ = [
+    "BULKHEAD_IN_FLIGHT",
+    "BULKHEAD_LIMIT",
+    "BULKHEAD_REJECTIONS",
+    "CACHE_EVICTIONS",
+    "CACHE_HITS",
+    "CACHE_MISSES",
+    "DB_STATEMENT_DURATION",
+    "DEFERRED_HANDLERS_PENDING",
+    "DEFERRED_HANDLER_DURATION",
+    "DEFERRED_HANDLER_FAILURES",
+    "HTTP_REQUEST_DURATION",
+    "REGISTRY",
+    "SCHEDULER_JOB_DURATION",
+    "SIDE_EFFECTS_REJECTED",
+    "SIDE_EFFECT_QUEUE_WAIT",
+    "SIDE_EFFECT_TIMEOUTS",
+    "SMTP_SEND_DURATION",
+    "SUMUP_ERRORS",
+    "SUMUP_REQUEST_DURATION",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "Registry",
+    "observe_duration",
+    "render_metrics",
+]
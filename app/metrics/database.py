@@ -0,0 +1,72 @@
+"""SQL statement timings and connection hold times from SQLAlchemy events."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.metrics import DB_CONNECTION_HOLD, DB_STATEMENT_DURATION
+
+_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE"})
+_STARTED_KEY = "metrics_statement_started"
+_CHECKED_OUT_KEY = "metrics_checked_out"
+BACKGROUND = "background"
+
+_connection_owner: ContextVar[Callable[[], str] | None] = ContextVar("db_connection_owner", default=None)
+
+
+@contextmanager
+def connection_owner(label: Callable[[], str]) -> Iterator[None]:
+    """Attribute connections checked in during the block to ``label()``, resolved at check-in."""
+    token = _connection_owner.set(label)
+    try:
+        yield
+    finally:
+        _connection_owner.reset(token)
+
+
+def statement_operation(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword if keyword in _OPERATIONS else "OTHER"
+
+
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+    started = conn.info.get(_STARTED_KEY)
+    if started:
+        DB_STATEMENT_DURATION.observe(time.perf_counter() - started.pop(), operation=statement_operation(statement))
+
+
+def _handle_error(exception_context) -> None:
+    connection = exception_context.connection
+    if connection is not None and connection.info.get(_STARTED_KEY):
+        started = connection.info[_STARTED_KEY].pop()
+        DB_STATEMENT_DURATION.observe(time.perf_counter() - started, operation=statement_operation(exception_context.statement or ""))
+
+
+def _checkout(_dbapi_connection, connection_record, _connection_proxy) -> None:
+    connection_record.info[_CHECKED_OUT_KEY] = time.perf_counter()
+
+
+def _checkin(_dbapi_connection, connection_record) -> None:
+    started = connection_record.info.pop(_CHECKED_OUT_KEY, None)
+    if started is None:
+        return
+    owner = _connection_owner.get()
+    DB_CONNECTION_HOLD.observe(time.perf_counter() - started, route=owner() if owner else BACKGROUND)
+
+
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    event.listen(engine, "checkout", _checkout)
+    event.listen(engine, "checkin", _checkin)
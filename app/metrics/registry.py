@@ -0,0 +1,304 @@
+"""Counters, gauges and histograms rendered in the Prometheus text format.
+
+Each process keeps its samples in memory. When ``METRICS_MULTIPROC_DIR`` is set,
+every process also snapshots its samples to ``<dir>/<pid>-<start>.json`` from a
+background thread every ``FLUSH_INTERVAL_SECONDS`` (and when it answers a scrape,
+and at exit), and ``/metrics`` merges all the snapshots so any uvicorn worker can
+answer a scrape for the whole server. Recording a sample never touches the disk.
+The process start time in the file name keeps a new worker that reuses a pid
+from overwriting the totals of the exited one. Counters and histograms from
+exited workers keep counting towards the totals; gauges only include live
+processes. Empty the directory before starting the server, as with
+``prometheus_client``'s multiprocess mode.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FLUSH_INTERVAL_SECONDS = 1.0
+
+_LabelValues = tuple[str, ...]
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), *, registry: Registry | None = None) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._registry = registry if registry is not None else REGISTRY
+        self._registry.register(self)
+
+    def _key(self, labels: dict[str, Any]) -> _LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> list[tuple[_LabelValues, Any]]: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: dict[_LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[tuple[_LabelValues, float]]:
+        with self._lock:
+            return list(self._values.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        self._add(amount, labels)
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self._add(-amount, labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def _add(self, amount: float, labels: dict[str, Any]) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, *args: Any, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count in each bucket (non-cumulative, +Inf last), sum]
+        self._values: dict[_LabelValues, list[Any]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def count(self, **labels: Any) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def samples(self) -> list[tuple[_LabelValues, list[Any]]]:
+        with self._lock:
+            return [(key, [list(counts), total]) for key, (counts, total) in self._values.items()]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._multiproc_dir: Path | None = None
+        self._started_ns = time.time_ns()
+        self._flusher: threading.Thread | None = None
+        self._stop_flusher = threading.Event()
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def metrics(self) -> list[_Metric]:
+        return list(self._metrics.values())
+
+    def configure(self, multiproc_dir: str | os.PathLike[str] | None) -> None:
+        """Enable (or, with ``None``, disable) cross-process aggregation."""
+        self.stop()
+        self._multiproc_dir = Path(multiproc_dir) if multiproc_dir else None
+        if self._multiproc_dir is not None:
+            self._multiproc_dir.mkdir(parents=True, exist_ok=True)
+            self._start_flusher()
+
+    def stop(self) -> None:
+        """Stop the background snapshot thread (it is restarted by ``configure``)."""
+        flusher = self._flusher
+        self._flusher = None
+        if flusher is not None:
+            self._stop_flusher.set()
+            flusher.join(timeout=FLUSH_INTERVAL_SECONDS)
+
+    def _start_flusher(self) -> None:
+        stop = self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, args=(stop,), name="metrics-snapshot", daemon=True)
+        self._flusher.start()
+
+    def _flush_periodically(self, stop: threading.Event) -> None:
+        while not stop.wait(FLUSH_INTERVAL_SECONDS):
+            try:
+                self.flush()
+            except OSError:
+                pass
+
+    def _after_fork(self) -> None:
+        # A forked worker is a new process: new snapshot file, and the parent's
+        # thread does not exist in the child.
+        self._lock = threading.Lock()
+        self._started_ns = time.time_ns()
+        self._flusher = None
+        if self._multiproc_dir is not None:
+            self._start_flusher()
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.clear()
+
+    def _snapshot(self) -> dict[str, Any]:
+        return {metric.name: [[list(key), value] for key, value in metric.samples()] for metric in self._metrics.values()}
+
+    def flush(self) -> None:
+        """Write this process's samples to the multiprocess directory."""
+        directory = self._multiproc_dir
+        if directory is None:
+            return
+        pid = os.getpid()
+        with self._lock:
+            payload = json.dumps({"pid": pid, "started": self._started_ns, "metrics": self._snapshot()})
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+            with os.fdopen(fd, "w") as handle:
+                handle.write(payload)
+            os.replace(tmp_path, directory / f"{pid}-{self._started_ns}.json")
+
+    def _snapshots(self) -> Iterable[tuple[bool, dict[str, Any]]]:
+        """``(alive, samples)`` for every process; only the newest process with a given pid can be alive."""
+        if self._multiproc_dir is None:
+            yield True, self._snapshot()
+            return
+        self.flush()
+        snapshots: list[tuple[int, int, dict[str, Any]]] = []
+        for path in sorted(self._multiproc_dir.glob("*.json")):
+            try:
+                data = json.loads(path.read_text())
+            except OSError, ValueError:
+                continue
+            snapshots.append((int(data.get("pid", 0)), int(data.get("started", 0)), data.get("metrics", {})))
+        newest: dict[int, int] = {}
+        for pid, started, _metrics in snapshots:
+            newest[pid] = max(newest.get(pid, started), started)
+        for pid, started, metrics in snapshots:
+            yield started == newest[pid] and _pid_alive(pid), metrics
+
+    def collect(self) -> dict[str, dict[_LabelValues, Any]]:
+        """Samples per metric, merged across every process that has written a snapshot."""
+        merged: dict[str, dict[_LabelValues, Any]] = {name: {} for name in self._metrics}
+        for alive, snapshot in self._snapshots():
+            for name, samples in snapshot.items():
+                metric = self._metrics.get(name)
+                if metric is None or (metric.kind == "gauge" and not alive):
+                    continue
+                target = merged[name]
+                for labels, value in samples:
+                    key = tuple(labels)
+                    if isinstance(metric, Histogram):
+                        current = target.setdefault(key, [[0] * (len(metric.buckets) + 1), 0.0])
+                        current[0] = [a + b for a, b in zip(current[0], value[0], strict=False)]
+                        current[1] += value[1]
+                    else:
+                        target[key] = target.get(key, 0.0) + value
+        return merged
+
+    def render(self) -> str:
+        """Every metric in the Prometheus text exposition format (version 0.0.4)."""
+        collected = self.collect()
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for key, value in sorted(collected[metric.name].items()):
+                labels = dict(zip(metric.labelnames, key, strict=True))
+                if isinstance(metric, Histogram):
+                    counts, total = value
+                    cumulative = 0
+                    for bound, count in zip((*metric.buckets, math.inf), counts, strict=True):
+                        cumulative += count
+                        lines.append(f"{metric.name}_bucket{_labels({**labels, 'le': _number(bound)})} {cumulative}")
+                    lines.append(f"{metric.name}_sum{_labels(labels)} {_number(total)}")
+                    lines.append(f"{metric.name}_count{_labels(labels)} {cumulative}")
+                else:
+                    lines.append(f"{metric.name}{_labels(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value))
+
+
+REGISTRY = Registry()
+atexit.register(REGISTRY.flush)
+os.register_at_fork(after_in_child=REGISTRY._after_fork)
@@ -0,0 +1,7 @@
+"""Pure ASGI middleware wired up in ``app.main``."""
+
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.tracing import TracingMiddleware
+
+__all__ = ["CompressionMiddleware", "MetricsMiddleware", "TracingMiddleware"]
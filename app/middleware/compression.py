@@ -0,0 +1,212 @@
+"""Negotiated gzip/brotli response compression.
+
+Rendered pages arrive as a single complete body, so they are compressed in one
+pass once they cross ``minimum_size`` and sent with an exact ``Content-Length``.
+Streaming responses (``more_body=True``) are compressed chunk by chunk with a
+sync flush, so every chunk reaches the client as soon as the app produces it.
+
+Partial content (206 or ``Content-Range``) is never compressed: the range
+applies to the identity body. A strong ``ETag`` on an encoded body is
+weakened, since the encoded bytes differ from the representation it names.
+
+Brotli is offered only when the optional ``brotli`` package is importable;
+gzip always comes from the standard library.
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Any
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli as _brotli
+except ImportError:  # pragma: no cover - depends on the deployment image
+    _brotli = None
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """Encodings this process can produce, most preferred first."""
+    return ("br", "gzip") if _brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """Pick the best supported encoding from an ``Accept-Encoding`` header.
+
+    Honours ``q`` weights (``gzip;q=0`` disables gzip) and the ``*`` wildcard.
+    Returns ``None`` when the client accepts nothing we can produce.
+    """
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        params = params.strip().lower()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best: str | None = None
+    best_weight = 0.0
+    for coding in supported_encodings():
+        weight = weights.get(coding, wildcard)
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    content_type = content_type.lower()
+    return any(content_type.startswith(prefix) for prefix in COMPRESSIBLE_CONTENT_TYPES)
+
+
+class _Compressor:
+    """Incremental compressor that can flush after every chunk."""
+
+    def __init__(self, encoding: str, *, gzip_level: int, brotli_quality: int) -> None:
+        self.encoding = encoding
+        self._brotli: Any = None
+        self._gzip: Any = None
+        if encoding == "br":
+            assert _brotli is not None
+            self._brotli = _brotli.Compressor(quality=brotli_quality)
+        else:
+            self._gzip = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        if self._brotli is not None:
+            head = self._brotli.process(data)
+            tail = self._brotli.finish() if final else self._brotli.flush()
+            return bytes(head) + bytes(tail)
+        mode = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        compressed: bytes = self._gzip.compress(data) + self._gzip.flush(mode)
+        return compressed
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 500,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Holds back ``http.response.start`` until the first body chunk decides the mode."""
+
+    def __init__(self, middleware: CompressionMiddleware, send: Send, encoding: str) -> None:
+        self.middleware = middleware
+        self.downstream = send
+        self.encoding = encoding
+        self.start_message: Message | None = None
+        self.compressor: _Compressor | None = None
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.start_message = message
+            return
+        if message_type != "http.response.body":
+            # ``http.response.pathsend`` and friends carry no body for us to
+            # encode; the held start goes out unchanged ahead of them.
+            if self.start_message is not None:
+                start, self.start_message = self.start_message, None
+                await self.downstream(start)
+            await self.downstream(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            await self._start(start, body, more_body)
+            return
+
+        if self.compressor is None:
+            await self.downstream(message)
+            return
+
+        payload = self.compressor.compress(body, final=not more_body)
+        await self.downstream({"type": "http.response.body", "body": payload, "more_body": more_body})
+
+    async def _start(self, start: Message, body: bytes, more_body: bool) -> None:
+        headers = MutableHeaders(raw=list(start.get("headers", [])))
+        start["headers"] = headers.raw
+        content_type = headers.get("content-type", "")
+        compressible = is_compressible(content_type)
+        if compressible:
+            headers.add_vary_header("Accept-Encoding")
+
+        if not compressible or not self._should_compress(start["status"], headers, body, more_body):
+            await self.downstream(start)
+            await self.downstream({"type": "http.response.body", "body": body, "more_body": more_body})
+            return
+
+        self.compressor = _Compressor(
+            self.encoding,
+            gzip_level=self.middleware.gzip_level,
+            brotli_quality=self.middleware.brotli_quality,
+        )
+        payload = self.compressor.compress(body, final=not more_body)
+        headers["content-encoding"] = self.encoding
+        if "content-length" in headers:
+            del headers["content-length"]
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["etag"] = f"W/{etag}"
+        if not more_body:
+            headers["content-length"] = str(len(payload))
+        await self.downstream(start)
+        await self.downstream({"type": "http.response.body", "body": payload, "more_body": more_body})
+
+    def _should_compress(self, status: int, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        if status < 200 or status in (204, 206, 304):
+            return False
+        if "content-range" in headers:
+            return False
+        if "content-encoding" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return False
+        # Streaming bodies are always compressed: their final size is unknown
+        # and holding chunks back to measure them would defeat the streaming.
+        if more_body:
+            return True
+        return len(body) >= self.middleware.minimum_size
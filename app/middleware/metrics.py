@@ -0,0 +1,54 @@
+"""Request latency histogram labelled by the matched route's name.
+
+The same label is attached to database connections the request checks out
+(``sea_db_connection_hold_seconds``).
+"""
+
+from __future__ import annotations
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics import HTTP_REQUEST_DURATION
+from app.metrics.database import connection_owner
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_label(scope: Scope) -> str:
+    """The route name FastAPI stored in ``scope['route']``, or its path, or ``unmatched``."""
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+    return str(getattr(route, "name", None) or getattr(route, "path", UNMATCHED_ROUTE))
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            with connection_owner(lambda: route_label(scope)):
+                await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                route=route_label(scope),
+                method=scope["method"],
+                status=str(status),
+            )
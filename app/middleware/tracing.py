@@ -0,0 +1,37 @@
+"""A server span per HTTP request, named after the matched route."""
+
+from __future__ import annotations
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middleware.metrics import route_label
+from app.tracing import is_enabled, parse_traceparent, start_span
+
+
+class TracingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not is_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        parent = parse_traceparent(Headers(scope=scope).get("traceparent"))
+        method = scope["method"]
+        with start_span(method, kind="SERVER", parent=parent, attributes={"http.method": method, "http.target": scope["path"]}) as span:
+
+            async def send_with_status(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.set_error(f"HTTP {message['status']}")
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = route_label(scope)
+                span.name = f"{method} {route}"
+                span.set_attribute("http.route", route)
@@ -2,6 +2,7 @@ from app.enums import PaymentMethod, PaymentType
 
 from .application_settings import Setting
 from .credit import Credit
+from .credit_ledger import CreditLedgerEntry
 from .event import Event
 from .financial_transaction import FinancialTransaction
 from .membership import Membership
@@ -10,6 +11,7 @@ from .payment import Payment
 from .rbac import Permission, Role
 from .shoot import Shoot, ShootLocation, ShootVisitor
 from .user import User
+from .user_search import user_search_tokens
 
 __all__ = [
     "User",
@@ -18,6 +20,7 @@ __all__ = [
     "ShootLocation",
     "ShootVisitor",
     "Credit",
+    "CreditLedgerEntry",
     "News",
     "Event",
     "Payment",
@@ -27,4 +30,5 @@ __all__ = [
     "Role",
     "Permission",
     "FinancialTransaction",
+    "user_search_tokens",
 ]
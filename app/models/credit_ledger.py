@@ -0,0 +1,62 @@
+"""Append-only credit ledger.
+
+``Membership.initial_credits`` and ``purchased_credits`` are the materialized
+balances; every change to them is recorded here as a signed delta per bucket,
+so the balances can always be rebuilt with ``SUM(delta)``. Rows are never
+updated or deleted.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Connection, DateTime, ForeignKey, Index, Integer, String, event, insert
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db import Model
+from app.models.membership import Membership
+from app.utils.datetime_utils import utc_now
+
+BUCKET_COLUMNS = {"initial": "initial_credits", "purchased": "purchased_credits"}
+
+
+class CreditLedgerEntry(Model):
+    __tablename__ = "credit_ledger"
+    __table_args__ = (Index("ix_credit_ledger_membership_id_id", "membership_id", "id"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    membership_id: Mapped[int] = mapped_column(Integer, ForeignKey("memberships.id", ondelete="CASCADE"), nullable=False)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    bucket: Mapped[str] = mapped_column(String(10), nullable=False)
+    delta: Mapped[int] = mapped_column(Integer, nullable=False)
+    balance_after: Mapped[int] = mapped_column(Integer, nullable=False)
+    reason: Mapped[str] = mapped_column(String(32), nullable=False)
+    shoot_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("shoots.id", ondelete="SET NULL"), nullable=True)
+    payment_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("payments.id", ondelete="SET NULL"), nullable=True)
+    actor_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<CreditLedgerEntry membership_id={self.membership_id} {self.bucket} {self.delta:+d} ({self.reason})>"
+
+
+@event.listens_for(Membership, "after_insert")
+def _record_opening_balance(_mapper, connection: Connection, target: Membership) -> None:
+    """Every new membership starts its ledger with its opening balances."""
+    rows = []
+    for bucket, column in BUCKET_COLUMNS.items():
+        balance = getattr(target, column) or 0
+        if balance:
+            rows.append(
+                {
+                    "membership_id": target.id,
+                    "user_id": target.user_id,
+                    "bucket": bucket,
+                    "delta": balance,
+                    "balance_after": balance,
+                    "reason": "opening_balance",
+                    "created_at": utc_now(),
+                }
+            )
+    if rows:
+        connection.execute(insert(CreditLedgerEntry), rows)
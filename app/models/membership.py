@@ -29,7 +29,11 @@ class Membership(Model):
     user: Mapped[User] = relationship("User", back_populates="membership")
 
     def is_active(self) -> bool:
-        return self.status == "active" and self.expiry_date >= date.today()
+        return self.status_is_active(self.status, self.expiry_date)
+
+    @staticmethod
+    def status_is_active(status: str | None, expiry_date: date) -> bool:
+        return status == "active" and expiry_date >= date.today()
 
     def credits_remaining(self) -> int:
         """Return total credits available (initial + purchased)."""
@@ -37,32 +41,19 @@ class Membership(Model):
         purchased = self.purchased_credits if self.purchased_credits is not None else 0
         return initial + purchased
 
-    def use_credit(self, allow_negative: bool = False) -> bool:
-        """Use a credit from the membership.
-
-        Uses initial credits first, then purchased credits.
-
-        Args:
-            allow_negative: If True, allows credits to go negative (e.g., for admin bookings)
+    @staticmethod
+    def credit_bucket(initial: int, purchased: int, *, active: bool, allow_negative: bool = False) -> str | None:
+        """Name the balance column a spent credit comes out of.
 
-        Returns:
-            True if credit was used, False if no credits available and negative not allowed
+        Initial credits go first, then purchased ones; an active membership may
+        go negative on its initial credits when ``allow_negative`` is set.
+        Returns ``None`` when no credit can be spent.
         """
-        initial = self.initial_credits if self.initial_credits is not None else 0
-        purchased = self.purchased_credits if self.purchased_credits is not None else 0
-
-        total_credits = initial + purchased
-
-        if total_credits > 0:
-            if initial > 0:
-                self.initial_credits = initial - 1
-            else:
-                self.purchased_credits = purchased - 1
-            return True
-        elif allow_negative and self.is_active():
-            self.initial_credits = initial - 1
-            return True
-        return False
+        if initial + purchased > 0:
+            return "initial_credits" if initial > 0 else "purchased_credits"
+        if allow_negative and active:
+            return "initial_credits"
+        return None
 
     def add_credits(self, amount: int) -> None:
         """Add purchased credits to the membership."""
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Integer, String, Text, event, inspect
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db import Model
+from app.utils.content import content_hash, render_article_html
 from app.utils.datetime_utils import utc_now
 
 
@@ -15,6 +16,9 @@ class News(Model):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    # Rendered from ``content`` on every flush that changes it.
+    content_html: Mapped[str | None] = mapped_column(Text)
+    content_hash: Mapped[str | None] = mapped_column(String(64))
     summary: Mapped[str | None] = mapped_column(String(500))
     published: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
     published_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
@@ -25,5 +29,20 @@ class News(Model):
         self.published = True
         self.published_at = utc_now()
 
+    def render_content(self) -> None:
+        self.content_html = render_article_html(self.content)
+        self.content_hash = content_hash(self.content_html)
+
     def __repr__(self) -> str:
         return f"<News {self.title}>"
+
+
+@event.listens_for(News, "before_insert")
+def _render_new_content(_mapper, _connection, target: News) -> None:
+    target.render_content()
+
+
+@event.listens_for(News, "before_update")
+def _render_changed_content(_mapper, _connection, target: News) -> None:
+    if inspect(target).attrs.content.history.has_changes():
+        target.render_content()
@@ -87,6 +87,7 @@ PERMISSIONS: dict[str, str] = {
     "finance.update": "Edit financial transactions",
     "finance.delete": "Delete financial transactions",
     "finance.report": "View financial statements and reports",
+    "metrics.view": "Read the /metrics endpoint",
 }
 
 ROLE_DEFINITIONS: dict[str, dict[str, list[str] | str]] = {
@@ -0,0 +1,62 @@
+"""Search-token index for members, kept in step with ``users`` by mapper events.
+
+Leading-wildcard ``ILIKE '%term%'`` cannot use an index; prefix matches on
+``user_search_tokens.token`` can, on MySQL and SQLite alike. Rows are rewritten
+whenever a user's name, email or phone changes. Core bulk inserts bypass the
+ORM, so anything that writes ``users`` that way must call
+``rebuild_user_search_tokens`` afterwards.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, Connection, ForeignKey, Index, Integer, String, Table, delete, event, insert, inspect, select
+
+from app.db.session import Base
+from app.models.user import User
+from app.utils.search import MAX_TOKEN_LENGTH, user_tokens
+
+user_search_tokens = Table(
+    "user_search_tokens",
+    Base.metadata,
+    Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    # SQLite's LIKE is case-insensitive and only uses an index on a NOCASE
+    # column; MySQL's default collation already lets ``token LIKE 'x%'`` seek.
+    Column("token", String(MAX_TOKEN_LENGTH).with_variant(String(MAX_TOKEN_LENGTH, collation="NOCASE"), "sqlite"), primary_key=True),
+    Index("ix_user_search_tokens_token_user_id", "token", "user_id"),
+)
+
+_INDEXED_ATTRIBUTES = ("name", "email", "phone")
+
+
+def write_user_search_tokens(connection: Connection, user_id: int, name: str | None, email: str | None, phone: str | None) -> None:
+    connection.execute(delete(user_search_tokens).where(user_search_tokens.c.user_id == user_id))
+    rows = [{"user_id": user_id, "token": token} for token in sorted(user_tokens(name, email, phone))]
+    if rows:
+        connection.execute(insert(user_search_tokens), rows)
+
+
+def rebuild_user_search_tokens(connection: Connection) -> int:
+    """Regenerate every member's tokens; returns the number of users indexed."""
+    users = connection.execute(select(User.id, User.name, User.email, User.phone)).all()
+    connection.execute(delete(user_search_tokens))
+    rows = [{"user_id": user.id, "token": token} for user in users for token in sorted(user_tokens(user.name, user.email, user.phone))]
+    if rows:
+        connection.execute(insert(user_search_tokens), rows)
+    return len(users)
+
+
+@event.listens_for(User, "after_insert")
+def _index_new_user(_mapper, connection: Connection, target: User) -> None:
+    write_user_search_tokens(connection, target.id, target.name, target.email, target.phone)
+
+
+@event.listens_for(User, "after_update")
+def _reindex_updated_user(_mapper, connection: Connection, target: User) -> None:
+    state = inspect(target)
+    if any(state.attrs[attribute].history.has_changes() for attribute in _INDEXED_ATTRIBUTES):
+        write_user_search_tokens(connection, target.id, target.name, target.email, target.phone)
+
+
+@event.listens_for(User, "before_delete")
+def _drop_user_tokens(_mapper, connection: Connection, target: User) -> None:
+    connection.execute(delete(user_search_tokens).where(user_search_tokens.c.user_id == target.id))
@@ -1,5 +1,7 @@
 from .base import BaseRepository
+from .credit_ledger_repository import CreditLedgerRepository
 from .credit_repository import CreditRepository
+from .dashboard_repository import DashboardRepository
 from .event_repository import EventRepository
 from .financial_transaction_repository import FinancialTransactionRepository
 from .membership_repository import MembershipRepository
@@ -17,6 +19,8 @@ __all__ = [
     "MembershipRepository",
     "PaymentRepository",
     "CreditRepository",
+    "CreditLedgerRepository",
+    "DashboardRepository",
     "EventRepository",
     "ShootRepository",
     "ShootVisitorRepository",
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from collections.abc import Generator
 from contextlib import contextmanager
+from typing import Any
 
 from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
 
+from app.core.config import get_settings
 from app.db import db
 
 
@@ -38,6 +41,48 @@ class BaseRepository:
     def ping() -> None:
         db.session.execute(text("SELECT 1"))
 
+    @staticmethod
+    def ping_isolated() -> None:
+        """``SELECT 1`` on a session of its own, for probes running outside a request."""
+        with db.create_session() as session:
+            session.execute(text("SELECT 1"))
+
+    @staticmethod
+    def warm_pool(connections: int) -> int:
+        """Open up to ``connections`` pooled connections at once and return them to the pool."""
+        if db.engine is None:
+            db.init()
+        engine = db.engine
+        assert engine is not None
+        if isinstance(engine.pool, QueuePool):
+            connections = min(connections, engine.pool.size())
+        opened = []
+        try:
+            for _ in range(connections):
+                opened.append(engine.connect())
+            for connection in opened:
+                connection.execute(text("SELECT 1"))
+        finally:
+            for connection in opened:
+                connection.close()
+        return len(opened)
+
+    @staticmethod
+    def pool_status() -> dict[str, Any]:
+        """Connection-pool occupancy; ``saturation`` is None for pools without a fixed limit."""
+        pool = db.engine.pool if db.engine is not None else None
+        if not isinstance(pool, QueuePool):
+            return {"saturation": None}
+        max_overflow = get_settings().database_max_overflow
+        capacity = pool.size() + max_overflow if max_overflow >= 0 else None
+        checked_out = pool.checkedout()
+        return {
+            "size": pool.size(),
+            "checked_out": checked_out,
+            "overflow": max(pool.overflow(), 0),
+            "saturation": round(checked_out / capacity, 3) if capacity else None,
+        }
+
     @staticmethod
     def drop_all() -> None:
         db.drop_all()
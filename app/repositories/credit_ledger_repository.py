@@ -0,0 +1,53 @@
+"""Repository for the append-only credit ledger."""
+
+from __future__ import annotations
+
+from sqlalchemy import func, insert, select, update
+
+from app.db import db
+from app.models import CreditLedgerEntry, Membership
+from app.repositories.base import BaseRepository
+
+BALANCE_COLUMNS = ("initial_credits", "purchased_credits")
+
+
+class CreditLedgerRepository(BaseRepository):
+    @staticmethod
+    def lock_balances(membership: Membership) -> None:
+        """Re-read ``membership``'s balances under a row lock.
+
+        Held until commit, so a concurrent writer waits instead of working
+        from a stale balance. SQLite ignores ``FOR UPDATE``; its database-level
+        write lock gives the same serialisation. Pending changes are flushed
+        first so the refresh cannot discard them.
+        """
+        db.session.flush()
+        db.session.refresh(membership, attribute_names=list(BALANCE_COLUMNS), with_for_update=True)
+
+    @staticmethod
+    def append(rows: list[dict]) -> None:
+        if rows:
+            db.session.execute(insert(CreditLedgerEntry).execution_options(render_nulls=True), rows)
+
+    @staticmethod
+    def get_for_membership(membership_id: int) -> list[CreditLedgerEntry]:
+        stmt = select(CreditLedgerEntry).where(CreditLedgerEntry.membership_id == membership_id).order_by(CreditLedgerEntry.id)
+        return list(db.session.scalars(stmt).all())
+
+    @staticmethod
+    def totals_by_membership() -> dict[tuple[int, str], int]:
+        stmt = select(CreditLedgerEntry.membership_id, CreditLedgerEntry.bucket, func.sum(CreditLedgerEntry.delta)).group_by(
+            CreditLedgerEntry.membership_id, CreditLedgerEntry.bucket
+        )
+        return {(membership_id, bucket): int(total or 0) for membership_id, bucket, total in db.session.execute(stmt)}
+
+    @staticmethod
+    def get_balances() -> list:
+        stmt = select(Membership.id, Membership.user_id, Membership.initial_credits, Membership.purchased_credits).order_by(Membership.id)
+        return list(db.session.execute(stmt).all())
+
+    @staticmethod
+    def set_balances(membership_id: int, *, initial_credits: int, purchased_credits: int) -> None:
+        db.session.execute(
+            update(Membership).where(Membership.id == membership_id).values(initial_credits=initial_credits, purchased_credits=purchased_credits)
+        )
@@ -0,0 +1,54 @@
+"""Read-only queries behind the admin dashboard.
+
+Results are plain rows rather than ORM instances so the service can cache them
+across requests.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Row, func, select
+
+from app.db import db
+from app.enums import PaymentMethod
+from app.models import Membership, Payment, User
+from app.repositories.base import BaseRepository
+
+
+class DashboardRepository(BaseRepository):
+    @staticmethod
+    def get_counters() -> Row:
+        """Every dashboard counter as scalar subqueries of a single SELECT."""
+
+        def _count(model, *criteria):
+            return select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+
+        stmt = select(
+            _count(User).label("total_members"),
+            _count(User, User.is_active.is_(False)).label("count_pending_users"),
+            _count(Membership, Membership.status == "active").label("active_memberships"),
+            _count(Payment, Payment.payment_method == PaymentMethod.CASH, Payment.status == "pending").label("pending_cash_payments"),
+        )
+        return db.session.execute(stmt).one()
+
+    @staticmethod
+    def get_recent_members(limit: int = 5) -> list[Row]:
+        stmt = select(User.id, User.name, User.is_active, User.created_at).order_by(User.created_at.desc()).limit(limit)
+        return list(db.session.execute(stmt).all())
+
+    @staticmethod
+    def get_pending_cash_payments(limit: int = 5) -> list[Row]:
+        stmt = (
+            select(
+                Payment.id,
+                Payment.payment_type,
+                Payment.amount_cents,
+                Payment.created_at,
+                Payment.user_id,
+                User.name.label("user_name"),
+            )
+            .outerjoin(User, User.id == Payment.user_id)
+            .where(Payment.payment_method == PaymentMethod.CASH, Payment.status == "pending")
+            .order_by(Payment.created_at.desc())
+            .limit(limit)
+        )
+        return list(db.session.execute(stmt).all())
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, select
+from sqlalchemy.orm import load_only
 
-from app.db import db
+from app.db import Pagination, db, paginate
 from app.models import Event
 from app.repositories.base import BaseRepository
 from app.utils.datetime_utils import utc_now
 
+EXCERPT_LENGTH = 200
+
 
 class EventRepository(BaseRepository):
     @staticmethod
@@ -16,14 +19,24 @@ class EventRepository(BaseRepository):
         return db.session.get(Event, event_id)
 
     @staticmethod
-    def get_all() -> list[Event]:
-        stmt = select(Event).order_by(Event.start_date.desc())
-        return list(db.session.scalars(stmt).unique().all())
+    def get_all_paginated(page: int = 1, per_page: int = 20) -> Pagination:
+        """Events for the admin list, without their ``description`` (reading it raises)."""
+        stmt = (
+            select(Event)
+            .options(load_only(Event.id, Event.title, Event.start_date, Event.location, Event.published, raiseload=True))
+            .order_by(Event.start_date.desc(), Event.id.desc())
+        )
+        return paginate(db.session, stmt, page=page, per_page=per_page)
 
     @staticmethod
-    def get_upcoming_published() -> list[Event]:
-        stmt = select(Event).where(Event.published.is_(True), Event.start_date >= utc_now()).order_by(Event.start_date)
-        return list(db.session.scalars(stmt).unique().all())
+    def get_upcoming_published() -> list[Row]:
+        """Rows of ``id``, ``title``, ``excerpt`` (start of the description), ``location`` and ``start_date``."""
+        stmt = (
+            select(Event.id, Event.title, func.substr(Event.description, 1, EXCERPT_LENGTH).label("excerpt"), Event.location, Event.start_date)
+            .where(Event.published.is_(True), Event.start_date >= utc_now())
+            .order_by(Event.start_date)
+        )
+        return list(db.session.execute(stmt).all())
 
     @staticmethod
     def add(event: Event) -> None:
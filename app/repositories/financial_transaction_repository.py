@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import date
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from app.db import Pagination, db, paginate
 from app.models import FinancialTransaction
@@ -56,6 +56,14 @@ class FinancialTransactionRepository(BaseRepository):
     def add(transaction: FinancialTransaction) -> None:
         db.session.add(transaction)
 
+    @staticmethod
+    def insert_many(rows: list[dict]) -> None:
+        """Write rows in a single executemany; column defaults still apply."""
+        if rows:
+            # render_nulls keeps every row on one parameter set; otherwise rows
+            # with and without a ``source`` are split into separate batches.
+            db.session.execute(insert(FinancialTransaction).execution_options(render_nulls=True), rows)
+
     @staticmethod
     def delete(transaction: FinancialTransaction) -> None:
         db.session.delete(transaction)
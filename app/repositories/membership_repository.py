@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import date
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, select, update
 from sqlalchemy.orm import joinedload
 
 from app.db import db
@@ -31,6 +31,35 @@ class MembershipRepository(BaseRepository):
         stmt = select(Membership).options(joinedload(Membership.user)).join(User).where(Membership.status == "active", User.is_active.is_(True))
         return list(db.session.scalars(stmt).unique().all())
 
+    @staticmethod
+    def lock_balances_for_users(user_ids: list[int]) -> list[Row]:
+        """Lock and return credit balances, with the member's name, for ``user_ids``."""
+        if not user_ids:
+            return []
+        stmt = (
+            select(
+                Membership.id,
+                Membership.user_id,
+                Membership.initial_credits,
+                Membership.purchased_credits,
+                Membership.status,
+                Membership.expiry_date,
+                User.name,
+            )
+            .join(User, User.id == Membership.user_id)
+            .where(Membership.user_id.in_(user_ids))
+            .with_for_update(of=Membership)
+        )
+        return list(db.session.execute(stmt).all())
+
+    @staticmethod
+    def adjust_balance(membership_ids: list[int], column: str, delta: int) -> None:
+        """Add ``delta`` to one balance column on every listed membership in one UPDATE."""
+        if not membership_ids:
+            return
+        balance = getattr(Membership, column)
+        db.session.execute(update(Membership).where(Membership.id.in_(membership_ids)).values({balance: balance + delta}))
+
     @staticmethod
     def add(membership: Membership) -> None:
         db.session.add(membership)
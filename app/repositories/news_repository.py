@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, select
+from sqlalchemy.orm import load_only
 
-from app.db import db
+from app.db import Pagination, db, paginate, paginate_rows
 from app.models import News
 from app.repositories.base import BaseRepository
 
+# List pages show a teaser; only news_detail loads the whole article.
+EXCERPT_LENGTH = 200
+
 
 class NewsRepository(BaseRepository):
     @staticmethod
@@ -15,14 +19,34 @@ class NewsRepository(BaseRepository):
         return db.session.get(News, news_id)
 
     @staticmethod
-    def get_all() -> list[News]:
-        stmt = select(News).order_by(News.created_at.desc())
-        return list(db.session.scalars(stmt).unique().all())
+    def get_published_header(news_id: int) -> Row | None:
+        """``id``, ``title``, ``published_at`` and ``content_hash`` of a published article, without its body."""
+        stmt = select(News.id, News.title, News.published_at, News.content_hash).where(News.id == news_id, News.published.is_(True))
+        return db.session.execute(stmt).first()
+
+    @staticmethod
+    def get_content_html(news_id: int) -> str | None:
+        return db.session.scalar(select(News.content_html).where(News.id == news_id))
+
+    @staticmethod
+    def get_all_paginated(page: int = 1, per_page: int = 20) -> Pagination:
+        """Articles for the admin list, without their ``content`` (reading it raises)."""
+        stmt = (
+            select(News)
+            .options(load_only(News.id, News.title, News.summary, News.published, News.published_at, raiseload=True))
+            .order_by(News.created_at.desc(), News.id.desc())
+        )
+        return paginate(db.session, stmt, page=page, per_page=per_page)
 
     @staticmethod
-    def get_published() -> list[News]:
-        stmt = select(News).where(News.published.is_(True)).order_by(News.published_at.desc())
-        return list(db.session.scalars(stmt).unique().all())
+    def get_published_paginated(page: int = 1, per_page: int = 10) -> Pagination:
+        """Rows of ``id``, ``title``, ``summary``, ``excerpt`` (start of the content) and ``published_at``, newest first."""
+        stmt = (
+            select(News.id, News.title, News.summary, func.substr(News.content, 1, EXCERPT_LENGTH).label("excerpt"), News.published_at)
+            .where(News.published.is_(True))
+            .order_by(News.published_at.desc(), News.id.desc())
+        )
+        return paginate_rows(db.session, stmt, page=page, per_page=per_page)
 
     @staticmethod
     def add(news: News) -> None:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import joinedload
 
 from app.db import db, paginate
@@ -37,18 +37,6 @@ class PaymentRepository(BaseRepository):
         stmt = select(Payment).where(Payment.payment_method == PaymentMethod.CASH, Payment.status == "pending").order_by(Payment.created_at.desc())
         return list(db.session.scalars(stmt).unique().all())
 
-    @staticmethod
-    def count_pending_cash() -> int:
-        stmt = (
-            select(func.count())
-            .select_from(Payment)
-            .where(
-                Payment.payment_method == PaymentMethod.CASH,
-                Payment.status == "pending",
-            )
-        )
-        return db.session.scalar(stmt) or 0
-
     @staticmethod
     def get_pending_cash_limited(limit: int = 5) -> list[Payment]:
         stmt = select(Payment).where(Payment.payment_method == PaymentMethod.CASH, Payment.status == "pending").order_by(Payment.created_at.desc()).limit(limit)
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, select
 
 from app.db import db
 from app.models import Permission, Role
+from app.models.rbac import role_permissions
 from app.repositories.base import BaseRepository
 
 
@@ -32,6 +33,17 @@ class RBACRepository(BaseRepository):
         stmt = select(Role).order_by(Role.name)
         return list(db.session.scalars(stmt).unique().all())
 
+    @staticmethod
+    def list_role_summaries() -> list[Row]:
+        """Each role's id, name, description and number of permissions, by name."""
+        stmt = (
+            select(Role.id, Role.name, Role.description, func.count(role_permissions.c.permission_id).label("permission_count"))
+            .outerjoin(role_permissions, role_permissions.c.role_id == Role.id)
+            .group_by(Role.id, Role.name, Role.description)
+            .order_by(Role.name)
+        )
+        return list(db.session.execute(stmt).all())
+
     @staticmethod
     def role_name_exists(name: str, exclude_id: int | None = None) -> bool:
         stmt = select(Role).where(Role.name == name)
@@ -52,6 +64,11 @@ class RBACRepository(BaseRepository):
         stmt = select(Permission).order_by(Permission.name)
         return list(db.session.scalars(stmt).unique().all())
 
+    @staticmethod
+    def list_permission_rows() -> list[Row]:
+        stmt = select(Permission.id, Permission.name, Permission.description).order_by(Permission.name)
+        return list(db.session.execute(stmt).all())
+
     @staticmethod
     def get_permissions_by_ids(ids: Iterable[int]) -> list[Permission]:
         if not ids:
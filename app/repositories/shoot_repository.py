@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from datetime import date
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import lazyload
 
 from app.db import Pagination, db, paginate
 from app.models import Shoot
+from app.models.shoot import user_shoots
 from app.repositories.base import BaseRepository
 
 
@@ -36,6 +38,35 @@ class ShootRepository(BaseRepository):
         stmt = select(Shoot).order_by(Shoot.date.desc())
         return paginate(db.session, stmt, page=page, per_page=per_page)
 
+    @staticmethod
+    def count_attended_by_user(user_id: int) -> int:
+        stmt = select(func.count()).select_from(user_shoots).where(user_shoots.c.user_id == user_id)
+        return db.session.scalar(stmt) or 0
+
+    @staticmethod
+    def get_attended_by_user_paginated(user_id: int, page: int = 1, per_page: int = 20) -> Pagination:
+        stmt = (
+            select(Shoot)
+            .options(lazyload(Shoot.visitors))
+            .join(user_shoots, user_shoots.c.shoot_id == Shoot.id)
+            .where(user_shoots.c.user_id == user_id)
+            .order_by(Shoot.date.desc(), Shoot.id.desc())
+        )
+        return paginate(db.session, stmt, page=page, per_page=per_page)
+
+    @staticmethod
+    def add_attendees(shoot: Shoot, user_ids: list[int]) -> None:
+        """Insert attendance rows in one statement and reload ``shoot.users`` lazily."""
+        if user_ids:
+            db.session.execute(insert(user_shoots), [{"shoot_id": shoot.id, "user_id": user_id} for user_id in user_ids])
+            db.session.expire(shoot, ["users"])
+
+    @staticmethod
+    def remove_attendees(shoot: Shoot, user_ids: list[int]) -> None:
+        if user_ids:
+            db.session.execute(delete(user_shoots).where(user_shoots.c.shoot_id == shoot.id, user_shoots.c.user_id.in_(user_ids)))
+            db.session.expire(shoot, ["users"])
+
     @staticmethod
     def add(shoot: Shoot) -> None:
         db.session.add(shoot)
@@ -2,12 +2,45 @@
 
 from __future__ import annotations
 
-from sqlalchemy import func, or_, select
+from typing import Any
+
+from sqlalchemy import ColumnElement, Row, Select, case, false, func, select
 from sqlalchemy.orm import joinedload
 
 from app.db import Pagination, db, paginate
-from app.models import Permission, Role, User
+from app.models import Permission, Role, User, user_search_tokens
+from app.models.user_search import rebuild_user_search_tokens
 from app.repositories.base import BaseRepository
+from app.utils.search import query_tokens
+
+EXACT_TOKEN_SCORE = 2
+PREFIX_TOKEN_SCORE = 1
+
+
+def _ranked_search[S: Select[Any]](stmt: S, search: str) -> S:
+    """Restrict ``stmt`` to users matching every query token, best match first.
+
+    Each query token contributes its best score across the user's stored
+    tokens: an exact token beats a mere prefix. Ties fall back to name order.
+    """
+    terms = query_tokens(search)
+    if not terms:
+        return stmt.where(false())
+    scores: list[ColumnElement[Any]] = []
+    for term in terms:
+        matches = (
+            select(
+                user_search_tokens.c.user_id,
+                func.max(case((user_search_tokens.c.token == term, EXACT_TOKEN_SCORE), else_=PREFIX_TOKEN_SCORE)).label("score"),
+            )
+            .where(user_search_tokens.c.token.like(f"{term}%"))
+            .group_by(user_search_tokens.c.user_id)
+            .subquery()
+        )
+        stmt = stmt.join(matches, matches.c.user_id == User.id)
+        scores.append(matches.c.score)
+    score: ColumnElement[Any] = sum(scores[1:], scores[0])
+    return stmt.order_by(score.desc(), User.name)
 
 
 class UserRepository(BaseRepository):
@@ -49,20 +82,22 @@ class UserRepository(BaseRepository):
     @staticmethod
     def get_all_paginated(page: int = 1, per_page: int = 20, search: str = "", membership_filter: str = "all") -> Pagination:
         stmt = select(User).options(joinedload(User.membership), joinedload(User.roles))
-        if search:
-            term = f"%{search}%"
-            stmt = stmt.where(or_(User.name.ilike(term), User.email.ilike(term), User.phone.ilike(term)))
         if membership_filter == "with":
             stmt = stmt.where(User.membership.has())
         elif membership_filter == "without":
             stmt = stmt.where(~User.membership.has())
-        stmt = stmt.order_by(User.name)
+        stmt = _ranked_search(stmt, search) if search else stmt.order_by(User.name)
         return paginate(db.session, stmt, page=page, per_page=per_page)
 
     @staticmethod
-    def get_recent(limit: int = 5) -> list[User]:
-        stmt = select(User).order_by(User.created_at.desc()).limit(limit)
-        return list(db.session.scalars(stmt).unique().all())
+    def search_typeahead(search: str, limit: int = 10) -> list[Row]:
+        """Top ranked ``(id, name, email, phone)`` rows for a search box."""
+        stmt = _ranked_search(select(User.id, User.name, User.email, User.phone), search).limit(limit)
+        return list(db.session.execute(stmt).all())
+
+    @staticmethod
+    def rebuild_search_tokens() -> int:
+        return rebuild_user_search_tokens(db.session.connection())
 
     @staticmethod
     def count() -> int:
@@ -73,11 +108,6 @@ class UserRepository(BaseRepository):
         stmt = select(func.count(func.distinct(User.id))).select_from(User).join(User.roles).where(Role.name == "Admin")
         return db.session.scalar(stmt) or 0
 
-    @staticmethod
-    def count_pending_users() -> int:
-        stmt = select(func.count()).select_from(User).where(User.is_active.is_(False))
-        return db.session.scalar(stmt) or 0
-
     @staticmethod
     def get_active_with_membership() -> list[User]:
         stmt = select(User).options(joinedload(User.membership)).where(User.is_active.is_(True)).order_by(User.name)
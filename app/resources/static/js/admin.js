@@ -140,6 +140,52 @@ Alpine.data('rolesActions', () => ({
     }
 }))
 
+// Member search type-ahead
+Alpine.data('memberSearch', () => ({
+    query: '',
+    results: [],
+    open: false,
+    pending: null,
+
+    init() {
+        this.query = this.$el.dataset.query || ''
+    },
+
+    async lookup() {
+        const query = this.query.trim()
+        if (query.length < 2) {
+            this.results = []
+            this.open = false
+            return
+        }
+        if (this.pending) {
+            this.pending.abort()
+        }
+        this.pending = new AbortController()
+        try {
+            const response = await fetch(`/admin/members/search?q=${encodeURIComponent(query)}`, {
+                headers: { Accept: 'application/json' },
+                signal: this.pending.signal,
+            })
+            if (!response.ok) {
+                return
+            }
+            const data = await response.json()
+            this.results = data.results
+            this.open = this.results.length > 0
+        } catch (error) {
+            if (error.name !== 'AbortError') {
+                this.results = []
+                this.open = false
+            }
+        }
+    },
+
+    close() {
+        this.open = false
+    },
+}))
+
 // Initialize Alpine.js
 window.Alpine = Alpine
 Alpine.start()
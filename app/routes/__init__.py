@@ -1,10 +1,14 @@
 from fastapi import APIRouter, Depends
 
 from app.core.database import get_db
-from app.routes import admin, auth, health, member, payment, public
+from app.dependencies import request_deadline
+from app.routes import admin, auth, health, member, metrics, payment, public
 
-api_router = APIRouter(dependencies=[Depends(get_db)])
-api_router.include_router(health.router)
+# Health probes are mounted outside api_router so they never open a DB session.
+health_router = health.router
+
+api_router = APIRouter(dependencies=[Depends(get_db), Depends(request_deadline)])
+api_router.include_router(metrics.router)
 api_router.include_router(public.router)
 api_router.include_router(auth.router)
 api_router.include_router(member.router)
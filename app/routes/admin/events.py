@@ -2,7 +2,7 @@ from fastapi import APIRouter, Request
 from fastapi.responses import RedirectResponse
 
 from app.dependencies import CsrfFormData, CurrentUser, require_perms
-from app.routes.admin._helpers import flash_form_errors
+from app.routes.admin._helpers import flash_form_errors, safe_int_param
 from app.schemas.admin_forms import EventForm
 from app.schemas.form_helpers import parse_form
 from app.services import events
@@ -13,8 +13,8 @@ router = APIRouter(tags=["admin.events"])
 
 @router.get("/events", name="admin.events", dependencies=[require_perms("events.read")])
 def events_index(request: Request, user: CurrentUser):
-    event_list = events.get_all_events()
-    return render(request, "admin/events.html", {"events": event_list}, user=user)
+    pagination = events.get_events_paginated(page=safe_int_param(request, "page", 1))
+    return render(request, "admin/events.html", {"events": pagination.items, "pagination": pagination}, user=user)
 
 
 @router.get("/events/create", name="admin.create_event", dependencies=[require_perms("events.create")])
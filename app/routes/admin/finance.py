@@ -3,7 +3,8 @@ from datetime import date
 from fastapi import APIRouter, Request
 from fastapi.responses import RedirectResponse, Response
 
-from app.dependencies import CsrfFormData, CurrentUser, require_perms
+from app.core.database import read_only
+from app.dependencies import CsrfFormData, CurrentUser, limit_concurrency, require_perms
 from app.routes.admin._helpers import flash_form_errors, safe_int_param
 from app.schemas.admin_forms import (
     EXPENSE_CATEGORY_CHOICES,
@@ -117,7 +118,12 @@ def financial_statement_page(request: Request, user: CurrentUser):
     return render(request, "admin/financial_statement.html", {"form": form, "statement": None}, user=user)
 
 
-@router.post("/finance/statement", name="admin.financial_statement_post", dependencies=[require_perms("finance.report")])
+@router.post(
+    "/finance/statement",
+    name="admin.financial_statement_post",
+    dependencies=[require_perms("finance.report"), limit_concurrency(2)],
+)
+@read_only
 def financial_statement_store(request: Request, user: CurrentUser, form_data: CsrfFormData):
     parsed, errors, values = parse_form(FinancialStatementForm, form_data)
     form = _statement_form_view(values=values, errors=errors)
@@ -131,7 +137,11 @@ def financial_statement_store(request: Request, user: CurrentUser, form_data: Cs
     return render(request, "admin/financial_statement.html", {"form": form, "statement": None}, user=user, status_code=422)
 
 
-@router.get("/finance/statement/pdf", name="admin.financial_statement_pdf", dependencies=[require_perms("finance.report")])
+@router.get(
+    "/finance/statement/pdf",
+    name="admin.financial_statement_pdf",
+    dependencies=[require_perms("finance.report"), limit_concurrency(2)],
+)
 def financial_statement_pdf(request: Request, user: CurrentUser):
     start_date_str = request.query_params.get("start_date")
     end_date_str = request.query_params.get("end_date")
@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Request
 from fastapi.responses import RedirectResponse
 
-from app.dependencies import CsrfFormData, CurrentUser, require_perms
+from app.dependencies import CsrfFormData, CurrentUser, limit_concurrency, require_perms
 from app.routes.admin._helpers import flash_form_errors, safe_int_param
 from app.schemas.admin_forms import QUALIFICATION_CHOICES, CreateMemberForm, EditMemberForm
 from app.schemas.form_helpers import FormView, parse_form
 from app.services import memberships, rbac, users
-from app.templating import flash, render
+from app.templating import flash, render, url_for
 
 router = APIRouter(tags=["admin.members"])
 
@@ -62,6 +62,15 @@ def members_index(request: Request, user: CurrentUser):
     )
 
 
+@router.get("/members/search", name="admin.member_search", dependencies=[require_perms("members.read"), limit_concurrency(4)])
+def member_search(request: Request, user: CurrentUser):
+    query = request.query_params.get("q", "").strip()
+    results = users.search_members(query)
+    for result in results:
+        result["url"] = url_for("admin.member_detail", user_id=result["id"])
+    return {"results": results}
+
+
 @router.get("/members/create", name="admin.create_member", dependencies=[require_perms("members.create")])
 def create_member_page(request: Request, user: CurrentUser):
     form = FormView(choices={"roles": _role_choices()})
@@ -131,6 +140,7 @@ def edit_member_store(user_id: int, request: Request, user: CurrentUser, form_da
             membership_expiry_date=parsed.membership_expiry_date,
             membership_initial_credits=parsed.membership_initial_credits,
             membership_purchased_credits=parsed.membership_purchased_credits,
+            actor_id=user.id,
         )
         flash(request, "success" if result.success else "error", result.message)
         if result.success:
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Request
 from fastapi.responses import RedirectResponse
 
 from app.dependencies import CsrfFormData, CurrentUser, require_perms
-from app.routes.admin._helpers import flash_form_errors
+from app.routes.admin._helpers import flash_form_errors, safe_int_param
 from app.schemas.admin_forms import NewsForm
 from app.schemas.form_helpers import parse_form
 from app.services import news
@@ -13,8 +13,8 @@ router = APIRouter(tags=["admin.news"])
 
 @router.get("/news", name="admin.news", dependencies=[require_perms("news.read")])
 def news_index(request: Request, user: CurrentUser):
-    articles = news.get_all_articles()
-    return render(request, "admin/news.html", {"news": articles}, user=user)
+    pagination = news.get_articles_paginated(page=safe_int_param(request, "page", 1))
+    return render(request, "admin/news.html", {"articles": pagination.items, "pagination": pagination}, user=user)
 
 
 @router.get("/news/create", name="admin.create_news", dependencies=[require_perms("news.create")])
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Request
 from fastapi.responses import RedirectResponse
 
-from app.dependencies import CsrfFormData, CurrentUser, require_perms
+from app.dependencies import CsrfFormData, CurrentUser, limit_concurrency, require_perms
 from app.services import payment_processing, payments
 from app.services.result import ErrorCode
 from app.templating import flash, render
@@ -101,7 +101,7 @@ def replay_payment_side_effects(payment_id: int, request: Request, user: Current
 @router.post(
     "/payments/{payment_id}/reconcile",
     name="admin.reconcile_payment",
-    dependencies=[require_perms("payments.approve")],
+    dependencies=[require_perms("payments.approve"), limit_concurrency(2)],
 )
 def reconcile_payment(payment_id: int, request: Request, user: CurrentUser, form_data: CsrfFormData):
     redirect_to = form_data.get("redirect_to") or "/admin/payments/reconcile"
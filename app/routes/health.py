@@ -1,3 +1,10 @@
+"""Health probes.
+
+These routes are mounted on the app directly rather than on ``api_router``, so
+they never open a request database session; ``ready`` and ``deep`` read the
+probe report the background refresher keeps warm.
+"""
+
 from fastapi import APIRouter, Response
 from fastapi.responses import JSONResponse
 
@@ -6,8 +13,28 @@ from app.services import health as health_service
 router = APIRouter(tags=["health"])
 
 
+def _probe_response(report: dict) -> JSONResponse:
+    status_code = 503 if report["status"] == health_service.DOWN else 200
+    return JSONResponse(report, status_code=status_code, headers={"Cache-Control": "no-store"})
+
+
 @router.get("/health", name="health", response_model=None)
 def health() -> Response | dict[str, str]:
     if health_service.check_database():
         return {"status": "ok"}
     return JSONResponse({"status": "error"}, status_code=500)
+
+
+@router.get("/health/live", name="health.live")
+async def health_live() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+@router.get("/health/ready", name="health.ready")
+def health_ready() -> JSONResponse:
+    return _probe_response(health_service.readiness())
+
+
+@router.get("/health/deep", name="health.deep")
+def health_deep() -> JSONResponse:
+    return _probe_response(health_service.deep_health())
@@ -22,7 +22,7 @@ def dashboard(
         "member/dashboard.html",
         {
             "membership": user.membership,
-            "shoots_attended": len(user.shoots),
+            "shoots_attended": users.count_user_shoots(user.id),
             "payments": payment_page,
         },
         user=user,
@@ -30,9 +30,13 @@ def dashboard(
 
 
 @router.get("/shoots", name="member.shoots")
-def shoots(request: Request, user: CurrentUser):
-    user_shoots = users.get_user_shoots(user)
-    return render(request, "member/shoots.html", {"shoots": user_shoots}, user=user)
+def shoots(
+    request: Request,
+    user: CurrentUser,
+    page: int = Query(1, ge=1),
+):
+    shoot_page = users.get_user_shoots_paginated(user.id, page=page, per_page=20)
+    return render(request, "member/shoots.html", {"shoots": shoot_page}, user=user)
 
 
 @router.get("/credits", name="member.credits")
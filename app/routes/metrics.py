@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.dependencies import require_metrics_access
+from app.metrics import render_metrics
+
+router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", name="metrics", dependencies=[Depends(require_metrics_access)])
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,10 +1,10 @@
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Query, Request
 
 from app.dependencies import OptionalUser
 from app.services import events as event_service
 from app.services import news as news_service
 from app.services import settings
-from app.templating import render
+from app.templating import not_modified, render
 
 router = APIRouter(tags=["public"])
 
@@ -25,21 +25,26 @@ def membership(request: Request, user: OptionalUser):
 
 
 @router.get("/news", name="public.news_list")
-def news_list(request: Request, user: OptionalUser):
+def news_list(request: Request, user: OptionalUser, page: int = Query(1, ge=1)):
     if not settings.get("news_enabled"):
         return render(request, "errors/404.html", user=user, status_code=404)
-    articles = news_service.get_published_articles()
-    return render(request, "public/news.html", {"news": articles}, user=user)
+    articles = news_service.get_published_articles(page=page)
+    return render(request, "public/news.html", {"news": articles.items, "pagination": articles}, user=user)
 
 
 @router.get("/news/{news_id}", name="public.news_detail")
 def news_detail(news_id: int, request: Request, user: OptionalUser):
     if not settings.get("news_enabled"):
         return render(request, "errors/404.html", user=user, status_code=404)
-    article = news_service.get_article_by_id(news_id)
-    if not article or not article.published:
+    article = news_service.get_published_article(news_id)
+    if article is None:
         return render(request, "errors/404.html", user=user, status_code=404)
-    return render(request, "public/news_detail.html", {"news": article}, user=user)
+    etag = news_service.article_etag(article, user)
+    if (cached := not_modified(request, etag)) is not None:
+        return cached
+    response = render(request, "public/news_detail.html", {"news": article, "content_html": news_service.get_article_html(news_id)}, user=user)
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.get("/events", name="public.events")
@@ -34,6 +34,7 @@ FALLBACK_ROUTES: dict[str, str] = {
     "admin.dashboard": "/admin/dashboard",
     "admin.members": "/admin/members",
     "admin.member_detail": "/admin/members/{user_id}",
+    "admin.member_search": "/admin/members/search",
     "admin.renew_membership": "/admin/members/{user_id}/membership/renew",
     "admin.create_membership": "/admin/members/{user_id}/membership/create",
     "admin.activate_membership": "/admin/members/{user_id}/membership/activate",
@@ -85,4 +86,8 @@ FALLBACK_ROUTES: dict[str, str] = {
     "admin.edit_role_post": "/admin/roles/{role_id}/edit",
     "admin.delete_role": "/admin/roles/{role_id}/delete",
     "health": "/health",
+    "health.live": "/health/live",
+    "health.ready": "/health/ready",
+    "health.deep": "/health/deep",
+    "metrics": "/metrics",
 }
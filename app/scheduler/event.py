@@ -1,6 +1,9 @@
 from collections.abc import Callable
 from datetime import datetime
 
+from app.metrics import SCHEDULER_JOB_DURATION, observe_duration
+from app.tracing import start_span
+
 
 class Event:
     """Represents a scheduled task event."""
@@ -212,7 +215,8 @@ class Event:
     def run(self):
         """Execute the scheduled task."""
         try:
-            self.callback()
+            with start_span(f"job {self.description}"), observe_duration(SCHEDULER_JOB_DURATION, job=self.description):
+                self.callback()
         except Exception as e:
             print(f"Error running scheduled task '{self.description}': {e}")
             raise
@@ -1,23 +1,25 @@
-from app.repositories import MembershipRepository, PaymentRepository, UserRepository
+from app.core.config import get_settings
+from app.db import on_commit_writing
+from app.repositories import DashboardRepository
 from app.services.result import ServiceResult
+from app.utils.cache import TTLCache
 
+_DASHBOARD_TABLES = ("users", "memberships", "payments")
+
+_dashboard_cache: TTLCache[dict] = TTLCache(ttl_seconds=get_settings().dashboard_stats_ttl_seconds)
+# Commits in this worker drop the cached stats at once; other workers catch up
+# within the TTL.
+on_commit_writing(_DASHBOARD_TABLES, _dashboard_cache.clear)
 
-def get_dashboard_stats() -> ServiceResult[dict]:
-    total_members = UserRepository.count()
-    active_memberships = MembershipRepository.count_active()
-    recent_members = UserRepository.get_recent(limit=5)
-    count_pending_users = UserRepository.count_pending_users()
 
-    pending_cash_payments = PaymentRepository.count_pending_cash()
-    pending_payments_data = PaymentRepository.get_pending_cash_limited_with_users(limit=5)
+def _load_dashboard_stats() -> dict:
+    counters = DashboardRepository.get_counters()
+    return {
+        **counters._asdict(),
+        "recent_members": DashboardRepository.get_recent_members(limit=5),
+        "pending_payments_data": DashboardRepository.get_pending_cash_payments(limit=5),
+    }
 
-    return ServiceResult.ok(
-        data={
-            "total_members": total_members,
-            "active_memberships": active_memberships,
-            "recent_members": recent_members,
-            "pending_cash_payments": pending_cash_payments,
-            "pending_payments_data": pending_payments_data,
-            "count_pending_users": count_pending_users,
-        }
-    )
+
+def get_dashboard_stats() -> ServiceResult[dict]:
+    return ServiceResult.ok(data=dict(_dashboard_cache.get_or_set("stats", _load_dashboard_stats)))
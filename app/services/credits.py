@@ -1,6 +1,159 @@
+"""Credit balances and the append-only credit ledger.
+
+Every change to a membership's ``initial_credits``/``purchased_credits`` goes
+through this module: the balances are re-read under a row lock, changed, and the
+signed difference per bucket is appended to ``credit_ledger`` in the same
+transaction. Nothing here commits; callers own the unit of work.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+
 from app.models.credit import Credit
-from app.repositories import CreditRepository
+from app.models.credit_ledger import BUCKET_COLUMNS
+from app.models.membership import Membership
+from app.repositories import CreditLedgerRepository, CreditRepository
+from app.utils.datetime_utils import utc_now
+
+COLUMN_BUCKETS = {column: bucket for bucket, column in BUCKET_COLUMNS.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class BalanceMismatch:
+    membership_id: int
+    user_id: int
+    bucket: str
+    balance: int
+    ledger_total: int
 
 
 def get_user_credits(user_id: int) -> list[Credit]:
     return CreditRepository.get_by_user(user_id)
+
+
+def ledger_row(
+    *,
+    membership_id: int,
+    user_id: int,
+    column: str,
+    delta: int,
+    balance_after: int,
+    reason: str,
+    shoot_id: int | None = None,
+    payment_id: int | None = None,
+    actor_id: int | None = None,
+) -> dict:
+    """A ledger row for ``append_entries``; ``column`` is a Membership balance column."""
+    return {
+        "membership_id": membership_id,
+        "user_id": user_id,
+        "bucket": COLUMN_BUCKETS[column],
+        "delta": delta,
+        "balance_after": balance_after,
+        "reason": reason,
+        "shoot_id": shoot_id,
+        "payment_id": payment_id,
+        "actor_id": actor_id,
+        "created_at": utc_now(),
+    }
+
+
+def append_entries(rows: list[dict]) -> None:
+    """Append prepared rows; for bulk writers that already hold the row locks."""
+    CreditLedgerRepository.append(rows)
+
+
+def _record[T](
+    membership: Membership,
+    reason: str,
+    change: Callable[[Membership], T],
+    *,
+    shoot_id: int | None = None,
+    payment_id: int | None = None,
+    actor_id: int | None = None,
+) -> T:
+    CreditLedgerRepository.lock_balances(membership)
+    before = {column: getattr(membership, column) or 0 for column in COLUMN_BUCKETS}
+    result = change(membership)
+    rows = []
+    for column, previous in before.items():
+        balance = getattr(membership, column) or 0
+        if balance != previous:
+            rows.append(
+                ledger_row(
+                    membership_id=membership.id,
+                    user_id=membership.user_id,
+                    column=column,
+                    delta=balance - previous,
+                    balance_after=balance,
+                    reason=reason,
+                    shoot_id=shoot_id,
+                    payment_id=payment_id,
+                    actor_id=actor_id,
+                )
+            )
+    CreditLedgerRepository.append(rows)
+    return result
+
+
+def add_credits(membership: Membership, amount: int, *, reason: str, payment_id: int | None = None, actor_id: int | None = None) -> None:
+    _record(membership, reason, lambda m: m.add_credits(amount), payment_id=payment_id, actor_id=actor_id)
+
+
+def remove_credits(membership: Membership, amount: int, *, reason: str, actor_id: int | None = None) -> None:
+    _record(membership, reason, lambda m: m.remove_credits(amount), actor_id=actor_id)
+
+
+def renew(membership: Membership, expiry_date: date, initial_credits: int = 20, *, payment_id: int | None = None) -> None:
+    _record(membership, "renewal", lambda m: m.renew(expiry_date=expiry_date, initial_credits=initial_credits), payment_id=payment_id)
+
+
+def expire_initial_credits(membership: Membership) -> None:
+    _record(membership, "year_end_expiry", lambda m: m.expire_initial_credits())
+
+
+def set_balances(
+    membership: Membership,
+    *,
+    reason: str,
+    initial_credits: int | None = None,
+    purchased_credits: int | None = None,
+    actor_id: int | None = None,
+) -> None:
+    def _set(m: Membership) -> None:
+        if initial_credits is not None:
+            m.initial_credits = initial_credits
+        if purchased_credits is not None:
+            m.purchased_credits = purchased_credits
+
+    _record(membership, reason, _set, actor_id=actor_id)
+
+
+def find_balance_mismatches() -> list[BalanceMismatch]:
+    """Memberships whose materialized balances disagree with ``SUM(delta)``."""
+    totals = CreditLedgerRepository.totals_by_membership()
+    mismatches = []
+    for row in CreditLedgerRepository.get_balances():
+        for bucket, column in BUCKET_COLUMNS.items():
+            balance = getattr(row, column) or 0
+            ledger_total = totals.get((row.id, bucket), 0)
+            if balance != ledger_total:
+                mismatches.append(BalanceMismatch(row.id, row.user_id, bucket, balance, ledger_total))
+    return mismatches
+
+
+def reconcile_balances() -> list[BalanceMismatch]:
+    """Rewrite drifted balances from the ledger and commit; returns what was fixed."""
+    mismatches = find_balance_mismatches()
+    totals = CreditLedgerRepository.totals_by_membership()
+    for membership_id in sorted({mismatch.membership_id for mismatch in mismatches}):
+        CreditLedgerRepository.set_balances(
+            membership_id,
+            initial_credits=totals.get((membership_id, "initial"), 0),
+            purchased_credits=totals.get((membership_id, "purchased"), 0),
+        )
+    CreditLedgerRepository.save()
+    return mismatches
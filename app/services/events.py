@@ -2,12 +2,19 @@ from __future__ import annotations
 
 from datetime import datetime
 
+from sqlalchemy import Row
+
+from app.db import Pagination
 from app.models.event import Event
 from app.repositories import EventRepository
 from app.services.result import ServiceResult
+from app.utils.cache import cached
 
 
-def get_upcoming_published_events() -> list[Event]:
+# The TTL also bounds how long an event stays listed after it starts.
+@cached(ttl_seconds=60, maxsize=1, tags=("events",))
+def get_upcoming_published_events() -> list[Row]:
+    """Rows of ``id``, ``title``, ``excerpt``, ``location`` and ``start_date``, soonest first."""
     return EventRepository.get_upcoming_published()
 
 
@@ -57,8 +64,8 @@ def update_event(
         return ServiceResult.fail(f"Error updating event: {exc}")
 
 
-def get_all_events() -> list[Event]:
-    return EventRepository.get_all()
+def get_events_paginated(page: int = 1, per_page: int = 20) -> Pagination:
+    return EventRepository.get_all_paginated(page=page, per_page=per_page)
 
 
 def get_event_by_id(event_id: int) -> Event | None:
@@ -43,6 +43,33 @@ def add_transaction(
         return ServiceResult.fail(f"Error creating transaction: {exc}")
 
 
+def add_transactions(entries: list[dict]) -> ServiceResult[int]:
+    """Stage several transactions in one multi-row INSERT (no commit).
+
+    Each entry takes the keyword arguments of :func:`add_transaction`. No ORM
+    objects are returned; the count of rows written is.
+    """
+    rows = [
+        {
+            "type": entry["txn_type"],
+            "date": entry["txn_date"],
+            "amount_cents": entry["amount_cents"],
+            "category": entry["category"],
+            "description": entry["description"],
+            "created_by_id": entry["created_by_id"],
+            "source": entry.get("source"),
+            "receipt_reference": entry.get("receipt_reference"),
+        }
+        for entry in entries
+    ]
+
+    try:
+        FinancialTransactionRepository.insert_many(rows)
+        return ServiceResult.ok(data=len(rows))
+    except Exception as exc:
+        return ServiceResult.fail(f"Error creating transactions: {exc}")
+
+
 def create_transaction(
     txn_type: str,
     txn_date: date,
@@ -1,9 +1,195 @@
+"""Dependency probes behind ``/health/ready`` and ``/health/deep``.
+
+Probes run in a small thread pool with a per-probe timeout, so a slow database
+shows up as ``degraded`` rather than hanging the health endpoint. Results are
+cached per worker and refreshed by a background task started in the app
+lifespan; probe endpoints normally just read the cache. Readiness also waits
+for the worker's lifespan warmup (``app.warmup``) to finish.
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from app.core.config import get_settings
+from app.metrics import DEFERRED_HANDLERS_PENDING
 from app.repositories.base import BaseRepository
+from app.utils.cache import TTLCache
+
+OK = "ok"
+DEGRADED = "degraded"
+DOWN = "down"
+
+READINESS_CHECKS = ("warmup", "database")
+# Only these take the whole app down; the rest degrade it.
+CRITICAL_CHECKS = frozenset({"warmup", "database"})
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-probe")
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+_report_cache: TTLCache[HealthReport] = TTLCache(ttl_seconds=get_settings().health_probe_interval_seconds * 3)
+_redis_client = None
+
+
+@dataclass(frozen=True, slots=True)
+class ProbeResult:
+    status: str
+    latency_ms: float | None = None
+    detail: dict[str, Any] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {"status": self.status}
+        if self.latency_ms is not None:
+            data["latency_ms"] = self.latency_ms
+        data.update(self.detail)
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class HealthReport:
+    checks: dict[str, ProbeResult]
+    checked_at: datetime
+
+    def status(self, names: tuple[str, ...] | None = None) -> str:
+        selected = {name: result for name, result in self.checks.items() if names is None or name in names}
+        if any(result.status == DOWN and name in CRITICAL_CHECKS for name, result in selected.items()):
+            return DOWN
+        if any(result.status != OK for result in selected.values()):
+            return DEGRADED
+        return OK
+
+    def as_dict(self, names: tuple[str, ...] | None = None) -> dict[str, Any]:
+        return {
+            "status": self.status(names),
+            "checked_at": self.checked_at.isoformat(),
+            "age_seconds": round((datetime.now(UTC) - self.checked_at).total_seconds(), 3),
+            "checks": {name: result.as_dict() for name, result in self.checks.items() if names is None or name in names},
+        }
+
+
+WARMING_UP = ProbeResult(DOWN, detail={"error": "worker is still warming up"})
+_warmup: ProbeResult = WARMING_UP
+
+
+def record_warmup(steps: dict[str, ProbeResult]) -> None:
+    """Mark this worker warm; a failed step degrades readiness instead of blocking it."""
+    global _warmup
+    status = OK if all(step.status == OK for step in steps.values()) else DEGRADED
+    latency_ms = round(sum(step.latency_ms or 0 for step in steps.values()), 2)
+    _warmup = ProbeResult(status, latency_ms, {"steps": {name: step.as_dict() for name, step in steps.items()}})
+
+
+def _with_warmup(report: HealthReport) -> HealthReport:
+    return HealthReport(checks={"warmup": _warmup, **report.checks}, checked_at=report.checked_at)
+
+
+def _database_probe() -> dict[str, Any]:
+    BaseRepository.ping_isolated()
+    return {}
+
+
+def _redis_probe() -> dict[str, Any]:
+    global _redis_client
+    settings = get_settings()
+    if _redis_client is None:
+        import redis
+
+        # Only probed when REDIS_URL is set, see ``refresh_probes``.
+        assert settings.redis_url is not None
+        timeout = settings.health_probe_timeout_seconds
+        _redis_client = redis.Redis.from_url(settings.redis_url, socket_timeout=timeout, socket_connect_timeout=timeout)
+    _redis_client.ping()
+    return {}
+
+
+def _smtp_probe() -> dict[str, Any]:
+    settings = get_settings()
+    with socket.create_connection((settings.mail_server, settings.mail_port), timeout=settings.health_probe_timeout_seconds):
+        pass
+    return {}
+
+
+def _timed(probe: Callable[[], dict[str, Any]]) -> tuple[float, dict[str, Any]]:
+    started = time.perf_counter()
+    detail = probe()
+    return round((time.perf_counter() - started) * 1000, 2), detail
+
+
+def _run_probes(probes: dict[str, Callable[[], dict[str, Any]]]) -> dict[str, ProbeResult]:
+    """Run probes concurrently; a probe still running from a previous round is not restarted."""
+    settings = get_settings()
+    futures: dict[str, Future] = {}
+    with _inflight_lock:
+        for name, probe in probes.items():
+            previous = _inflight.get(name)
+            if previous is None or previous.done():
+                _inflight[name] = _executor.submit(_timed, probe)
+            futures[name] = _inflight[name]
+
+    deadline = time.monotonic() + settings.health_probe_timeout_seconds
+    results: dict[str, ProbeResult] = {}
+    for name, future in futures.items():
+        try:
+            latency_ms, detail = future.result(timeout=max(deadline - time.monotonic(), 0))
+        except FutureTimeoutError:
+            results[name] = ProbeResult(DEGRADED, detail={"error": f"no response within {settings.health_probe_timeout_seconds:g}s"})
+            continue
+        except Exception as exc:
+            results[name] = ProbeResult(DOWN, detail={"error": f"{type(exc).__name__}: {exc}"})
+            continue
+        status = DEGRADED if latency_ms > settings.health_probe_slow_ms else OK
+        results[name] = ProbeResult(status, latency_ms, detail)
+    return results
+
+
+def _database_with_pool(result: ProbeResult) -> ProbeResult:
+    pool = BaseRepository.pool_status()
+    saturation = pool.get("saturation")
+    status = result.status
+    if status == OK and saturation is not None and saturation >= get_settings().health_pool_saturation_warning:
+        status = DEGRADED
+    return ProbeResult(status, result.latency_ms, {**result.detail, "pool": pool})
+
+
+def _deferred_handlers_check() -> ProbeResult:
+    pending = int(DEFERRED_HANDLERS_PENDING.value())
+    status = DEGRADED if pending > get_settings().health_pending_handlers_warning else OK
+    return ProbeResult(status, detail={"pending": pending})
+
+
+def refresh_probes() -> HealthReport:
+    """Probe every dependency now and cache the report."""
+    probes: dict[str, Callable[[], dict[str, Any]]] = {"database": _database_probe, "smtp": _smtp_probe}
+    if get_settings().redis_url:
+        probes["redis"] = _redis_probe
+    checks = _run_probes(probes)
+    checks["database"] = _database_with_pool(checks["database"])
+    checks["deferred_handlers"] = _deferred_handlers_check()
+    report = HealthReport(checks=checks, checked_at=datetime.now(UTC))
+    _report_cache.set("report", report)
+    return report
+
+
+def get_health_report() -> HealthReport:
+    """The cached report, probing inline only when the background refresher has fallen behind."""
+    return _report_cache.get_or_set("report", refresh_probes)
+
+
+def readiness() -> dict[str, Any]:
+    return _with_warmup(get_health_report()).as_dict(READINESS_CHECKS)
+
+
+def deep_health() -> dict[str, Any]:
+    return _with_warmup(get_health_report()).as_dict()
 
 
 def check_database() -> bool:
-    try:
-        BaseRepository.ping()
-        return True
-    except Exception:
-        return False
+    return get_health_report().checks["database"].status != DOWN
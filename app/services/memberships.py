@@ -6,8 +6,7 @@ from app.enums import PaymentType
 from app.events.payloads import emit_membership_activated
 from app.models import Membership, User
 from app.repositories import BaseRepository, MembershipRepository, PaymentRepository
-from app.services import payments, settings
-from app.services.payment_fulfillment import fulfill_payment
+from app.services import credits, payment_fulfillment, payments, settings
 from app.services.payment_side_effects import emit_payment_side_effects
 from app.services.result import ServiceResult
 
@@ -46,7 +45,7 @@ def activate_membership(user: User) -> ServiceResult[dict[str, Any]]:
     try:
         pending_payment = PaymentRepository.get_pending_cash_for_user(user.id, PaymentType.MEMBERSHIP)
         if pending_payment:
-            result = fulfill_payment(
+            result = payment_fulfillment.fulfill_payment(
                 pending_payment,
                 user,
                 processor="cash",
@@ -93,9 +92,9 @@ def renew_membership(user: User) -> ServiceResult[None]:
 
     initial_credits: int = settings.get("membership_shoots_included")
     expiry_date = settings.calculate_membership_expiry(date.today()).date()
-    user.membership.renew(expiry_date=expiry_date, initial_credits=initial_credits)
     try:
-        MembershipRepository.save()
+        with BaseRepository.transaction():
+            credits.renew(user.membership, expiry_date, initial_credits=initial_credits)
         return ServiceResult.ok(message="Membership renewed successfully.")
     except Exception as exc:
         return ServiceResult.fail(f"Error renewing membership: {exc}")
@@ -122,7 +121,7 @@ def expire_memberships_for_year_end() -> int:
     count = 0
 
     for membership in expired_memberships:
-        membership.expire_initial_credits()
+        credits.expire_initial_credits(membership)
         count += 1
 
     if count > 0:
@@ -1,19 +1,55 @@
 from __future__ import annotations
 
+import hashlib
+
+from sqlalchemy import Row
+
+from app.db import Pagination
 from app.models.news import News
+from app.models.user import User
 from app.repositories import NewsRepository
+from app.services import settings
 from app.services.result import ServiceResult
+from app.templating import templates_version
+from app.utils.cache import cached
 from app.utils.datetime_utils import utc_now
 
 
-def get_published_articles() -> list[News]:
-    return NewsRepository.get_published()
+@cached(ttl_seconds=60, maxsize=16, tags=("news",))
+def get_published_articles(page: int = 1, per_page: int = 10) -> Pagination:
+    """A page of rows of ``id``, ``title``, ``summary``, ``excerpt`` and ``published_at``, newest first."""
+    return NewsRepository.get_published_paginated(page=page, per_page=per_page)
 
 
 def get_article_by_id(news_id: int) -> News | None:
     return NewsRepository.get_by_id(news_id)
 
 
+@cached(ttl_seconds=60, maxsize=256, tags=("news",))
+def get_published_article(news_id: int) -> Row | None:
+    """``id``, ``title``, ``published_at`` and ``content_hash`` of a published article; the body is not read."""
+    return NewsRepository.get_published_header(news_id)
+
+
+@cached(ttl_seconds=60, maxsize=32, tags=("news",))
+def get_article_html(news_id: int) -> str:
+    """The article body as stored, sanitized HTML (see ``app.utils.content``)."""
+    return NewsRepository.get_content_html(news_id) or ""
+
+
+def article_etag(article: Row, viewer: User | None) -> str:
+    """Weak ETag for the detail page.
+
+    Covers the article, the deployed templates, who is viewing and whether
+    they see the admin link (the page shows their menu), and the feature
+    flags that change the navigation.
+    """
+    viewer_id = viewer.id if viewer is not None else None
+    sees_admin_link = viewer is not None and viewer.has_permission("admin.dashboard.view")
+    parts = (templates_version(), article.content_hash, article.title, article.published_at, viewer_id, sees_admin_link, settings.get("events_enabled"))
+    return f'W/"{hashlib.sha256(repr(parts).encode()).hexdigest()[:32]}"'
+
+
 def create_article(
     title: str,
     summary: str | None = None,
@@ -62,5 +98,5 @@ def update_article(
         return ServiceResult.fail(f"Error updating article: {exc}")
 
 
-def get_all_articles() -> list[News]:
-    return NewsRepository.get_all()
+def get_articles_paginated(page: int = 1, per_page: int = 20) -> Pagination:
+    return NewsRepository.get_all_paginated(page=page, per_page=per_page)
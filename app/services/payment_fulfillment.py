@@ -10,7 +10,7 @@ from typing import Literal
 from app.enums import PaymentType
 from app.models import Credit, Membership, Payment, User
 from app.repositories import BaseRepository, CreditRepository, MembershipRepository
-from app.services import settings
+from app.services import credits, settings
 from app.services.result import ErrorCode, ServiceResult
 
 logger = logging.getLogger(__name__)
@@ -33,22 +33,18 @@ def credit_quantity_from_description(description: str | None) -> int:
     return 1
 
 
-def _apply_membership_fulfillment(member: User, *, mode: MembershipMode) -> None:
+def _apply_membership_fulfillment(member: User, payment: Payment, *, mode: MembershipMode) -> None:
     if mode == "activate_only":
         if member.membership:
             member.membership.activate()
         return
 
     if member.membership:
-        if mode == "activate_or_renew":
-            if member.membership.status != "active":
-                member.membership.activate()
-                return
-            expiry_date = settings.calculate_membership_expiry(date.today()).date()
-            member.membership.renew(expiry_date=expiry_date)
+        if mode == "activate_or_renew" and member.membership.status != "active":
+            member.membership.activate()
             return
         expiry_date = settings.calculate_membership_expiry(date.today()).date()
-        member.membership.renew(expiry_date=expiry_date)
+        credits.renew(member.membership, expiry_date, payment_id=payment.id)
         return
 
     start_date = date.today()
@@ -65,7 +61,7 @@ def _apply_membership_fulfillment(member: User, *, mode: MembershipMode) -> None
 
 def _apply_credit_fulfillment(member: User, payment: Payment, quantity: int) -> None:
     if member.membership:
-        member.membership.add_credits(quantity)
+        credits.add_credits(member.membership, quantity, reason="purchase", payment_id=payment.id)
     CreditRepository.add(Credit(user_id=member.id, amount=quantity, payment_id=payment.id))
 
 
@@ -104,7 +100,7 @@ def fulfill_payment(
         with BaseRepository.transaction():
             payment.mark_completed(transaction_id, processor=processor)
             if payment.payment_type == PaymentType.MEMBERSHIP:
-                _apply_membership_fulfillment(member, mode=membership_mode)
+                _apply_membership_fulfillment(member, payment, mode=membership_mode)
             elif payment.payment_type == PaymentType.CREDITS:
                 assert resolved_quantity is not None
                 _apply_credit_fulfillment(member, payment, resolved_quantity)
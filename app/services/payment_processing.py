@@ -8,7 +8,8 @@ from typing import Any
 from app.enums import PaymentType
 from app.models import Payment
 from app.repositories import PaymentRepository, UserRepository
-from app.services.payment_fulfillment import credit_quantity_from_description, fulfill_payment
+from app.services import payment_fulfillment
+from app.services.payment_fulfillment import credit_quantity_from_description
 from app.services.payment_side_effects import emit_payment_side_effects
 from app.services.result import ErrorCode, ServiceResult
 from app.services.sumup import SumUpService
@@ -80,7 +81,7 @@ def handle_signup_payment(user_id: int, payment_id: int, transaction_id: str) ->
     if ownership_error := _verify_payment_ownership(payment, user_id):
         return ownership_error
 
-    result = fulfill_payment(
+    result = payment_fulfillment.fulfill_payment(
         payment,
         user,
         processor="sumup",
@@ -105,7 +106,7 @@ def handle_membership_renewal(user_id: int, payment_id: int, transaction_id: str
     if ownership_error := _verify_payment_ownership(payment, user_id):
         return ownership_error
 
-    result = fulfill_payment(
+    result = payment_fulfillment.fulfill_payment(
         payment,
         user,
         processor="sumup",
@@ -130,7 +131,7 @@ def handle_credit_purchase(user_id: int, payment_id: int, quantity: int, transac
     if ownership_error := _verify_payment_ownership(payment, user_id):
         return ownership_error
 
-    result = fulfill_payment(
+    result = payment_fulfillment.fulfill_payment(
         payment,
         user,
         processor="sumup",
@@ -8,8 +8,7 @@ from app.events.payloads import emit_cash_payment_submitted
 from app.models.payment import Payment
 from app.models.user import User
 from app.repositories import BaseRepository, PaymentRepository, UserRepository
-from app.services import settings
-from app.services.payment_fulfillment import fulfill_payment
+from app.services import payment_fulfillment, settings
 from app.services.payment_side_effects import emit_payment_side_effects, replay_payment_side_effects
 from app.services.result import ErrorCode, ServiceResult
 from app.services.sumup import SumUpService
@@ -275,7 +274,7 @@ def approve_cash_payment(payment_id: int) -> ServiceResult[dict[str, Any]]:
     if not member:
         return ServiceResult.fail("User not found.", error_code=ErrorCode.NOT_FOUND)
 
-    result = fulfill_payment(
+    result = payment_fulfillment.fulfill_payment(
         payment,
         member,
         processor="cash",
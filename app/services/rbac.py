@@ -2,21 +2,30 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 
-from app.models import Permission, Role
+from sqlalchemy import Row
+
+from app.models import Role
 from app.repositories import RBACRepository
 from app.services.result import ServiceResult
+from app.utils.cache import cached
+
+_RBAC_TABLES = ("permissions", "role_permissions", "roles")
 
 
-def list_roles() -> list[Role]:
-    return RBACRepository.list_roles()
+@cached(ttl_seconds=300, maxsize=1, tags=_RBAC_TABLES)
+def list_roles() -> list[Row]:
+    """Rows of ``id``, ``name``, ``description`` and ``permission_count``, by name."""
+    return RBACRepository.list_role_summaries()
 
 
 def role_choices() -> list[tuple[int, str]]:
-    return [(role.id, role.name) for role in RBACRepository.list_roles()]
+    return [(role.id, role.name) for role in list_roles()]
 
 
-def list_permissions() -> list[Permission]:
-    return RBACRepository.list_permissions()
+@cached(ttl_seconds=300, maxsize=1, tags=_RBAC_TABLES)
+def list_permissions() -> list[Row]:
+    """Rows of ``id``, ``name`` and ``description``, by name."""
+    return RBACRepository.list_permission_rows()
 
 
 def get_role(role_id: int) -> Role | None:
@@ -8,6 +8,7 @@ from decimal import Decimal, InvalidOperation
 from typing import Any
 
 from app.repositories import SettingsRepository
+from app.utils.cache import cached
 
 
 # ---------------------------------------------------------------------------
@@ -65,11 +66,9 @@ def _serialize(value: Any, value_type: str) -> str | None:
 
 
 def get(key: str) -> Any:
-    definition = SETTING_DEFINITIONS.get(key)
-    if not definition:
+    if key not in SETTING_DEFINITIONS:
         raise KeyError(f"Unknown setting: {key}")
-    raw = SettingsRepository.get_value(key)
-    return _deserialize(raw, definition.type, definition.default)
+    return _all_settings()[key]
 
 
 def set(key: str, value: Any) -> None:
@@ -81,7 +80,10 @@ def set(key: str, value: Any) -> None:
     SettingsRepository.save()
 
 
-def get_all() -> dict[str, Any]:
+# Read on nearly every request (feature flags, prices), so the whole table is
+# loaded once and shared; callers get a copy of the dict.
+@cached(ttl_seconds=60, maxsize=1, tags=("setting",))
+def _all_settings() -> dict[str, Any]:
     stored = SettingsRepository.get_all()
     result: dict[str, Any] = {}
     for key, definition in SETTING_DEFINITIONS.items():
@@ -90,6 +92,10 @@ def get_all() -> dict[str, Any]:
     return result
 
 
+def get_all() -> dict[str, Any]:
+    return dict(_all_settings())
+
+
 def save_many(mapping: dict[str, Any]) -> None:
     for key, value in mapping.items():
         definition = SETTING_DEFINITIONS.get(key)
@@ -4,11 +4,12 @@ from datetime import date
 from typing import Any
 
 from app.db import Pagination
-from app.models import Shoot
+from app.models import Membership, Shoot
 from app.models.shoot import ShootLocation, ShootVisitor
-from app.repositories import BaseRepository, ShootRepository, UserRepository
-from app.services import finance, settings
+from app.repositories import BaseRepository, MembershipRepository, ShootRepository, UserRepository
+from app.services import credits, finance, settings
 from app.services.result import ServiceResult
+from app.utils.cache import cached
 
 
 def create_shoot(
@@ -27,7 +28,7 @@ def create_shoot(
             ShootRepository.flush()
 
             if attendee_ids:
-                _filter_shoot_attendees(attendee_ids, shoot, warnings)
+                _record_attendance(shoot, attendee_ids, warnings)
 
             if visitors:
                 _add_visitors(shoot, visitors, created_by_id)
@@ -57,17 +58,29 @@ def update_shoot(
 
     try:
         with BaseRepository.transaction():
-            removed_ids = old_attendee_ids - new_attendee_ids
-            removed_users = UserRepository.get_by_ids_with_membership(list(removed_ids))
-            for user_id in removed_ids:
-                user = removed_users.get(user_id)
-                if user and user.membership:
-                    user.membership.add_credits(1)
+            removed_ids = sorted(old_attendee_ids - new_attendee_ids)
+            if removed_ids:
+                refunded = MembershipRepository.lock_balances_for_users(removed_ids)
+                MembershipRepository.adjust_balance([row.id for row in refunded], "purchased_credits", 1)
+                credits.append_entries(
+                    [
+                        credits.ledger_row(
+                            membership_id=row.id,
+                            user_id=row.user_id,
+                            column="purchased_credits",
+                            delta=1,
+                            balance_after=(row.purchased_credits or 0) + 1,
+                            reason="shoot_refund",
+                            shoot_id=shoot.id,
+                        )
+                        for row in refunded
+                    ]
+                )
+                ShootRepository.remove_attendees(shoot, removed_ids)
+
+            added_ids = [user_id for user_id in (attendee_ids or []) if user_id not in old_attendee_ids]
+            _record_attendance(shoot, added_ids, warnings)
 
-            added_ids = new_attendee_ids - old_attendee_ids
-            _filter_shoot_attendees(list(added_ids), shoot, warnings)
-
-            shoot.users = [u for u in shoot.users if u.id in new_attendee_ids]
             shoot.date = shoot_date
             shoot.location = ShootLocation[location]
             shoot.description = description
@@ -90,6 +103,8 @@ def update_shoot(
 def _add_visitors(shoot: Shoot, visitors: list[dict], created_by_id: int | None) -> None:
     fee_cents: int = settings.get("visitor_shoot_fee")
     sumup_fee_pct = settings.get("sumup_fee_percentage")
+    by_id = created_by_id or 1
+    entries: list[dict] = []
 
     for v in visitors:
         visitor = ShootVisitor(
@@ -102,32 +117,34 @@ def _add_visitors(shoot: Shoot, visitors: list[dict], created_by_id: int | None)
 
         source = "SumUp" if v["payment_method"] == "sumup" else "Cash"
         description = f"Visitor shoot fee - {v['name']} ({v['club']})"
-        by_id = created_by_id or 1
-        result = finance.add_transaction(
-            txn_type="income",
-            txn_date=shoot.date,
-            amount_cents=fee_cents,
-            category="shoot_fees",
-            description=description,
-            created_by_id=by_id,
-            source=source,
+        entries.append(
+            {
+                "txn_type": "income",
+                "txn_date": shoot.date,
+                "amount_cents": fee_cents,
+                "category": "shoot_fees",
+                "description": description,
+                "created_by_id": by_id,
+                "source": source,
+            }
         )
-        if not result.success:
-            raise RuntimeError(result.message)
 
         if v["payment_method"] == "sumup" and sumup_fee_pct is not None:
             pct = float(sumup_fee_pct)
-            fee_expense_cents = int(round(fee_cents * pct / 100.0))
-            result = finance.add_transaction(
-                txn_type="expense",
-                txn_date=shoot.date,
-                amount_cents=fee_expense_cents,
-                category="payment_processing_fees",
-                description=f"SumUp fee ({pct}%) on {description}",
-                created_by_id=by_id,
+            entries.append(
+                {
+                    "txn_type": "expense",
+                    "txn_date": shoot.date,
+                    "amount_cents": int(round(fee_cents * pct / 100.0)),
+                    "category": "payment_processing_fees",
+                    "description": f"SumUp fee ({pct}%) on {description}",
+                    "created_by_id": by_id,
+                }
             )
-            if not result.success:
-                raise RuntimeError(result.message)
+
+    result = finance.add_transactions(entries)
+    if not result.success:
+        raise RuntimeError(result.message)
 
 
 def get_all_shoots_paginated(page: int = 1, per_page: int = 10) -> Pagination:
@@ -138,20 +155,55 @@ def get_shoot_by_id(shoot_id: int) -> Shoot | None:
     return ShootRepository.get_by_id(shoot_id)
 
 
+@cached(ttl_seconds=30, maxsize=1, tags=("memberships", "users"))
 def get_active_members_with_credits() -> list[tuple[int, str]]:
     active_members = UserRepository.get_active_with_membership()
     return [(u.id, f"{u.name} ({u.membership.credits_remaining()} credits)") for u in active_members if u.membership and u.membership.is_active()]
 
 
-def _filter_shoot_attendees(attendee_ids: list[int], shoot: Shoot, warnings: list[Any]) -> None:
-    users_by_id = UserRepository.get_by_ids_with_membership(attendee_ids)
+def _record_attendance(shoot: Shoot, attendee_ids: list[int], warnings: list[Any]) -> None:
+    """Charge one credit per attendee and record attendance in bulk.
+
+    Balances are read under a row lock and partitioned by the column the
+    credit comes out of, so the whole batch costs one SELECT, at most two
+    UPDATEs and one multi-row INSERT each for attendance and the credit ledger,
+    regardless of how many archers attend.
+    """
+    attendee_ids = list(dict.fromkeys(attendee_ids))
+    balances = {row.user_id: row for row in MembershipRepository.lock_balances_for_users(attendee_ids)}
+    charged: dict[str, list[int]] = {"initial_credits": [], "purchased_credits": []}
+    attending: list[int] = []
+    ledger: list[dict] = []
+
     for user_id in attendee_ids:
-        user = users_by_id.get(user_id)
-        if user and user.membership:
-            if user.membership.use_credit(allow_negative=True):
-                shoot.users.append(user)
-                total_credits = user.membership.credits_remaining()
-                if total_credits < 0:
-                    warnings.append(f"{user.name} now has {total_credits} credits (negative balance).")
-            else:
-                warnings.append(f"{user.name} cannot be added (inactive membership).")
+        row = balances.get(user_id)
+        if row is None:
+            continue
+        initial = row.initial_credits or 0
+        purchased = row.purchased_credits or 0
+        active = Membership.status_is_active(row.status, row.expiry_date)
+        bucket = Membership.credit_bucket(initial, purchased, active=active, allow_negative=True)
+        if bucket is None:
+            warnings.append(f"{row.name} cannot be added (inactive membership).")
+            continue
+        charged[bucket].append(row.id)
+        attending.append(user_id)
+        ledger.append(
+            credits.ledger_row(
+                membership_id=row.id,
+                user_id=user_id,
+                column=bucket,
+                delta=-1,
+                balance_after=(initial if bucket == "initial_credits" else purchased) - 1,
+                reason="shoot_attendance",
+                shoot_id=shoot.id,
+            )
+        )
+        total_credits = initial + purchased - 1
+        if total_credits < 0:
+            warnings.append(f"{row.name} now has {total_credits} credits (negative balance).")
+
+    for column, membership_ids in charged.items():
+        MembershipRepository.adjust_balance(membership_ids, column, -1)
+    credits.append_entries(ledger)
+    ShootRepository.add_attendees(shoot, attending)
@@ -1,21 +1,40 @@
 import logging
 import uuid
+from collections.abc import Callable
 from typing import Any
 
-from sumup import APIError, Sumup
-from sumup.checkouts import CreateCheckoutBody
-
 from app.core.config import get_settings
+from app.exceptions import DeadlineExceeded
+from app.metrics import SUMUP_ERRORS, SUMUP_REQUEST_DURATION, observe_duration
+from app.tracing import start_span
+from app.utils.deadline import capped
+from app.utils.deadline import check as check_deadline
 
 logger = logging.getLogger(__name__)
 
 
+def _timed_call[T](operation: str, call: Callable[[], T]) -> T:
+    check_deadline()
+    try:
+        with start_span(f"sumup {operation}", kind="CLIENT"), observe_duration(SUMUP_REQUEST_DURATION, operation=operation):
+            return call()
+    except Exception:
+        SUMUP_ERRORS.inc(operation=operation)
+        raise
+
+
 class SumUpService:
     def __init__(self, api_key: str | None = None, merchant_code: str | None = None) -> None:
+        # The SDK takes ~0.3s to import; only pay for it when a payment needs it.
+        import httpx
+        from sumup import Sumup
+
         settings = get_settings()
         self.api_key = api_key or settings.sumup_api_key
         self.merchant_code = merchant_code or settings.sumup_merchant_code
-        self.client = Sumup(api_key=self.api_key, base_url=settings.sumup_api_url)
+        # Instances are made per request, so calls get what is left of its budget.
+        timeout = httpx.Timeout(capped(settings.sumup_timeout_seconds))
+        self.client = Sumup(api_key=self.api_key, base_url=settings.sumup_api_url, timeout=timeout)
 
     def create_checkout(
         self,
@@ -25,6 +44,9 @@ class SumUpService:
         checkout_reference: str = "",
         merchant_code: str | None = None,
     ) -> dict[str, Any] | None:
+        from sumup import APIError
+        from sumup.checkouts import CreateCheckoutBody
+
         try:
             merchant_code = merchant_code or self.merchant_code
             if not merchant_code:
@@ -49,7 +71,7 @@ class SumUpService:
                 merchant_code,
                 description,
             )
-            response = self.client.checkouts.create(body=checkout_body)
+            response = _timed_call("create_checkout", lambda: self.client.checkouts.create(body=checkout_body))
             logger.debug("SumUp create_checkout raw response: %r", response)
             if response and hasattr(response, "id"):
                 result = {
@@ -76,14 +98,18 @@ class SumUpService:
         except ValueError as exc:
             logger.error("Configuration error: %s", exc)
             return None
+        except DeadlineExceeded:
+            raise
         except Exception as exc:
             logger.error("Error creating SumUp checkout: %s", exc)
             return None
 
     def get_checkout(self, checkout_id: str) -> Any | None:
+        from sumup import APIError
+
         try:
             logger.debug("SumUp get_checkout request: id=%s", checkout_id)
-            response = self.client.checkouts.get(id=checkout_id)
+            response = _timed_call("get_checkout", lambda: self.client.checkouts.get(id=checkout_id))
             logger.debug("SumUp get_checkout raw response: %r", response)
             if response:
                 logger.info(
@@ -101,6 +127,8 @@ class SumUpService:
                 exc.body,
             )
             return None
+        except DeadlineExceeded:
+            raise
         except Exception as exc:
             logger.error("Error getting SumUp checkout %s: %s", checkout_id, exc)
             return None
@@ -112,6 +140,8 @@ class SumUpService:
                 return False
             status = checkout.status if hasattr(checkout, "status") else None
             return status == "PAID"
+        except DeadlineExceeded:
+            raise
         except Exception as exc:
             logger.error("Error verifying SumUp payment: %s", exc)
             return False
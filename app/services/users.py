@@ -11,8 +11,8 @@ from app.events.payloads import emit_password_reset_requested, emit_user_activat
 from app.models.credit import Credit
 from app.models.membership import Membership
 from app.models.user import User
-from app.repositories import BaseRepository, CreditRepository, MembershipRepository, RBACRepository, UserRepository
-from app.services import settings
+from app.repositories import BaseRepository, CreditRepository, MembershipRepository, RBACRepository, ShootRepository, UserRepository
+from app.services import credits, settings
 from app.services.result import ServiceResult
 
 logger = logging.getLogger(__name__)
@@ -39,6 +39,19 @@ def get_all_users_paginated(
     return UserRepository.get_all_paginated(page=page, per_page=per_page, search=search, membership_filter=membership_filter)
 
 
+def search_members(query: str, limit: int = 10) -> list[dict]:
+    """Ranked type-ahead matches for the admin member search box."""
+    if not query.strip():
+        return []
+    return [{"id": row.id, "name": row.name, "email": row.email, "phone": row.phone} for row in UserRepository.search_typeahead(query, limit=limit)]
+
+
+def rebuild_search_index() -> int:
+    count = UserRepository.rebuild_search_tokens()
+    UserRepository.save()
+    return count
+
+
 def create_user(
     *,
     name: str,
@@ -160,8 +173,12 @@ def authenticate(email: str, password: str) -> User | None:
     return None
 
 
-def get_user_shoots(user: User) -> list:
-    return sorted(user.shoots, key=lambda shoot: shoot.date, reverse=True)
+def count_user_shoots(user_id: int) -> int:
+    return ShootRepository.count_attended_by_user(user_id)
+
+
+def get_user_shoots_paginated(user_id: int, *, page: int = 1, per_page: int = 20) -> Pagination:
+    return ShootRepository.get_attended_by_user_paginated(user_id, page=page, per_page=per_page)
 
 
 def get_user_payments_paginated(user_id: int, *, page: int = 1, per_page: int = 5) -> Pagination:
@@ -226,6 +243,7 @@ def update_member(
     membership_expiry_date: date | None = None,
     membership_initial_credits: int | None = None,
     membership_purchased_credits: int | None = None,
+    actor_id: int | None = None,
 ) -> ServiceResult[None]:
     user.name = name
     user.email = email
@@ -246,13 +264,17 @@ def update_member(
             user.membership.start_date = membership_start_date  # type: ignore[attr-defined]
         if membership_expiry_date:
             user.membership.expiry_date = membership_expiry_date  # type: ignore[attr-defined]
-        if membership_initial_credits is not None:
-            user.membership.initial_credits = membership_initial_credits  # type: ignore[attr-defined]
-        if membership_purchased_credits is not None:
-            user.membership.purchased_credits = membership_purchased_credits  # type: ignore[attr-defined]
 
     try:
-        UserRepository.save()
+        with BaseRepository.transaction():
+            if user.membership and (membership_initial_credits is not None or membership_purchased_credits is not None):
+                credits.set_balances(
+                    user.membership,
+                    reason="admin_edit",
+                    initial_credits=membership_initial_credits,
+                    purchased_credits=membership_purchased_credits,
+                    actor_id=actor_id,
+                )
         return ServiceResult.ok(message=f"Member {user.name} updated successfully!")
     except Exception as exc:
         logger.error("Error updating member: %s", exc)
@@ -287,17 +309,19 @@ def adjust_member_credits(
     if quantity < 1:
         return ServiceResult.fail("Please enter a valid number of credits (minimum 1).")
     if action == "remove":
-        member.membership.remove_credits(quantity)
         signed_amount = -quantity
         verb = "Removed"
         preposition = "from"
     else:
-        member.membership.add_credits(quantity)
         signed_amount = quantity
         verb = "Added"
         preposition = "to"
     try:
         with BaseRepository.transaction():
+            if action == "remove":
+                credits.remove_credits(member.membership, quantity, reason="admin_adjustment", actor_id=admin_user_id)
+            else:
+                credits.add_credits(member.membership, quantity, reason="admin_adjustment", actor_id=admin_user_id)
             CreditRepository.add(
                 Credit(
                     user_id=member.id,
@@ -1,19 +1,39 @@
 from __future__ import annotations
 
+import hashlib
 from datetime import UTC, datetime
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urlencode, urljoin
 
-from fastapi import Request
-from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+from starlette.templating import Jinja2Templates
 
 from app.core.config import get_settings
-from app.dependencies import get_csrf_token
 from app.routes_map import FALLBACK_ROUTES
 from app.services import settings as app_settings
 
+if TYPE_CHECKING:
+    from starlette.requests import Request
+    from starlette.responses import Response
+
 TEMPLATES_DIR = Path(__file__).parent / "resources" / "templates"
+
+
+def _bytecode_cache() -> FileSystemBytecodeCache:
+    directory = get_settings().template_cache_dir
+    if not directory:
+        return FileSystemBytecodeCache()
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(directory)
+
+
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+# Templates only change on deploy outside development, so skip the stat call
+# auto_reload makes on every render.
+templates.env.auto_reload = get_settings().is_development
+templates.env.bytecode_cache = _bytecode_cache()
 
 _route_names: dict[str, str] = dict(FALLBACK_ROUTES)
 
@@ -102,6 +122,17 @@ def endpoint_is(request: Request, names: str | list[str]) -> bool:
     return route_name in names
 
 
+def precompile_templates() -> int:
+    """Load every template into the environment cache; returns how many.
+
+    Templates already compiled by another worker come from the bytecode cache.
+    """
+    names = templates.env.list_templates()
+    for name in names:
+        templates.env.get_template(name)
+    return len(names)
+
+
 def setup_template_globals() -> None:
     templates.env.globals.update(
         {
@@ -112,6 +143,51 @@ def setup_template_globals() -> None:
     )
 
 
+def render_anonymous_page(name: str) -> str:
+    """Render ``name`` as any anonymous visitor sees it: no request, session, CSRF token or flashes.
+
+    For pages rendered once and shared, such as the anonymous 404 page.
+    """
+    anonymous = AnonymousUser()
+    return templates.get_template(name).render(
+        current_user=anonymous,
+        user=anonymous,
+        errors={},
+        now=datetime.now(UTC),
+        get_flashed_messages=lambda with_categories=False: [],
+        **_feature_flags(),
+    )
+
+
+@cache
+def templates_version() -> str:
+    """``BUILD_VERSION``, or a hash of every template file when it is unset."""
+    build_version = get_settings().build_version
+    if build_version:
+        return build_version
+    digest = hashlib.sha256()
+    for path in sorted(TEMPLATES_DIR.rglob("*.html")):
+        digest.update(path.relative_to(TEMPLATES_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """A 304 when the conditional GET's ``If-None-Match`` lists ``etag``, else None.
+
+    Visitors with flash messages waiting always get the full page.
+    """
+    from starlette.responses import Response
+
+    header = request.headers.get("if-none-match")
+    if not header or "_flashes" in request.session:
+        return None
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if "*" in candidates or etag.removeprefix("W/") in candidates:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
 def render(
     request: Request,
     name: str,
@@ -119,12 +195,17 @@ def render(
     user=None,
     status_code: int = 200,
 ):
+    # app.dependencies pulls in FastAPI, which mail-only callers (scheduler
+    # jobs, the CLI) never need.
+    from app.dependencies import LazyCsrfToken
+
     current_user = user if user is not None else AnonymousUser()
+    sessionless = not request.session
     flashes = _pop_flashes(request)
 
     ctx: dict = {
         "request": request,
-        "csrf_token": get_csrf_token(request),
+        "csrf_token": LazyCsrfToken(request),
         "current_user": current_user,
         "user": current_user,
         "errors": {},
@@ -137,4 +218,10 @@ def render(
         ctx["errors"] = request.session.pop("validation_errors")
     if context:
         ctx.update(context)
-    return templates.TemplateResponse(request, name, ctx, status_code=status_code)
+    response = templates.TemplateResponse(request, name, ctx, status_code=status_code)
+    max_age = get_settings().public_page_max_age_seconds
+    # Still sessionless after rendering: nothing user-specific, no token minted.
+    if max_age and sessionless and not request.session and request.method == "GET" and status_code == 200:
+        response.headers["Cache-Control"] = f"public, max-age={max_age}"
+        response.headers.add_vary_header("Cookie")
+    return response
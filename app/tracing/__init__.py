@@ -0,0 +1,227 @@
+"""Lightweight request tracing with OpenTelemetry-shaped spans.
+
+Spans carry W3C trace and span ids, honour an incoming ``traceparent`` header,
+and are written one per line as OTLP/JSON-style objects to stdout or a file
+(``TRACE_EXPORT``), ready for a collector's file/stdout receiver. The current
+span lives in a ``ContextVar``, so it follows ``asyncio`` tasks and
+``asyncio.to_thread``: a deferred handler started after the response becomes a
+child of the request that queued it.
+
+With no exporter configured every ``start_span`` is a no-op.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import IO, Any
+
+SERVICE_NAME = "south-east-archers"
+
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+@dataclass(frozen=True, slots=True)
+class SpanContext:
+    trace_id: str
+    span_id: str
+    sampled: bool = True
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    context: SpanContext
+    parent_span_id: str | None = None
+    kind: str = "INTERNAL"
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+    status: str = "UNSET"
+    status_message: str | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, message: str) -> None:
+        self.status = "ERROR"
+        self.status_message = message
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            if self.context.sampled and _tracer.exporter is not None:
+                _tracer.exporter.export(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "traceId": self.context.trace_id,
+            "spanId": self.context.span_id,
+            "name": self.name,
+            "kind": f"SPAN_KIND_{self.kind}",
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "attributes": self.attributes,
+            "status": {"code": f"STATUS_CODE_{self.status}"},
+            "resource": {"service.name": SERVICE_NAME},
+        }
+        if self.parent_span_id:
+            data["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            data["status"]["message"] = self.status_message
+        return data
+
+
+class _NoopSpan:
+    """Returned while tracing is disabled so callers never need to check."""
+
+    context = None
+
+    @property
+    def name(self) -> str:
+        return ""
+
+    @name.setter
+    def name(self, value: str) -> None:
+        pass
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_error(self, message: str) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class JsonLinesExporter:
+    def __init__(self, stream: IO[str], *, close: bool = False) -> None:
+        self._stream = stream
+        self._close = close
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+    def shutdown(self) -> None:
+        if self._close:
+            self._stream.close()
+
+
+class _Tracer:
+    def __init__(self) -> None:
+        self.exporter: JsonLinesExporter | None = None
+        self.sample_ratio = 1.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+
+_tracer = _Tracer()
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def configure(export: str | None, *, sample_ratio: float = 1.0) -> None:
+    """``export`` is ``"stdout"``, a file path to append to, or ``None`` to disable tracing."""
+    if _tracer.exporter is not None:
+        _tracer.exporter.shutdown()
+    if not export:
+        _tracer.exporter = None
+    elif export == "stdout":
+        _tracer.exporter = JsonLinesExporter(sys.stdout)
+    else:
+        _tracer.exporter = JsonLinesExporter(open(export, "a", encoding="utf-8"), close=True)  # noqa: SIM115 - closed on reconfigure
+    _tracer.sample_ratio = sample_ratio
+
+
+def set_exporter(exporter: JsonLinesExporter | None, *, sample_ratio: float = 1.0) -> None:
+    _tracer.exporter = exporter
+    _tracer.sample_ratio = sample_ratio
+
+
+def is_enabled() -> bool:
+    return _tracer.enabled
+
+
+def current_span_context() -> SpanContext | None:
+    current = _current_span.get()
+    return current.context if current is not None else None
+
+
+def parse_traceparent(header: str | None) -> SpanContext | None:
+    match = _TRACEPARENT_RE.match((header or "").strip().lower())
+    if match is None or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return SpanContext(match.group(1), match.group(2), sampled=int(match.group(3), 16) & 1 == 1)
+
+
+def new_span(name: str, *, kind: str = "INTERNAL", attributes: dict[str, Any] | None = None, parent: SpanContext | None = None) -> Span | _NoopSpan:
+    """Start a span without making it current (for leaf spans such as SQL statements)."""
+    if not _tracer.enabled:
+        return NOOP_SPAN
+    parent = parent if parent is not None else current_span_context()
+    if parent is None:
+        context = SpanContext(secrets.token_hex(16), secrets.token_hex(8), sampled=random.random() < _tracer.sample_ratio)
+    else:
+        context = SpanContext(parent.trace_id, secrets.token_hex(8), sampled=parent.sampled)
+    return Span(
+        name=name,
+        context=context,
+        parent_span_id=parent.span_id if parent is not None else None,
+        kind=kind,
+        attributes=dict(attributes or {}),
+    )
+
+
+@contextmanager
+def start_span(name: str, *, kind: str = "INTERNAL", attributes: dict[str, Any] | None = None, parent: SpanContext | None = None) -> Iterator[Span | _NoopSpan]:
+    """Run the block inside a new current span; exceptions mark it as an error."""
+    span = new_span(name, kind=kind, attributes=attributes, parent=parent)
+    if not isinstance(span, Span):
+        yield span
+        return
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.set_error(f"{type(exc).__name__}: {exc}")
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end()
+
+
+__all__ = [
+    "NOOP_SPAN",
+    "JsonLinesExporter",
+    "Span",
+    "SpanContext",
+    "configure",
+    "current_span_context",
+    "is_enabled",
+    "new_span",
+    "parse_traceparent",
+    "set_exporter",
+    "start_span",
+]
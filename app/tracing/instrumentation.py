@@ -0,0 +1,148 @@
+"""Automatic spans for SQL statements, repository methods and ``ServiceResult``-returning services."""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import inspect
+import pkgutil
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.tracing import current_span_context, is_enabled, new_span
+
+MAX_STATEMENT_LENGTH = 1000
+_SPANS_KEY = "tracing_statement_spans"
+
+
+def _before_cursor_execute(conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+    # SQL outside any request or job span would only produce orphan traces.
+    if not is_enabled() or current_span_context() is None:
+        return
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+    span = new_span(
+        f"db {operation}",
+        kind="CLIENT",
+        attributes={
+            "db.system": conn.dialect.name,
+            "db.operation": operation,
+            "db.statement": statement[:MAX_STATEMENT_LENGTH],
+        },
+    )
+    conn.info.setdefault(_SPANS_KEY, []).append(span)
+
+
+def _after_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    spans = conn.info.get(_SPANS_KEY)
+    if spans:
+        spans.pop().end()
+
+
+def _handle_error(exception_context) -> None:
+    connection = exception_context.connection
+    spans = connection.info.get(_SPANS_KEY) if connection is not None else None
+    if spans:
+        span = spans.pop()
+        span.set_error(str(exception_context.original_exception))
+        span.end()
+
+
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def _returns_service_result(function: Callable[..., Any]) -> bool:
+    annotation = inspect.get_annotations(function).get("return")
+    return annotation is not None and "ServiceResult" in str(annotation)
+
+
+def trace_service_call[F: Callable[..., Any]](function: F, span_name: str) -> F:
+    from app.services.result import ServiceResult
+    from app.tracing import start_span
+
+    @functools.wraps(function)
+    def _traced(*args: Any, **kwargs: Any) -> Any:
+        if not is_enabled():
+            return function(*args, **kwargs)
+        with start_span(span_name) as span:
+            result = function(*args, **kwargs)
+            if isinstance(result, ServiceResult):
+                span.set_attribute("service.success", result.success)
+                if result.error_code is not None:
+                    span.set_attribute("service.error_code", str(result.error_code))
+            return result
+
+    _traced.__traced__ = True  # type: ignore[attr-defined]
+    return _traced  # type: ignore[return-value]
+
+
+def instrument_services() -> int:
+    """Wrap every public ``ServiceResult``-returning function in ``app.services``.
+
+    Functions are replaced on their module, so only calls made as
+    ``users.create_user(...)`` (the convention throughout the app) go through
+    the span; a ``from app.services.x import f`` taken earlier keeps the
+    unwrapped function. Idempotent; returns the number of functions wrapped by
+    this call.
+    """
+    import app.services as services_package
+
+    wrapped = 0
+    for module_info in pkgutil.iter_modules(services_package.__path__):
+        module = importlib.import_module(f"{services_package.__name__}.{module_info.name}")
+        for name, function in list(vars(module).items()):
+            if (
+                name.startswith("_")
+                or not inspect.isfunction(function)
+                or function.__module__ != module.__name__
+                or getattr(function, "__traced__", False)
+                or not _returns_service_result(function)
+            ):
+                continue
+            setattr(module, name, trace_service_call(function, f"service {module_info.name}.{name}"))
+            wrapped += 1
+    return wrapped
+
+
+def trace_repository_call[F: Callable[..., Any]](function: F, span_name: str) -> F:
+    from app.tracing import start_span
+
+    @functools.wraps(function)
+    def _traced(*args: Any, **kwargs: Any) -> Any:
+        # Like SQL statements, repository calls outside a request or job span are not traced.
+        if not is_enabled() or current_span_context() is None:
+            return function(*args, **kwargs)
+        with start_span(span_name):
+            return function(*args, **kwargs)
+
+    _traced.__traced__ = True  # type: ignore[attr-defined]
+    return _traced  # type: ignore[return-value]
+
+
+def instrument_repositories() -> int:
+    """Wrap every public static method of the repositories in ``app.repositories``.
+
+    Methods are replaced on their class, so ``UserRepository.get_by_email(...)``
+    gets a span with the method's SQL statements beneath it. Context managers
+    (``BaseRepository.transaction``) are skipped: their span would end before
+    the block runs. Idempotent; returns the number of methods wrapped by this call.
+    """
+    import app.repositories as repositories_package
+
+    wrapped = 0
+    for class_name in repositories_package.__all__:
+        repository = getattr(repositories_package, class_name)
+        for name, member in list(vars(repository).items()):
+            if name.startswith("_") or not isinstance(member, staticmethod):
+                continue
+            function = member.__func__
+            if getattr(function, "__traced__", False) or inspect.isgeneratorfunction(inspect.unwrap(function)):
+                continue
+            setattr(repository, name, staticmethod(trace_repository_call(function, f"repository {class_name}.{name}")))
+            wrapped += 1
+    return wrapped
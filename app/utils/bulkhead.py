@@ -0,0 +1,56 @@
+"""Per-route concurrency limits (bulkheads) for expensive endpoints.
+
+Each limited route has a counter of requests in flight in this worker; a
+request that would go over the limit is turned away at once with a 503
+instead of queueing for one of anyio's worker threads, so a burst of PDF
+exports cannot hold every thread while member logins wait. Limits are per
+process: with N uvicorn workers a route runs at most N * limit at a time.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from app.core.config import get_settings
+from app.metrics import BULKHEAD_IN_FLIGHT, BULKHEAD_LIMIT, BULKHEAD_REJECTIONS
+
+_bulkheads: dict[str, Bulkhead] = {}
+_lock = threading.Lock()
+
+
+class Bulkhead:
+    def __init__(self, name: str, limit: int) -> None:
+        self.name = name
+        self.limit = limit
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        BULKHEAD_LIMIT.set(limit, route=name)
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.in_flight >= self.limit:
+                BULKHEAD_REJECTIONS.inc(route=self.name)
+                return False
+            self.in_flight += 1
+        BULKHEAD_IN_FLIGHT.inc(route=self.name)
+        return True
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+        BULKHEAD_IN_FLIGHT.dec(route=self.name)
+
+
+def get_bulkhead(name: str, default_limit: int) -> Bulkhead:
+    """The shared bulkhead for route ``name``; ``ROUTE_CONCURRENCY_LIMITS`` overrides ``default_limit``."""
+    bulkhead = _bulkheads.get(name)
+    if bulkhead is None:
+        limit = get_settings().route_concurrency_limits.get(name, default_limit)
+        with _lock:
+            bulkhead = _bulkheads.setdefault(name, Bulkhead(name, limit))
+    return bulkhead
+
+
+def clear_bulkheads() -> None:
+    with _lock:
+        _bulkheads.clear()
@@ -0,0 +1,327 @@
+"""Small in-process TTL caches and cached service reads.
+
+Each worker keeps its own copy, so a value can be up to ``ttl_seconds`` stale
+in other workers after a write; keep TTLs short and only cache plain values
+(rows, numbers, dicts), never ORM instances bound to a request's session.
+
+``@cached(ttl_seconds=..., tags=...)`` wraps a service read in an LRU
+``TTLCache`` keyed by its arguments. Tags are table names: a commit that wrote
+to one of them (``BaseRepository.save()``/``transaction()`` or any other
+commit, see ``app.db.write_tracking``) empties every cache tagged with it in
+this worker. With ``SERVICE_CACHE_REDIS`` and ``REDIS_URL`` set, values are
+also shared through Redis under keys that include a version counter per
+tag; a commit bumps the counters. Each worker re-reads the counters at most
+every ``SERVICE_CACHE_VERSION_CHECK_MS``, so other workers stop using what they
+cached before the write within that interval. Shared values are stored as
+JSON: rows, ``Pagination`` pages, dates and plain containers round-trip, rows
+coming back as named tuples.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict, namedtuple
+from collections.abc import Callable, Hashable, Iterable
+from datetime import date, datetime
+from typing import Any, cast
+
+from sqlalchemy import Row
+
+from app.core.config import get_settings
+from app.db.pagination import Pagination
+from app.db.write_tracking import on_commit_tables
+from app.metrics import CACHE_EVICTIONS, CACHE_HITS, CACHE_MISSES
+
+logger = logging.getLogger(__name__)
+
+_caches: weakref.WeakSet[TTLCache] = weakref.WeakSet()
+
+
+class TTLCache[T]:
+    def __init__(
+        self,
+        ttl_seconds: float,
+        *,
+        maxsize: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        on_evict: Callable[[], None] | None = None,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._clock = clock
+        self._on_evict = on_evict
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+        # Bumped by every invalidation so a value computed before a concurrent
+        # write is never stored after it.
+        self._generation = 0
+        _caches.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Return the cached value for ``key``, computing it with ``factory`` when missing or expired."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry[1]
+            generation = self._generation
+        value = factory()
+        if self.ttl_seconds > 0:
+            with self._lock:
+                if generation == self._generation:
+                    self._store(key, now + self.ttl_seconds, value)
+        return value
+
+    def set(self, key: Hashable, value: T) -> None:
+        with self._lock:
+            self._store(key, self._clock() + self.ttl_seconds, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def _store(self, key: Hashable, expires_at: float, value: T) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        if self.maxsize is None:
+            return
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            if self._on_evict is not None:
+                self._on_evict()
+
+
+def clear_all_caches() -> None:
+    """Empty every TTL cache in this process (for tests)."""
+    for cache in list(_caches):
+        cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# Redis tier
+# ---------------------------------------------------------------------------
+_REDIS_PREFIX = "cache:"
+_redis_client = None
+_redis_unavailable = False
+
+
+def _get_redis():
+    global _redis_client, _redis_unavailable
+    settings = get_settings()
+    # Tests always stay in-process so REDIS_URL in .env cannot leak state.
+    if settings.is_testing or not settings.service_cache_redis or not settings.redis_url:
+        return None
+    if _redis_unavailable:
+        return None
+    if _redis_client is not None:
+        return _redis_client
+    try:
+        import redis
+
+        _redis_client = redis.Redis.from_url(settings.redis_url)
+        _redis_client.ping()
+        return _redis_client
+    except Exception as exc:
+        logger.warning("Redis service cache unavailable, caching in-process only: %s", exc)
+        _redis_unavailable = True
+        return None
+
+
+def reset_redis_tier() -> None:
+    """Forget the cached Redis client and tag versions (for tests)."""
+    global _redis_client, _redis_unavailable
+    _redis_client = None
+    _redis_unavailable = False
+    with _versions_lock:
+        _known_versions.clear()
+
+
+def _tag_key(tag: str) -> str:
+    return f"{_REDIS_PREFIX}tag:{tag}"
+
+
+# Tag versions this worker last read from Redis: tag -> (read at, version).
+_known_versions: dict[str, tuple[float, str]] = {}
+_versions_lock = threading.Lock()
+
+
+def _tag_versions(client: Any, tags: tuple[str, ...]) -> tuple[str, ...]:
+    if not tags:
+        return ()
+    now = time.monotonic()
+    max_age = get_settings().service_cache_version_check_ms / 1000
+    with _versions_lock:
+        known = [_known_versions.get(tag) for tag in tags]
+    if all(entry is not None and now - entry[0] < max_age for entry in known):
+        return tuple(entry[1] for entry in known)  # type: ignore[index]
+    versions = tuple((version or b"0").decode() for version in client.mget([_tag_key(tag) for tag in tags]))
+    with _versions_lock:
+        for tag, version in zip(tags, versions, strict=True):
+            _known_versions[tag] = (now, version)
+    return versions
+
+
+def _forget_versions(tags: Iterable[str]) -> None:
+    with _versions_lock:
+        for tag in tags:
+            _known_versions.pop(tag, None)
+
+
+def _publish_tags(tags: Iterable[str]) -> None:
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        pipeline = client.pipeline(transaction=False)
+        for tag in tags:
+            pipeline.incr(_tag_key(tag))
+        pipeline.execute()
+    except Exception:
+        logger.exception("Failed to publish cache invalidation for %s", sorted(tags))
+
+
+# ---------------------------------------------------------------------------
+# @cached service reads
+# ---------------------------------------------------------------------------
+_tagged: dict[str, list[TTLCache[Any]]] = {}
+
+
+def invalidate_tags(tags: Iterable[str]) -> None:
+    """Drop every cached read tagged with one of ``tags``, here and (with the Redis tier) in every worker."""
+    known = {tag for tag in tags if tag in _tagged}
+    if not known:
+        return
+    for tag in known:
+        for cache in _tagged[tag]:
+            cache.clear()
+    # This worker sees its own write at once; others within the check interval.
+    _forget_versions(known)
+    _publish_tags(known)
+
+
+@functools.cache
+def _row_type(fields: tuple[str, ...]) -> type:
+    return namedtuple("CachedRow", fields)
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, Row):
+        return {"__row__": dict(value._mapping)}
+    if isinstance(value, Pagination):
+        return {"__page__": {"items": value.items, "page": value.page, "per_page": value.per_page, "total": value.total}}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    raise TypeError(f"{type(value).__name__} cannot be cached in Redis")
+
+
+def _from_json(data: dict[str, Any]) -> Any:
+    if "__row__" in data:
+        fields = data["__row__"]
+        return _row_type(tuple(fields))(**fields)
+    if "__page__" in data:
+        return Pagination(**data["__page__"])
+    if "__datetime__" in data:
+        return datetime.fromisoformat(data["__datetime__"])
+    if "__date__" in data:
+        return date.fromisoformat(data["__date__"])
+    return data
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, default=_to_json, separators=(",", ":")).encode()
+
+
+def _loads(payload: bytes) -> Any:
+    return json.loads(payload, object_hook=_from_json)
+
+
+def _call_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    return (args, tuple(sorted(kwargs.items()))) if kwargs else args
+
+
+def cached[**P, R](*, ttl_seconds: float, maxsize: int = 128, tags: Iterable[str] = ()) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Cache a service read by its (hashable) arguments for ``ttl_seconds``, keeping at most ``maxsize`` results.
+
+    ``SERVICE_CACHE_TTLS`` overrides the TTL by name (``"news.get_published_articles"``);
+    0 turns caching off for that function.
+    """
+    tag_names = tuple(sorted(tags))
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        name = f"{func.__module__.removeprefix('app.services.')}.{func.__qualname__}"
+        ttl = get_settings().service_cache_ttls.get(name, ttl_seconds)
+        cache: TTLCache[R] = TTLCache(ttl, maxsize=maxsize, on_evict=lambda: CACHE_EVICTIONS.inc(function=name))
+        for tag in tag_names:
+            _tagged.setdefault(tag, []).append(cache)
+
+        def _load(client: Any, redis_key: str | None, args: tuple[Any, ...], kwargs: dict[str, Any]) -> R:
+            if redis_key is not None:
+                try:
+                    payload = client.get(redis_key)
+                except Exception:
+                    logger.exception("Redis service cache read failed for %s", name)
+                    payload = None
+                if payload is not None:
+                    CACHE_HITS.inc(function=name, tier="redis")
+                    return cast(R, _loads(payload))
+            CACHE_MISSES.inc(function=name)
+            value = func(*args, **kwargs)
+            if redis_key is not None:
+                try:
+                    client.set(redis_key, _dumps(value), ex=max(1, round(ttl)))
+                except Exception:
+                    logger.exception("Redis service cache write failed for %s", name)
+            return value
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            key = _call_key(args, kwargs)
+            client = _get_redis() if ttl > 0 else None
+            redis_key = None
+            if client is not None:
+                try:
+                    versions = _tag_versions(client, tag_names)
+                except Exception:
+                    logger.exception("Redis service cache unavailable for %s", name)
+                    client = None
+                else:
+                    # Entries cached under older tag versions stop matching
+                    # once any worker commits to one of the tables.
+                    key = (versions, key)
+                    redis_key = f"{_REDIS_PREFIX}{name}:{':'.join(versions)}:{args!r}:{kwargs!r}"
+            loaded = False
+
+            def _factory() -> R:
+                nonlocal loaded
+                loaded = True
+                return _load(client, redis_key, args, kwargs)
+
+            value = cache.get_or_set(key, _factory)
+            if not loaded:
+                CACHE_HITS.inc(function=name, tier="local")
+            return value
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+on_commit_tables(invalidate_tags)
@@ -0,0 +1,28 @@
+"""Rendering of article bodies to stored, sanitized HTML.
+
+Articles are written as plain text: blank lines separate paragraphs and
+single newlines are line breaks. Every character of the source is escaped,
+so the only markup in the result is the ``<p>``/``<br>`` the renderer adds and
+the HTML is safe to output unescaped. ``News`` stores the result and its hash
+(``app/models/news.py``) so the detail page neither re-renders the body nor,
+for a conditional GET, reads it at all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+
+from markupsafe import escape
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+def render_article_html(text: str | None) -> str:
+    source = (text or "").replace("\r\n", "\n").replace("\r", "\n").strip()
+    paragraphs = [paragraph.strip() for paragraph in _PARAGRAPH_BREAK.split(source) if paragraph.strip()]
+    return "\n".join("<p>" + "<br>\n".join(str(escape(line)) for line in paragraph.split("\n")) + "</p>" for paragraph in paragraphs)
+
+
+def content_hash(html: str) -> str:
+    return hashlib.sha256(html.encode()).hexdigest()
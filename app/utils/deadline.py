@@ -0,0 +1,62 @@
+"""Time budgets for the work running in the current context.
+
+``deadline(seconds)`` sets a budget for the block: each HTTP request gets one
+from ``request_deadline`` and each deferred handler from the side-effect
+executor. Blocking calls inside it use ``capped(limit)`` as their timeout
+(SMTP, SumUp), and SQL statements are cut off when it runs out
+(``app.db.statement_timeouts``), so nothing holds a worker thread
+indefinitely. Nested budgets can only shorten the one around them.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from app.exceptions import DeadlineExceeded
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Iterator[None]:
+    """Limit the block to ``seconds``; ``None`` or ``0`` leaves the current budget alone."""
+    if not seconds:
+        yield
+        return
+    ends_at = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(ends_at if current is None else min(current, ends_at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining(default: float | None = None) -> float | None:
+    """Seconds left in the current budget (never below a millisecond), or ``default`` outside one."""
+    ends_at = _deadline.get()
+    if ends_at is None:
+        return default
+    return max(ends_at - time.monotonic(), 0.001)
+
+
+def expired() -> bool:
+    ends_at = _deadline.get()
+    return ends_at is not None and time.monotonic() >= ends_at
+
+
+def capped(limit: float | None) -> float | None:
+    """``limit`` (a timeout, ``None`` for none) shortened to what is left of the current budget."""
+    left = remaining()
+    if left is None:
+        return limit
+    return left if limit is None else min(left, limit)
+
+
+def check() -> None:
+    """Raise ``DeadlineExceeded`` once the current budget is spent."""
+    if expired():
+        raise DeadlineExceeded()
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import logging
 import smtplib
+import socket
 from collections.abc import Sequence
 from email.message import EmailMessage
+from typing import Any
 
 from app.core.config import get_settings
+from app.metrics import SMTP_SEND_DURATION, observe_duration
+from app.utils.deadline import capped
 
 logger = logging.getLogger(__name__)
 
@@ -25,18 +29,23 @@ def send_email(
     if html_body:
         message.add_alternative(html_body, subtype="html")
 
+    # The socket timeout is whatever is left of the request's or handler's budget;
+    # with neither a budget nor a default timeout smtplib keeps its own default.
+    timeout = capped(socket.getdefaulttimeout())
+    options: dict[str, Any] = {} if timeout is None else {"timeout": timeout}
     try:
-        if settings.mail_use_ssl:
-            with smtplib.SMTP_SSL(settings.mail_server, settings.mail_port) as smtp:
-                if settings.mail_username and settings.mail_password:
-                    smtp.login(settings.mail_username, settings.mail_password)
-                smtp.send_message(message)
-        else:
-            with smtplib.SMTP(settings.mail_server, settings.mail_port) as smtp:
-                if settings.mail_use_tls:
-                    smtp.starttls()
-                if settings.mail_username and settings.mail_password:
-                    smtp.login(settings.mail_username, settings.mail_password)
-                smtp.send_message(message)
+        with observe_duration(SMTP_SEND_DURATION):
+            if settings.mail_use_ssl:
+                with smtplib.SMTP_SSL(settings.mail_server, settings.mail_port, **options) as smtp:
+                    if settings.mail_username and settings.mail_password:
+                        smtp.login(settings.mail_username, settings.mail_password)
+                    smtp.send_message(message)
+            else:
+                with smtplib.SMTP(settings.mail_server, settings.mail_port, **options) as smtp:
+                    if settings.mail_use_tls:
+                        smtp.starttls()
+                    if settings.mail_username and settings.mail_password:
+                        smtp.login(settings.mail_username, settings.mail_password)
+                    smtp.send_message(message)
     except Exception:
         logger.exception("Failed to send email to %s", recipients)
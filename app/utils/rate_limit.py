@@ -52,6 +52,11 @@ def _get_redis():
         return None
 
 
+def connect_redis() -> bool:
+    """Connect the shared Redis client now; False means limits use the in-memory fallback."""
+    return _get_redis() is not None
+
+
 def clear_rate_limits() -> None:
     """Reset in-memory buckets and cached Redis client (for tests)."""
     global _redis_client, _redis_unavailable
@@ -0,0 +1,82 @@
+"""Token normalisation for the indexed member search.
+
+Names and emails are folded to lowercase ASCII words; phone numbers are reduced
+to their digits and stored in both national (``087…``) and international
+(``35387…``) form so either spelling finds the member. Queries go through the
+same functions, and every query token is matched as a prefix of a stored token.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+IRISH_COUNTRY_CODE = "353"
+MAX_TOKEN_LENGTH = 120
+MIN_PHONE_QUERY_DIGITS = 3
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_PHONE_QUERY_RE = re.compile(r"^[\d\s+().-]+$")
+
+
+def fold(text: str) -> str:
+    """Lowercase and strip accents so ``Seán`` and ``sean`` compare equal."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def text_tokens(text: str | None) -> set[str]:
+    """Split free text into words, plus each word with punctuation squashed.
+
+    ``O'Brien`` yields ``o``, ``brien`` and ``obrien``; ``ann@example.ie``
+    yields ``ann``, ``example``, ``ie`` and ``annexampleie``.
+    """
+    if not text:
+        return set()
+    tokens: set[str] = set()
+    for chunk in fold(text).split():
+        words = _WORD_RE.findall(chunk)
+        tokens.update(words)
+        if len(words) > 1:
+            tokens.add("".join(words))
+    return {token[:MAX_TOKEN_LENGTH] for token in tokens}
+
+
+def phone_tokens(phone: str | None) -> set[str]:
+    """Digits-only phone forms, with and without the Irish country code."""
+    if not phone:
+        return set()
+    digits = re.sub(r"\D", "", phone)
+    if not digits:
+        return set()
+    tokens = {digits}
+    if digits.startswith("00" + IRISH_COUNTRY_CODE):
+        digits = digits[2:]
+        tokens.add(digits)
+    if digits.startswith(IRISH_COUNTRY_CODE):
+        tokens.add("0" + digits[len(IRISH_COUNTRY_CODE) :])
+    elif digits.startswith("0"):
+        tokens.add(IRISH_COUNTRY_CODE + digits[1:])
+    return tokens
+
+
+def user_tokens(name: str | None, email: str | None, phone: str | None) -> set[str]:
+    return text_tokens(name) | text_tokens(email) | phone_tokens(phone)
+
+
+def query_tokens(query: str) -> list[str]:
+    """Tokens a search query must all prefix-match, longest first.
+
+    A query made only of digits and phone punctuation is treated as a single
+    phone number, so ``087 123`` matches ``0871234567`` rather than requiring
+    a separate ``123`` word.
+    """
+    query = query.strip()
+    if _PHONE_QUERY_RE.match(query):
+        digits = re.sub(r"\D", "", query)
+        if len(digits) >= MIN_PHONE_QUERY_DIGITS:
+            if digits.startswith("00" + IRISH_COUNTRY_CODE):
+                digits = digits[2:]
+            return [digits]
+    words = set(_WORD_RE.findall(fold(query)))
+    return sorted(words, key=lambda word: (-len(word), word))
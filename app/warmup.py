@@ -0,0 +1,97 @@
+"""Per-worker warmup, run from the app lifespan.
+
+Uvicorn forks its workers before the app starts, so without this each worker
+builds its connection pool, compiles templates, resolves routes and imports
+the SumUp SDK on whichever requests arrive first after a deploy. Steps are
+timed and a failing step is logged rather than fatal; ``/health/ready`` stays
+``down`` until :func:`run_warmup` has recorded its results.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections.abc import Callable
+from typing import Any
+
+from app.core.config import get_settings
+from app.db import db, reset_current_session, set_current_session
+from app.repositories.base import BaseRepository
+from app.routes_map import FALLBACK_ROUTES
+from app.services import health
+from app.services import settings as settings_service
+from app.services.health import DOWN, OK, ProbeResult
+from app.templating import precompile_templates
+from app.utils import rate_limit
+
+logger = logging.getLogger(__name__)
+
+_PATH_PARAM_RE = re.compile(r"{(\w+)}")
+
+
+def _resolve_routes(asgi_app: Any) -> dict[str, Any]:
+    for name, path in FALLBACK_ROUTES.items():
+        asgi_app.url_path_for(name, **dict.fromkeys(_PATH_PARAM_RE.findall(path), "0"))
+    return {"routes": len(FALLBACK_ROUTES)}
+
+
+def _database() -> dict[str, Any]:
+    return {"connections": BaseRepository.warm_pool(get_settings().warmup_db_connections)}
+
+
+def _settings() -> dict[str, Any]:
+    session = db.create_session()
+    token = set_current_session(session)
+    try:
+        return {"settings": len(settings_service.get_all())}
+    finally:
+        session.close()
+        reset_current_session(token)
+
+
+def _redis() -> dict[str, Any]:
+    return {"backend": "redis" if rate_limit.connect_redis() else "memory"}
+
+
+def _sumup() -> dict[str, Any]:
+    from app.services.sumup import SumUpService
+
+    SumUpService()
+    return {}
+
+
+def warmup_steps(asgi_app: Any) -> dict[str, Callable[[], dict[str, Any]]]:
+    settings = get_settings()
+    steps: dict[str, Callable[[], dict[str, Any]]] = {
+        "routes": lambda: _resolve_routes(asgi_app),
+        "templates": lambda: {"templates": precompile_templates()},
+        "database": _database,
+        "settings": _settings,
+    }
+    if settings.redis_url:
+        steps["redis"] = _redis
+    if settings.sumup_api_key:
+        steps["sumup"] = _sumup
+    return steps
+
+
+def run_warmup(asgi_app: Any) -> dict[str, ProbeResult]:
+    """Run every warmup step, then mark the worker ready."""
+    results: dict[str, ProbeResult] = {}
+    for name, step in warmup_steps(asgi_app).items():
+        started = time.perf_counter()
+        try:
+            detail = step()
+        except Exception as exc:
+            logger.warning("Warmup step %s failed", name, exc_info=True)
+            results[name] = ProbeResult(DOWN, detail={"error": f"{type(exc).__name__}: {exc}"})
+            continue
+        results[name] = ProbeResult(OK, round((time.perf_counter() - started) * 1000, 2), detail)
+    health.record_warmup(results)
+    logger.info(
+        "Worker warm in %.0f ms: %s",
+        sum(result.latency_ms or 0 for result in results.values()),
+        ", ".join(f"{name}={result.status}" for name, result in results.items()),
+    )
+    return results
@@ -0,0 +1,71 @@
+"""Compare two benchmark JSON files written with ``--benchmark-json``.
+
+    python -m benchmarks.compare .benchmarks/base.json .benchmarks/head.json
+
+Prints the change in every ``*_ms`` column for rows present in both files and
+exits non-zero when any median is slower than ``--threshold`` (default 25%).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def _load(path: str) -> dict[str, dict]:
+    payload = json.loads(Path(path).read_text())
+    return {row["name"]: row for row in payload.get("results", [])}
+
+
+def _as_float(value) -> float | None:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def compare(base: dict[str, dict], head: dict[str, dict], *, threshold: float) -> tuple[list[str], list[str]]:
+    """Return (report lines, names of regressed rows)."""
+    lines: list[str] = []
+    regressions: list[str] = []
+    for name, head_row in head.items():
+        base_row = base.get(name)
+        if base_row is None:
+            lines.append(f"{name:<48} new")
+            continue
+        for key, value in head_row.items():
+            if not key.endswith("_ms"):
+                continue
+            before, after = _as_float(base_row.get(key)), _as_float(value)
+            if before is None or after is None or before == 0:
+                continue
+            change = (after - before) / before
+            flag = ""
+            if key == "median_ms" and change > threshold:
+                flag = "  REGRESSION"
+                regressions.append(name)
+            lines.append(f"{name:<48} {key:<16} {before:>10.3f} -> {after:>10.3f}  {change:+.1%}{flag}")
+    return lines, regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed median slowdown as a fraction (default 0.25)")
+    args = parser.parse_args(argv)
+
+    lines, regressions = compare(_load(args.base), _load(args.head), threshold=args.threshold)
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
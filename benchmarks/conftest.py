@@ -0,0 +1,120 @@
+"""Benchmarks reuse the SQLite fixtures from the main test suite.
+
+Run with ``make bench``; timings are printed at the end of the session and,
+with ``--benchmark-json PATH``, written as JSON so two commits can be compared
+with ``python -m benchmarks.compare``. Set ``TEST_DATABASE_URL`` to run the
+same suite against MySQL.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from app import db
+from app.cli.seed import SeedSummary, seed_club
+from tests.conftest import (  # noqa: F401 - re-exported fixtures
+    _reset_request_scoped_state,
+    admin_client,
+    admin_user,
+    app,
+    app_instance,
+    client,
+    member_client,
+    test_user,
+)
+
+_results: list[dict] = []
+
+
+def pytest_addoption(parser) -> None:
+    parser.addoption(
+        "--benchmark-json",
+        default=os.environ.get("BENCHMARK_JSON"),
+        help="Write benchmark results to this JSON file (default: $BENCHMARK_JSON).",
+    )
+
+
+@pytest.fixture
+def report():
+    """Record one benchmark row, e.g. ``report(name="...", cpu_ms=1.2)``."""
+
+    def _record(**row) -> None:
+        _results.append(row)
+
+    return _record
+
+
+@pytest.fixture
+def bench(report) -> Callable[..., dict]:
+    """Time ``func`` and record its median and p95, e.g. ``bench("settings.get", lambda: ...)``."""
+
+    def _bench(name: str, func: Callable[[], object], *, iterations: int = 20, warmup: int = 2) -> dict:
+        for _ in range(warmup):
+            func()
+        samples = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - started) * 1000)
+        samples.sort()
+        row = {
+            "name": name,
+            "median_ms": round(statistics.median(samples), 3),
+            "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+            "iterations": iterations,
+        }
+        report(**row)
+        return row
+
+    return _bench
+
+
+@pytest.fixture
+def club(app) -> SeedSummary:  # noqa: F811 - depends on the re-exported fixture
+    """Two years of a 3000-member club (``sea dev seed``) inside the test transaction."""
+    summary = seed_club(db.session, members=3000, years=2, seed=1234)
+    db.session.commit()
+    return summary
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=False)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def pytest_sessionfinish(session) -> None:
+    path = session.config.getoption("--benchmark-json")
+    if not path or not _results:
+        return
+    payload = {
+        "commit": _git_commit(),
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "database": db.engine.dialect.name if db.engine is not None else None,
+        "results": _results,
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(payload, indent=2, default=str) + "\n")
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    if not _results:
+        return
+    terminalreporter.section("benchmark results")
+    for row in _results:
+        name = row.get("name", "?")
+        details = "  ".join(f"{key}={value}" for key, value in row.items() if key != "name")
+        terminalreporter.write_line(f"{name:<40} {details}")
@@ -0,0 +1,83 @@
+"""/admin/dashboard with a realistic club: queries per load, cold and warm."""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import event
+
+from app import db
+from app.enums import PaymentMethod, PaymentType
+from app.models import Membership, Payment, User
+from app.utils.cache import clear_all_caches
+
+MEMBERS = 500
+ITERATIONS = 20
+
+
+def _populate() -> None:
+    for i in range(MEMBERS):
+        user = User(name=f"Member {i}", email=f"member{i}@example.com", is_active=i % 10 != 0, password_hash="x")
+        db.session.add(user)
+        db.session.flush()
+        db.session.add(
+            Membership(
+                user_id=user.id,
+                start_date=date.today() - timedelta(days=30),
+                expiry_date=date.today() + timedelta(days=335),
+                initial_credits=20,
+                purchased_credits=0,
+                status="active" if i % 4 else "expired",
+            )
+        )
+        if i % 25 == 0:
+            db.session.add(
+                Payment(
+                    user_id=user.id,
+                    amount_cents=10000,
+                    currency="EUR",
+                    payment_type=PaymentType.MEMBERSHIP,
+                    payment_method=PaymentMethod.CASH,
+                    status="pending",
+                )
+            )
+    db.session.commit()
+
+
+def _load(admin_client, *, cold: bool) -> tuple[float, int]:
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    engine = db.session.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        started = time.perf_counter()
+        for _ in range(ITERATIONS):
+            if cold:
+                clear_all_caches()
+            assert admin_client.get("/admin/dashboard").status_code == 200
+        elapsed_ms = (time.perf_counter() - started) * 1000 / ITERATIONS
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    return elapsed_ms, len(statements) // ITERATIONS
+
+
+def test_admin_dashboard(admin_client, report):
+    _populate()
+    admin_client.get("/admin/dashboard")
+
+    cold_ms, cold_selects = _load(admin_client, cold=True)
+    warm_ms, warm_selects = _load(admin_client, cold=False)
+
+    report(
+        name="/admin/dashboard",
+        cold_ms=f"{cold_ms:.2f}",
+        cold_selects=cold_selects,
+        warm_ms=f"{warm_ms:.2f}",
+        warm_selects=warm_selects,
+    )
+    assert warm_selects < cold_selects
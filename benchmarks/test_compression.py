@@ -0,0 +1,75 @@
+"""Bytes on the wire and CPU per request for the heaviest admin pages."""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from app import db
+from app.models import FinancialTransaction, Membership, User
+
+ITERATIONS = 20
+PAGES = {
+    "admin.members": "/admin/members?per_page=100",
+    "admin.finance": "/admin/finance?per_page=100",
+}
+
+
+@pytest.fixture
+def heavy_admin_data(admin_user):
+    today = date.today()
+    for i in range(150):
+        user = User(name=f"Member {i:04d}", email=f"member{i:04d}@example.com", phone=f"087{i:07d}", is_active=True, password_hash="x")
+        db.session.add(user)
+        db.session.flush()
+        db.session.add(
+            Membership(
+                user_id=user.id,
+                start_date=today - timedelta(days=30),
+                expiry_date=today + timedelta(days=335),
+                initial_credits=20,
+                purchased_credits=i % 5,
+                status="active",
+            )
+        )
+    for i in range(150):
+        db.session.add(
+            FinancialTransaction(
+                type="income" if i % 3 else "expense",
+                date=today - timedelta(days=i),
+                amount_cents=1000 + i,
+                category="shoot_fees" if i % 3 else "equipment",
+                description=f"Benchmark transaction {i}",
+                created_by_id=admin_user.id,
+            )
+        )
+    db.session.commit()
+
+
+def _measure(admin_client, url: str, encoding: str) -> tuple[int, float]:
+    admin_client.get(url, headers={"accept-encoding": encoding})
+    started = time.process_time()
+    for _ in range(ITERATIONS):
+        response = admin_client.get(url, headers={"accept-encoding": encoding})
+        assert response.status_code == 200
+    cpu_ms = (time.process_time() - started) * 1000 / ITERATIONS
+    return response.num_bytes_downloaded, cpu_ms
+
+
+@pytest.mark.parametrize("route_name", sorted(PAGES))
+def test_admin_page_compression(admin_client, heavy_admin_data, report, route_name):
+    url = PAGES[route_name]
+    identity_bytes, identity_cpu = _measure(admin_client, url, "identity")
+    gzip_bytes, gzip_cpu = _measure(admin_client, url, "gzip")
+
+    report(
+        name=f"compression:{route_name}",
+        identity_bytes=identity_bytes,
+        gzip_bytes=gzip_bytes,
+        ratio=round(identity_bytes / gzip_bytes, 1),
+        identity_cpu_ms=round(identity_cpu, 2),
+        gzip_cpu_ms=round(gzip_cpu, 2),
+    )
+    assert gzip_bytes * 4 < identity_bytes
@@ -0,0 +1,86 @@
+"""The hottest routes and helpers against a seeded, production-sized club."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from app import db
+from app.db.pagination import paginate
+from app.models import User
+from app.scheduler import Schedule
+from app.services import finance
+from app.services import settings as settings_service
+
+CRON_EXPRESSIONS = ("* * * * *", "*/5 * * * *", "0 * * * *", "30 2 * * *", "0 9 * * 1-5", "0 0 1 * *", "15,45 8 * * 0")
+
+
+def _get_ok(client, url: str) -> None:
+    response = client.get(url)
+    assert response.status_code == 200, url
+
+
+def test_public_home(client, club, bench):
+    bench("GET /", lambda: _get_ok(client, "/"))
+
+
+def test_member_dashboard(member_client, club, bench):
+    bench("GET /member/dashboard", lambda: _get_ok(member_client, "/member/dashboard"))
+
+
+def test_admin_member_search(admin_client, club, bench):
+    bench("GET /admin/members?search=murphy", lambda: _get_ok(admin_client, "/admin/members?search=murphy"))
+    bench("GET /admin/members?page=50", lambda: _get_ok(admin_client, "/admin/members?page=50"))
+
+
+def test_admin_finance(admin_client, club, bench):
+    bench("GET /admin/finance", lambda: _get_ok(admin_client, "/admin/finance"))
+
+
+def test_financial_statement_exports(admin_client, club, bench):
+    dates = {"start_date": club.last_date - timedelta(days=365), "end_date": club.last_date}
+    query = "&".join(f"{key}={value.isoformat()}" for key, value in dates.items())
+
+    def _statement() -> None:
+        response = admin_client.post("/admin/finance/statement", data={key: value.isoformat() for key, value in dates.items()})
+        assert response.status_code == 200
+
+    def _pdf() -> None:
+        response = admin_client.get(f"/admin/finance/statement/pdf?{query}")
+        assert response.headers["content-type"] == "application/pdf"
+
+    bench("POST /admin/finance/statement", _statement, iterations=10)
+    bench("GET /admin/finance/statement/pdf", _pdf, iterations=5)
+
+
+def test_settings_get(club, bench):
+    bench("settings.get", lambda: settings_service.get("annual_membership_cost"), iterations=200)
+
+
+def test_permission_names(admin_user, club, bench):
+    def _fresh_permissions() -> None:
+        # Each request loads the user afresh, so include the role/permission loads.
+        db.session.expire(admin_user, ["roles"])
+        assert admin_user.permission_names()
+
+    bench("User.permission_names", _fresh_permissions, iterations=200)
+
+
+def test_generate_statement(club, bench):
+    bench("finance.generate_statement (3 years)", lambda: finance.generate_statement(club.last_date - timedelta(days=3 * 365), club.last_date), iterations=10)
+
+
+def test_cron_evaluator(bench):
+    schedule = Schedule()
+    for expression in CRON_EXPRESSIONS:
+        schedule.call(lambda: None, expression).cron(expression)
+    start = datetime(2026, 1, 5)
+    minutes = [start + timedelta(minutes=offset) for offset in range(24 * 60)]
+
+    bench("Schedule.due_events (one day of minutes)", lambda: [schedule.due_events(now) for now in minutes], iterations=10)
+
+
+def test_paginate(club, bench):
+    stmt = select(User).order_by(User.name)
+    bench("paginate(users, page=100)", lambda: paginate(db.session, stmt, page=100, per_page=20), iterations=50)
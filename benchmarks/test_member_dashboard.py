@@ -0,0 +1,43 @@
+"""Member dashboard and shoot history cost as attendance history grows."""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from app import db
+from app.models import Shoot
+from app.models.shoot import ShootLocation, user_shoots
+
+ITERATIONS = 20
+PAGES = ("/member/dashboard", "/member/shoots")
+
+
+def _attend(user_id: int, count: int) -> None:
+    start = date(2000, 1, 1)
+    for offset in range(count):
+        shoot = Shoot(date=start + timedelta(days=offset), location=ShootLocation.HALL)
+        db.session.add(shoot)
+        db.session.flush()
+        db.session.execute(insert(user_shoots).values(user_id=user_id, shoot_id=shoot.id))
+    db.session.commit()
+
+
+def _wall_ms(member_client, url: str) -> float:
+    member_client.get(url)
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        assert member_client.get(url).status_code == 200
+    return (time.perf_counter() - started) * 1000 / ITERATIONS
+
+
+@pytest.mark.parametrize("url", PAGES)
+def test_member_pages_stay_flat_with_history(member_client, test_user, report, url):
+    baseline_ms = _wall_ms(member_client, url)
+    _attend(test_user.id, 1500)
+    history_ms = _wall_ms(member_client, url)
+    report(name=url, empty_ms=f"{baseline_ms:.2f}", history_1500_ms=f"{history_ms:.2f}")
+    assert history_ms < baseline_ms * 3
@@ -0,0 +1,63 @@
+"""Member search latency: indexed prefix tokens versus the old ``%term%`` scan."""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+import pytest
+from sqlalchemy import insert, or_, select
+
+from app import db
+from app.models import User
+from app.repositories import UserRepository
+
+MEMBERS = 5000
+ITERATIONS = 30
+QUERIES = ("mur", "sean kel", "member4321", "087 000 43", "+353 87 000 4")
+TYPEAHEAD_BUDGET_MS = 10.0
+
+FIRST_NAMES = ("Sean", "Aoife", "Niamh", "Conor", "Ciara", "Padraig", "Siobhan", "Eoin")
+LAST_NAMES = ("Murphy", "Kelly", "O'Brien", "Walsh", "Byrne", "Ryan", "Doyle", "Kavanagh")
+
+
+@pytest.fixture
+def many_members(app):
+    rows = [
+        {
+            "name": f"{FIRST_NAMES[i % len(FIRST_NAMES)]} {LAST_NAMES[(i // len(FIRST_NAMES)) % len(LAST_NAMES)]} {i}",
+            "email": f"member{i}@example.com",
+            "phone": f"087 {i:07d}",
+            "password_hash": "x",
+            "is_active": True,
+        }
+        for i in range(MEMBERS)
+    ]
+    db.session.execute(insert(User), rows)
+    UserRepository.rebuild_search_tokens()
+    db.session.commit()
+
+
+def _legacy_search(search: str) -> list[int]:
+    term = f"%{search}%"
+    stmt = select(User.id).where(or_(User.name.ilike(term), User.email.ilike(term), User.phone.ilike(term))).order_by(User.name).limit(10)
+    return list(db.session.scalars(stmt))
+
+
+def _median_ms(func, query: str) -> float:
+    func(query)
+    samples = []
+    for _ in range(ITERATIONS):
+        started = time.perf_counter()
+        func(query)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_member_typeahead_latency(many_members, report, query):
+    indexed_ms = _median_ms(lambda q: UserRepository.search_typeahead(q), query)
+    legacy_ms = _median_ms(_legacy_search, query)
+    report(name=f"search {query!r}", indexed_ms=f"{indexed_ms:.2f}", ilike_ms=f"{legacy_ms:.2f}")
+    assert UserRepository.search_typeahead(query)
+    assert indexed_ms < TYPEAHEAD_BUDGET_MS
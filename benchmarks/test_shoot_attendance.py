@@ -0,0 +1,65 @@
+"""Statements and wall time to record a busy shoot (40 archers, 10 visitors)."""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app import db
+from app.models import Membership, User
+from app.services import settings, shoots
+
+ARCHERS = 40
+VISITORS = 10
+
+
+@pytest.fixture
+def archers(app):
+    users = []
+    for i in range(ARCHERS):
+        user = User(name=f"Archer {i}", email=f"archer{i}@example.com", is_active=True, password_hash="x")
+        db.session.add(user)
+        db.session.flush()
+        db.session.add(
+            Membership(
+                user_id=user.id,
+                start_date=date.today() - timedelta(days=30),
+                expiry_date=date.today() + timedelta(days=335),
+                initial_credits=i % 3,
+                purchased_credits=i % 2,
+                status="active",
+            )
+        )
+        users.append(user.id)
+    db.session.commit()
+    settings.set("sumup_fee_percentage", "2.5")
+    return users
+
+
+def test_create_busy_shoot(archers, admin_user, report):
+    visitors = [{"name": f"Guest {i}", "club": "Club", "affiliation": "AI", "payment_method": "sumup"} for i in range(VISITORS)]
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db.session.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    started = time.perf_counter()
+    try:
+        result = shoots.create_shoot(
+            shoot_date=date.today(),
+            location="HALL",
+            attendee_ids=archers,
+            visitors=visitors,
+            created_by_id=admin_user.id,
+        )
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert result.success is True
+    report(name="shoots.create_shoot 40+10", statements=len(statements), wall_ms=f"{elapsed_ms:.2f}")
@@ -0,0 +1,49 @@
+"""Interpreter start-up cost of each entry point, measured with ``python -X importtime``.
+
+Every ``sea`` invocation and uvicorn worker pays this before doing any work,
+so a heavy import creeping into a module the CLI or the scheduler loads shows
+up here. Each row is the median of fresh interpreters importing the module.
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+RUNS = 5
+OPTIONAL_HEAVY = ("fastapi", "sumup", "fpdf", "redis", "passlib", "alembic")
+ENTRY_POINTS = ("app.cli", "app.scheduler.jobs", "app.services.payments", "app.main")
+
+
+def _import_time(module: str) -> tuple[float, set[str]]:
+    """Total import time in ms and the top-level packages loaded by ``import module``."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True)
+    total_us = 0
+    packages: set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        packages.add(name.strip().split(".")[0])
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000, packages
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_import_time(module, report):
+    samples = []
+    packages: set[str] = set()
+    for _ in range(RUNS):
+        elapsed_ms, packages = _import_time(module)
+        samples.append(elapsed_ms)
+    report(
+        name=f"import {module}",
+        median_ms=round(statistics.median(samples), 3),
+        min_ms=round(min(samples), 3),
+        packages=len(packages),
+        heavy=",".join(sorted(packages.intersection(OPTIONAL_HEAVY))) or "-",
+    )
@@ -5,22 +5,9 @@
 set -e
 
 echo "⏳ Waiting for database to be ready..."
-max_retries=30
-retry_count=0
-last_error=""
-until uv run sea db current > /dev/null 2>/tmp/db_check_error || [ $retry_count -eq $max_retries ]; do
-    last_error=$(cat /tmp/db_check_error 2>/dev/null || true)
-    retry_count=$((retry_count + 1))
-    echo "  Database not ready yet (attempt $retry_count/$max_retries)..."
-    sleep 2
-done
-
-if [ $retry_count -eq $max_retries ]; then
-    echo "❌ Database failed to become ready after $max_retries attempts"
-    if [ -n "$last_error" ]; then
-        echo "Last error:"
-        echo "$last_error"
-    fi
+# Retries inside one process rather than paying interpreter startup per attempt.
+if ! uv run sea db wait --timeout 60 --interval 2; then
+    echo "❌ Database failed to become ready"
     exit 1
 fi
 
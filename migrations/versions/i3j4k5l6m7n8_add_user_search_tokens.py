@@ -0,0 +1,89 @@
+"""Add user_search_tokens index table for member search
+
+Revision ID: i3j4k5l6m7n8
+Revises: h2i3j4k5l6m7
+Create Date: 2026-10-19
+"""
+
+import re
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "i3j4k5l6m7n8"
+down_revision = "h2i3j4k5l6m7"
+branch_labels = None
+depends_on = None
+
+
+# Frozen copy of app.utils.search as of this revision, so the backfill does not
+# change when the live tokenizer does. Later tokenizer changes are applied to
+# existing rows with ``sea users reindex-search``.
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _fold(text):
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _text_tokens(text):
+    if not text:
+        return set()
+    tokens = set()
+    for chunk in _fold(text).split():
+        words = _WORD_RE.findall(chunk)
+        tokens.update(words)
+        if len(words) > 1:
+            tokens.add("".join(words))
+    return {token[:120] for token in tokens}
+
+
+def _phone_tokens(phone):
+    if not phone:
+        return set()
+    digits = re.sub(r"\D", "", phone)
+    if not digits:
+        return set()
+    tokens = {digits}
+    if digits.startswith("00353"):
+        digits = digits[2:]
+        tokens.add(digits)
+    if digits.startswith("353"):
+        tokens.add("0" + digits[3:])
+    elif digits.startswith("0"):
+        tokens.add("353" + digits[1:])
+    return tokens
+
+
+def _user_tokens(name, email, phone):
+    return _text_tokens(name) | _text_tokens(email) | _phone_tokens(phone)
+
+
+def upgrade() -> None:
+    tokens = op.create_table(
+        "user_search_tokens",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "token",
+            sa.String(length=120).with_variant(sa.String(length=120, collation="NOCASE"), "sqlite"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "token"),
+    )
+    op.create_index("ix_user_search_tokens_token_user_id", "user_search_tokens", ["token", "user_id"], unique=False)
+
+    # Backfill existing members.
+    connection = op.get_bind()
+    users = connection.execute(sa.text("SELECT id, name, email, phone FROM users")).all()
+    rows = [{"user_id": user.id, "token": token} for user in users for token in sorted(_user_tokens(user.name, user.email, user.phone))]
+    if rows:
+        op.bulk_insert(tokens, rows)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_search_tokens_token_user_id", table_name="user_search_tokens")
+    op.drop_table("user_search_tokens")
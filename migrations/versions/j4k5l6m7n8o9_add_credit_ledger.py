@@ -0,0 +1,71 @@
+"""Add append-only credit_ledger and seed opening balances
+
+Revision ID: j4k5l6m7n8o9
+Revises: i3j4k5l6m7n8
+Create Date: 2026-10-19
+"""
+
+from datetime import UTC, datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "j4k5l6m7n8o9"
+down_revision = "i3j4k5l6m7n8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    ledger = op.create_table(
+        "credit_ledger",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("membership_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("bucket", sa.String(length=10), nullable=False),
+        sa.Column("delta", sa.Integer(), nullable=False),
+        sa.Column("balance_after", sa.Integer(), nullable=False),
+        sa.Column("reason", sa.String(length=32), nullable=False),
+        sa.Column("shoot_id", sa.Integer(), nullable=True),
+        sa.Column("payment_id", sa.Integer(), nullable=True),
+        sa.Column("actor_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["membership_id"], ["memberships.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["shoot_id"], ["shoots.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["payment_id"], ["payments.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["actor_id"], ["users.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_credit_ledger_user_id"), "credit_ledger", ["user_id"], unique=False)
+    op.create_index("ix_credit_ledger_membership_id_id", "credit_ledger", ["membership_id", "id"], unique=False)
+
+    # Today's balances become each membership's opening entries, so
+    # SUM(delta) per bucket matches the materialized columns from day one.
+    now = datetime.now(UTC)
+    connection = op.get_bind()
+    memberships = connection.execute(sa.text("SELECT id, user_id, initial_credits, purchased_credits FROM memberships")).all()
+    rows = []
+    for membership in memberships:
+        for bucket, balance in (("initial", membership.initial_credits), ("purchased", membership.purchased_credits)):
+            if balance:
+                rows.append(
+                    {
+                        "membership_id": membership.id,
+                        "user_id": membership.user_id,
+                        "bucket": bucket,
+                        "delta": balance,
+                        "balance_after": balance,
+                        "reason": "opening_balance",
+                        "created_at": now,
+                    }
+                )
+    if rows:
+        op.bulk_insert(ledger, rows)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_credit_ledger_membership_id_id", table_name="credit_ledger")
+    op.drop_index(op.f("ix_credit_ledger_user_id"), table_name="credit_ledger")
+    op.drop_table("credit_ledger")
@@ -0,0 +1,53 @@
+"""Add pre-rendered content_html and content_hash to news
+
+Revision ID: k5l6m7n8o9p0
+Revises: j4k5l6m7n8o9
+Create Date: 2026-10-19
+"""
+
+import hashlib
+import re
+
+from alembic import op
+from markupsafe import escape
+import sqlalchemy as sa
+
+
+revision = "k5l6m7n8o9p0"
+down_revision = "j4k5l6m7n8o9"
+branch_labels = None
+depends_on = None
+
+
+# Frozen copies of app.utils.content as of this revision, so the backfill does
+# not change when the live renderer does.
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+def _render_article_html(text):
+    source = (text or "").replace("\r\n", "\n").replace("\r", "\n").strip()
+    paragraphs = [paragraph.strip() for paragraph in _PARAGRAPH_BREAK.split(source) if paragraph.strip()]
+    return "\n".join("<p>" + "<br>\n".join(str(escape(line)) for line in paragraph.split("\n")) + "</p>" for paragraph in paragraphs)
+
+
+def _content_hash(html):
+    return hashlib.sha256(html.encode()).hexdigest()
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("news") as batch_op:
+        batch_op.add_column(sa.Column("content_html", sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+    # Render existing articles.
+    connection = op.get_bind()
+    news = sa.table("news", sa.column("id", sa.Integer), sa.column("content_html", sa.Text), sa.column("content_hash", sa.String))
+    for article in connection.execute(sa.text("SELECT id, content FROM news")).all():
+        html = _render_article_html(article.content)
+        connection.execute(news.update().where(news.c.id == article.id).values(content_html=html, content_hash=_content_hash(html)))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("news") as batch_op:
+        batch_op.drop_column("content_hash")
+        batch_op.drop_column("content_html")
@@ -3,6 +3,7 @@ from contextlib import contextmanager
 from datetime import date, timedelta
 
 import pytest
+from fastapi import Request
 from fastapi.testclient import TestClient
 from sqlalchemy.pool import StaticPool
 
@@ -17,9 +18,9 @@ import app.core.config  # noqa: F401 - load settings
 import app.models  # noqa: F401 - register models with metadata
 from app import db
 from app.core.config import get_settings
-from app.core.database import get_db
+from app.core.database import get_db, is_read_only_request
 from app.core.security import hash_password
-from app.db import reset_current_session, set_current_session
+from app.db import mark_read_only, reset_current_session, set_current_session
 from app.events.handlers import connect_handlers
 from app.main import app as fastapi_app
 from app.models import Membership, Role, User
@@ -58,6 +59,10 @@ def app_instance():
     from sqlalchemy import create_engine
     from sqlalchemy.orm import sessionmaker
 
+    from app.db.statement_timeouts import apply_statement_timeouts
+    from app.metrics.database import instrument_engine
+    from app.tracing.instrumentation import instrument_engine as trace_engine
+
     db_url = _test_database_url()
     if db_url.startswith("sqlite"):
         db.engine = create_engine(
@@ -67,6 +72,9 @@ def app_instance():
         )
     else:
         db.engine = create_engine(db_url, pool_pre_ping=True)
+    instrument_engine(db.engine)
+    trace_engine(db.engine)
+    apply_statement_timeouts(db.engine)
     db._session_factory = sessionmaker(bind=db.engine, autoflush=False, autocommit=False)
     db.create_all()
     session = db.create_session()
@@ -101,6 +109,11 @@ def app(app_instance):
     session = sessionmaker(bind=connection, autoflush=False, autocommit=False)()
     nested = connection.begin_nested()
     token = set_current_session(session)
+    # Sessions opened with db.create_session() (health probes, deferred
+    # handlers) join the test transaction through their own savepoints instead
+    # of rolling back the shared connection when they close.
+    engine_factory = db._session_factory
+    db._session_factory = sessionmaker(bind=connection, autoflush=False, autocommit=False, join_transaction_mode="create_savepoint")
 
     @event.listens_for(session, "after_transaction_end")
     def restart_savepoint(sess, trans):
@@ -110,6 +123,7 @@ def app(app_instance):
 
     yield app_instance
 
+    db._session_factory = engine_factory
     session.close()
     reset_current_session(token)
     event.remove(session, "after_transaction_end", restart_savepoint)
@@ -119,15 +133,21 @@ def app(app_instance):
 
 @pytest.fixture(autouse=True)
 def _reset_request_scoped_state():
-    """Clear deferred events and rate-limit buckets between tests."""
+    """Clear deferred events, rate-limit buckets, bulkheads and TTL caches between tests."""
     from app.events.background import take_deferred_handlers
     from app.utils import rate_limit
+    from app.utils.bulkhead import clear_bulkheads
+    from app.utils.cache import clear_all_caches
 
     take_deferred_handlers()
     rate_limit.clear_rate_limits()
+    clear_bulkheads()
+    clear_all_caches()
     yield
     take_deferred_handlers()
     rate_limit.clear_rate_limits()
+    clear_bulkheads()
+    clear_all_caches()
 
 
 def pytest_collection_modifyitems(items):
@@ -149,12 +169,16 @@ def db_session(app):
 def client(app):
     session = db.session
 
-    async def override_get_db():
+    async def override_get_db(request: Request):
+        # GET pages get the same write guard as under get_db().
+        mark_read_only(session, is_read_only_request(request))
         try:
             yield session
         except Exception:
             session.rollback()
             raise
+        finally:
+            mark_read_only(session, False)
 
     fastapi_app.dependency_overrides[get_db] = override_get_db
     with TestClient(fastapi_app) as test_client:
@@ -9,3 +9,16 @@ def test_dashboard_loads_for_admin(admin_client):
 def test_dashboard_requires_login(client):
     response = client.get("/admin/dashboard", follow_redirects=True)
     assert b"Login" in response.content
+
+
+def test_dashboard_lists_pending_cash_payments(admin_client, test_user):
+    from app import db
+    from tests.helpers import create_payment_for_user
+
+    create_payment_for_user(db, user=test_user, payment_method="cash", status="pending", payment_type="membership", amount=100.0)
+
+    response = admin_client.get("/admin/dashboard")
+
+    assert response.status_code == 200
+    assert test_user.name in response.text
+    assert "€100.00" in response.text
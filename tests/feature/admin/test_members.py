@@ -88,6 +88,30 @@ def test_members_requires_admin(member_client):
     assert response.status_code in (302, 403)
 
 
+def test_member_search_returns_ranked_matches(admin_client, test_user):
+    response = admin_client.get("/admin/members/search", params={"q": "test us"})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0]["id"] == test_user.id
+    assert results[0]["url"] == f"/admin/members/{test_user.id}"
+
+
+def test_member_search_blank_query(admin_client):
+    response = admin_client.get("/admin/members/search", params={"q": "  "})
+    assert response.json() == {"results": []}
+
+
+def test_member_search_requires_admin(member_client):
+    response = member_client.get("/admin/members/search", params={"q": "test"})
+    assert response.status_code in (302, 403)
+
+
+def test_members_list_search_by_phone(admin_client, test_user):
+    response = admin_client.get("/admin/members", params={"search": "123 456"})
+    assert response.status_code == 200
+    assert test_user.email in response.text
+
+
 def test_member_detail_not_found(admin_client):
     response = admin_client.get("/admin/members/99999")
     assert response.status_code == 404
@@ -1,5 +1,6 @@
 """Admin news routes — permissions and CRUD redirects."""
 
+from app import db
 from app.models import News
 
 
@@ -8,6 +9,17 @@ def test_news_list(admin_client):
     assert response.status_code == 200
 
 
+def test_news_list_shows_articles_a_page_at_a_time(admin_client):
+    db.session.add_all(News(title=f"Admin story {n:02d}", content="Body " * 200) for n in range(25))
+    db.session.commit()
+
+    response = admin_client.get("/admin/news?page=2")
+
+    assert response.status_code == 200
+    assert response.text.count("Admin story") == 5
+    assert "Page 2 of 2" in response.text
+
+
 def test_create_news_success_redirects(admin_client):
     response = admin_client.post(
         "/admin/news/create",
@@ -1,3 +1,24 @@
+import threading
+
+import pytest
+
+from app.core.config import get_settings
+from app.services import health as health_service
+
+
+@pytest.fixture
+def smtp_up(monkeypatch):
+    monkeypatch.setattr(health_service, "_smtp_probe", lambda: {})
+
+
+@pytest.fixture
+def fast_probe_timeout(monkeypatch):
+    monkeypatch.setenv("HEALTH_PROBE_TIMEOUT_SECONDS", "0.05")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
 def test_health(client):
     response = client.get("/health")
     assert response.status_code == 200
@@ -12,3 +33,97 @@ def test_health_db_failure(client, monkeypatch):
     response = client.get("/health")
     assert response.status_code == 500
     assert response.json() == {"status": "error"}
+
+
+def test_health_live_does_no_io(client, monkeypatch):
+    def _boom():
+        raise AssertionError("liveness must not probe dependencies")
+
+    monkeypatch.setattr(health_service, "refresh_probes", _boom)
+    response = client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_health_ready_reports_database_latency_and_pool(client):
+    response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ok"
+    assert list(body["checks"]) == ["warmup", "database"]
+    assert set(body["checks"]["warmup"]["steps"]) == {"routes", "templates", "database", "settings"}
+    database = body["checks"]["database"]
+    assert database["status"] == "ok"
+    assert database["latency_ms"] >= 0
+    assert "saturation" in database["pool"]
+    assert response.headers["cache-control"] == "no-store"
+
+
+def test_health_ready_is_503_when_database_down(client, monkeypatch):
+    def _boom():
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(health_service, "_database_probe", _boom)
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "down"
+    assert response.json()["checks"]["database"]["error"] == "RuntimeError: db down"
+
+
+def test_health_ready_is_503_until_the_worker_is_warm(client, monkeypatch):
+    monkeypatch.setattr(health_service, "_warmup", health_service.WARMING_UP)
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.json()["checks"]["warmup"] == {"status": "down", "error": "worker is still warming up"}
+    assert client.get("/health/live").status_code == 200
+
+
+def test_health_deep_reports_every_dependency(client, smtp_up):
+    response = client.get("/health/deep")
+
+    assert response.status_code == 200
+    checks = response.json()["checks"]
+    assert set(checks) == {"warmup", "database", "smtp", "deferred_handlers"}
+    assert checks["smtp"]["status"] == "ok"
+    assert checks["deferred_handlers"] == {"status": "ok", "pending": 0}
+
+
+def test_health_deep_degraded_when_non_critical_dependency_down(client, monkeypatch):
+    def _refused():
+        raise ConnectionRefusedError("refused")
+
+    monkeypatch.setattr(health_service, "_smtp_probe", _refused)
+    response = client.get("/health/deep")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "degraded"
+    assert response.json()["checks"]["smtp"]["status"] == "down"
+
+
+def test_health_slow_database_is_degraded_not_hung(client, monkeypatch, smtp_up, fast_probe_timeout):
+    release = threading.Event()
+    monkeypatch.setattr(health_service, "_database_probe", lambda: release.wait(5) and {})
+    try:
+        response = client.get("/health/ready")
+    finally:
+        release.set()
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "degraded"
+    assert body["checks"]["database"]["error"] == "no response within 0.05s"
+
+
+def test_health_probe_results_are_cached(client, monkeypatch, smtp_up):
+    calls = []
+    monkeypatch.setattr(health_service, "_database_probe", lambda: calls.append(1) or {})
+
+    client.get("/health/ready")
+    client.get("/health/deep")
+    client.get("/health")
+
+    assert len(calls) == 1
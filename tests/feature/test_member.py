@@ -50,6 +50,31 @@ def test_shoots_page(member_client, test_user):
     assert response.status_code == 200
 
 
+def test_shoots_page_paginates_newest_first(member_client, test_user):
+    from datetime import date, timedelta
+
+    from app import db
+    from app.models import Shoot
+    from app.models.shoot import ShootLocation
+
+    for days in range(25):
+        shoot = Shoot(date=date(2026, 1, 1) + timedelta(days=days), location=ShootLocation.HALL)
+        shoot.users.append(test_user)
+        db.session.add(shoot)
+    db.session.commit()
+
+    first = member_client.get("/member/shoots")
+    assert "25 Jan 2026" in first.text
+    assert "01 Jan 2026" not in first.text
+    assert "Page 1 of 2" in first.text
+
+    second = member_client.get("/member/shoots", params={"page": 2})
+    assert "01 Jan 2026" in second.text
+
+    dashboard = member_client.get("/member/dashboard")
+    assert ">25</span>" in dashboard.text
+
+
 def test_credits_page(member_client):
     response = member_client.get("/member/credits")
     assert response.status_code == 200
@@ -0,0 +1,49 @@
+import pytest
+
+from app.core.config import get_settings
+
+
+@pytest.fixture
+def metrics_token(monkeypatch):
+    monkeypatch.setenv("METRICS_TOKEN", "scrape-secret")
+    get_settings.cache_clear()
+    yield "scrape-secret"
+    get_settings.cache_clear()
+
+
+def test_metrics_requires_login(client):
+    response = client.get("/metrics", follow_redirects=False)
+    assert response.status_code == 303
+    assert response.headers["location"].startswith("/auth/login")
+
+
+def test_metrics_forbidden_without_permission(member_client):
+    response = member_client.get("/metrics")
+    assert response.status_code == 403
+
+
+def test_metrics_reports_route_latency_for_admins(admin_client):
+    admin_client.get("/health/live")
+
+    response = admin_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'sea_http_request_duration_seconds_count{route="health.live",method="GET",status="200"}' in response.text
+    assert "sea_db_statement_duration_seconds_count" in response.text
+
+
+def test_unmatched_requests_are_labelled(admin_client):
+    admin_client.get("/definitely-not-a-page")
+
+    response = admin_client.get("/metrics")
+
+    assert 'route="unmatched",method="GET",status="404"' in response.text
+
+
+def test_metrics_accepts_bearer_token(client, metrics_token):
+    response = client.get("/metrics", headers={"Authorization": f"Bearer {metrics_token}"})
+    assert response.status_code == 200
+
+    wrong = client.get("/metrics", headers={"Authorization": "Bearer nope"}, follow_redirects=False)
+    assert wrong.status_code == 303
@@ -41,3 +41,28 @@ def test_reset_password_success_redirects_to_login(client, test_user):
     assert b"Password reset successfully" in response.content
     db.session.refresh(test_user)
     assert test_user.check_password("NewSecurePassword123!")
+
+
+def test_reset_email_span_is_child_of_the_request_span(client, test_user, mocker, monkeypatch):
+    import io
+    import json
+
+    from app import tracing
+    from app.core.config import get_settings
+    from app.events.executor import shutdown_side_effect_executor
+
+    mocker.patch("app.services.mail.send_password_reset")
+    monkeypatch.setattr(get_settings(), "app_env", "production")
+    stream = io.StringIO()
+    tracing.set_exporter(tracing.JsonLinesExporter(stream))
+    try:
+        client.post("/auth/forgot-password", data={"email": test_user.email})
+        shutdown_side_effect_executor(timeout=5)
+    finally:
+        tracing.set_exporter(None)
+
+    spans = [json.loads(line) for line in stream.getvalue().splitlines()]
+    request = next(span for span in spans if span["kind"] == "SPAN_KIND_SERVER" and span["attributes"]["http.target"] == "/auth/forgot-password")
+    handler = next(span for span in spans if span["name"] == "handler _on_password_reset_requested")
+    assert handler["traceId"] == request["traceId"]
+    assert handler["parentSpanId"] == request["spanId"]
@@ -1,10 +1,15 @@
 """Public routes — feature flags and published content filtering."""
 
 from datetime import date, timedelta
+from unittest.mock import patch
 
 from app import db
-from app.models import Event, News
+from app.core.config import get_settings
+from app.models import Event, News, Role
 from app.services import settings
+from app.templating import templates_version
+from app.utils.cache import clear_all_caches
+from tests.http_helpers import login
 
 
 def _enable_features() -> None:
@@ -82,3 +87,139 @@ def test_news_list_shows_published(client, app):
     response = client.get("/news")
     assert response.status_code == 200
     assert b"Published" in response.content
+
+
+def test_news_list_is_paginated(client, app):
+    _enable_features()
+    for n in range(12):
+        article = News(title=f"Story {n:02d}", content="Article body " * 100, published=True)
+        article.publish()
+        db.session.add(article)
+    db.session.commit()
+
+    first = client.get("/news")
+    second = client.get("/news?page=2")
+
+    assert first.status_code == second.status_code == 200
+    assert "Page 1 of 2" in first.text
+    assert first.text.count("/news/") == 10
+    assert second.text.count("/news/") == 2
+
+
+def test_anonymous_public_pages_set_no_session_cookie(client, app):
+    _enable_features()
+    db.session.commit()
+
+    for url in ("/", "/about", "/membership", "/news", "/events"):
+        response = client.get(url)
+        assert response.status_code == 200, url
+        assert "set-cookie" not in response.headers, url
+        assert "cache-control" not in response.headers, url
+
+
+def test_pages_with_forms_still_mint_a_csrf_token(client):
+    response = client.get("/auth/login")
+
+    assert 'name="csrf_token" value="' in response.text
+    assert "session=" in response.headers["set-cookie"]
+
+
+def test_sessionless_public_pages_are_cacheable_when_configured(client, monkeypatch):
+    monkeypatch.setattr(get_settings(), "public_page_max_age_seconds", 300)
+
+    public = client.get("/about")
+    form = client.get("/auth/login")
+
+    assert public.headers["cache-control"] == "public, max-age=300"
+    assert "Cookie" in public.headers["vary"]
+    assert "cache-control" not in form.headers
+    assert "cache-control" not in client.get("/about").headers
+
+
+def test_request_that_runs_out_of_time_gets_a_friendly_page(client, app, monkeypatch):
+    _enable_features()
+    monkeypatch.setattr(get_settings(), "route_timeouts", {"public.news_list": 1e-9})
+
+    response = client.get("/news")
+
+    assert response.status_code == 503
+    assert "This Is Taking Too Long" in response.text
+    assert client.get("/about").status_code == 200
+
+
+def _published_article(content: str = "First paragraph.\n\nSecond <paragraph>.") -> News:
+    _enable_features()
+    article = News(title="Club night", content=content, published=False)
+    article.publish()
+    db.session.add(article)
+    db.session.commit()
+    return article
+
+
+def test_news_detail_serves_stored_html_with_an_etag(client, app):
+    article = _published_article()
+
+    response = client.get(f"/news/{article.id}")
+
+    assert response.status_code == 200
+    assert "<p>First paragraph.</p>" in response.text
+    assert "Second &lt;paragraph&gt;." in response.text
+    assert response.headers["etag"].startswith('W/"')
+
+
+def test_news_detail_conditional_get_skips_the_body(client, app):
+    article = _published_article()
+    etag = client.get(f"/news/{article.id}").headers["etag"]
+    clear_all_caches()
+
+    with patch("app.services.news.NewsRepository.get_content_html") as get_content_html:
+        response = client.get(f"/news/{article.id}", headers={"If-None-Match": f'"other", {etag}'})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    get_content_html.assert_not_called()
+
+
+def test_news_detail_etag_changes_with_the_article_and_the_viewer(client, app, test_user):
+    article = _published_article()
+    anonymous_etag = client.get(f"/news/{article.id}").headers["etag"]
+
+    article.content = "Corrected text"
+    db.session.commit()
+    response = client.get(f"/news/{article.id}", headers={"If-None-Match": anonymous_etag})
+    assert response.status_code == 200
+    assert "Corrected text" in response.text
+    assert response.headers["etag"] != anonymous_etag
+
+    login(client, test_user.email, "password123")
+    assert client.get(f"/news/{article.id}").headers["etag"] not in (anonymous_etag, response.headers["etag"])
+
+
+def test_news_detail_etag_changes_when_the_viewer_gains_the_admin_link(client, app, test_user):
+    article = _published_article()
+    login(client, test_user.email, "password123")
+    member_etag = client.get(f"/news/{article.id}").headers["etag"]
+
+    test_user.roles.append(Role.query.filter_by(name="Admin").one())
+    db.session.commit()
+    response = client.get(f"/news/{article.id}", headers={"If-None-Match": member_etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != member_etag
+
+
+def test_news_detail_etag_changes_with_the_build(client, app, monkeypatch):
+    article = _published_article()
+    etag = client.get(f"/news/{article.id}").headers["etag"]
+
+    monkeypatch.setattr(get_settings(), "build_version", "next-release")
+    templates_version.cache_clear()
+    try:
+        response = client.get(f"/news/{article.id}", headers={"If-None-Match": etag})
+    finally:
+        monkeypatch.undo()
+        templates_version.cache_clear()
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
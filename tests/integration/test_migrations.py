@@ -68,3 +68,9 @@ def test_migrated_schema_supports_rbac_seed(migrated_mysql):
         assert role_count >= 1
     finally:
         session.close()
+
+
+def test_user_search_tokens_table_indexed_by_token(migrated_mysql):
+    inspector = inspect(migrated_mysql)
+    indexes = inspector.get_indexes("user_search_tokens")
+    assert any(index["column_names"][:1] == ["token"] for index in indexes)
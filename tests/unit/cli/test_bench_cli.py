@@ -0,0 +1,89 @@
+import asyncio
+import json
+
+import httpx
+
+from app import db
+from app.cli import cli
+from app.cli.bench import LoadReport, _timed, percentile, run_load
+from app.cli.seed import seed_club
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(n) for n in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 99) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_load_report_groups_latencies_by_route():
+    report = LoadReport(elapsed_seconds=2.0)
+    for latency in (10.0, 20.0, 30.0):
+        report.record("member.dashboard", latency, ok=True)
+    report.record("admin.finance", 50.0, ok=False)
+
+    data = report.as_dict()
+
+    assert data["requests"] == 4
+    assert data["rps"] == 2.0
+    assert data["routes"]["member.dashboard"] == {"requests": 3, "errors": 0, "busy": 0, "rps": 1.5, "p50_ms": 20.0, "p95_ms": 30.0, "p99_ms": 30.0}
+    assert data["routes"]["admin.finance"]["errors"] == 1
+    assert "4 requests in 2.0s (2.0 req/s)" in report.format()
+
+
+def _bench_http(runner, output, *args) -> dict:
+    # One virtual user per run: the client fixture shares a single Session between requests.
+    result = runner.invoke(
+        cli, ["bench", "http", "-c", "1", "--requests", "6", "--members", "3", "--admins", "1", "--seed", "21", "--json", str(output), *args]
+    )
+    assert result.exit_code == 0, result.output
+    return json.loads(output.read_text())
+
+
+def test_bench_http_drives_the_app_as_seeded_users(runner, client, tmp_path):
+    seed_club(db.session, members=3, years=1, admins=1, seed=21)
+    db.session.commit()
+
+    for admin_share, prefixes in (("0", ("member.", "public.")), ("1", ("admin.",))):
+        data = _bench_http(runner, tmp_path / f"load-{admin_share}.json", "--admin-share", admin_share)
+
+        assert data["login_failures"] == []
+        assert data["routes"]["auth.login_post"]["requests"] == 1
+        # The budget covers the step mix; logging in and fetching a CSRF token for the statement form come on top.
+        assert data["requests"] == 6 + 2 + data["routes"].get("admin.financial_statement", {}).get("requests", 0)
+        assert all(row["errors"] == 0 for row in data["routes"].values())
+        assert any(name.startswith(prefixes) for name in data["routes"])
+
+
+def test_bench_http_reports_login_failures(runner, client):
+    result = runner.invoke(cli, ["bench", "http", "-c", "1", "--requests", "1", "--admin-share", "0", "--seed", "404"])
+
+    assert result.exit_code == 1
+    assert "1 virtual user(s) could not log in (e.g. member0@seed404.example.com)" in result.output
+
+
+def test_bench_records_login_transport_errors_as_login_failures():
+    report = asyncio.run(run_load(concurrency=2, max_requests=2, admin_share=0, members=3, seed=9, url="http://127.0.0.1:9"))
+
+    assert sorted(report.login_failures) == ["member0@seed9.example.com", "member1@seed9.example.com"]
+
+
+def test_only_bulkhead_rejections_count_as_busy():
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers = {"Retry-After": "1"} if request.url.path == "/busy" else {}
+        return httpx.Response(503, headers=headers)
+
+    async def _run(report: LoadReport) -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://bench") as client:
+            await _timed(client, report, "busy", "GET", "/busy")
+            await _timed(client, report, "timeout", "GET", "/timeout")
+
+    report = LoadReport(elapsed_seconds=1.0)
+    asyncio.run(_run(report))
+    routes = report.as_dict()["routes"]
+
+    assert (routes["busy"]["busy"], routes["busy"]["errors"]) == (1, 0)
+    assert (routes["timeout"]["busy"], routes["timeout"]["errors"]) == (0, 1)
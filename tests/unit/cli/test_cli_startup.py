@@ -0,0 +1,15 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("fastapi", "sumup", "fpdf", "redis", "passlib", "alembic")
+
+
+@pytest.mark.parametrize("module", ["app.cli", "app.scheduler.jobs"])
+def test_cli_and_jobs_do_not_import_the_web_stack_or_optional_sdks(module):
+    script = f"import sys, {module}; print(','.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))"
+
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == ""
@@ -0,0 +1,37 @@
+from sqlalchemy import update
+
+from app import db
+from app.cli import cli
+from app.models import Membership
+
+
+def _drift(user):
+    db.session.execute(update(Membership).where(Membership.id == user.membership.id).values(initial_credits=3))
+    db.session.commit()
+
+
+def test_reconcile_reports_clean_ledger(runner, app, test_user):
+    result = runner.invoke(cli, ["credits", "reconcile"])
+
+    assert result.exit_code == 0
+    assert "All credit balances match the ledger" in result.output
+
+
+def test_reconcile_fails_on_drift_without_fix(runner, app, test_user):
+    _drift(test_user)
+
+    result = runner.invoke(cli, ["credits", "reconcile"])
+
+    assert result.exit_code == 1
+    assert "balance 3, ledger 20" in result.output
+
+
+def test_reconcile_fix_rebuilds_balances(runner, app, test_user):
+    _drift(test_user)
+
+    result = runner.invoke(cli, ["credits", "reconcile", "--fix"])
+
+    assert result.exit_code == 0
+    assert "Rebuilt 1 balance(s)" in result.output
+    db.session.refresh(test_user.membership)
+    assert test_user.membership.initial_credits == 20
@@ -18,3 +18,23 @@ def test_db_current_cli(mock_current, runner):
 
     assert result.exit_code == 0
     mock_current.assert_called_once()
+
+
+def test_db_wait_cli_returns_once_the_database_answers(runner):
+    result = runner.invoke(cli, ["db", "wait", "--timeout", "0"])
+
+    assert result.exit_code == 0
+    assert "Database is ready" in result.output
+
+
+def test_db_wait_cli_gives_up_after_the_timeout(runner, monkeypatch, tmp_path):
+    from sqlalchemy import create_engine
+
+    from app import db
+
+    monkeypatch.setattr(db, "engine", create_engine(f"sqlite:///{tmp_path}/missing/dir/app.db"))
+
+    result = runner.invoke(cli, ["db", "wait", "--timeout", "0.02", "--interval", "0.01"])
+
+    assert result.exit_code == 1
+    assert "Database not ready after" in result.output
@@ -0,0 +1,92 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import func, select
+
+from app import db
+from app.cli import cli
+from app.cli.seed import active_member_count, seed_club, seed_email
+from app.core.config import get_settings
+from app.models import CreditLedgerEntry, Payment, Shoot, ShootVisitor, User
+from app.services import credits
+from tests.http_helpers import login
+
+
+def _snapshot() -> dict:
+    return {
+        "users": db.session.execute(select(User.email, User.name, User.is_active).order_by(User.id)).all(),
+        "payments": db.session.execute(select(Payment.user_id, Payment.amount_cents, Payment.status).order_by(Payment.id)).all(),
+        "ledger": db.session.execute(select(CreditLedgerEntry.user_id, CreditLedgerEntry.delta, CreditLedgerEntry.reason).order_by(CreditLedgerEntry.id)).all(),
+    }
+
+
+def test_dev_seed_generates_a_consistent_club(runner, app):
+    result = runner.invoke(cli, ["dev", "seed", "--members", "150", "--years", "2", "--seed", "7"])
+
+    assert result.exit_code == 0, result.output
+    assert "✓ Generated" in result.output
+    assert db.session.scalar(select(func.count()).select_from(User).where(User.email.like("%@seed7.example.com"))) == 152
+    assert db.session.scalar(select(func.count()).select_from(Shoot)) > 100
+    assert db.session.scalar(select(func.count()).select_from(ShootVisitor)) > 0
+    assert set(db.session.scalars(select(Payment.status).distinct())) == {"completed", "pending", "failed", "cancelled"}
+    assert credits.find_balance_mismatches() == []
+
+
+def test_dev_seed_is_deterministic(app):
+    seed_club(db.session, members=40, years=2, seed=3)
+    first = _snapshot()
+    db.session.rollback()
+
+    seed_club(db.session, members=40, years=2, seed=3)
+
+    assert _snapshot() == first
+
+
+def test_dev_seed_dates_history_up_to_as_of(runner, app):
+    result = runner.invoke(cli, ["dev", "seed", "--members", "20", "--years", "2", "--seed", "5", "--as-of", "2024-06-30"])
+
+    assert result.exit_code == 0, result.output
+    assert "to 2024-06-30" in result.output
+    assert db.session.scalar(select(func.max(Shoot.date))) <= date(2024, 6, 30)
+    assert db.session.scalar(select(func.min(Shoot.date))) >= date(2022, 6, 30)
+
+
+def test_dev_seed_refuses_to_repeat_a_seed(runner, app):
+    assert runner.invoke(cli, ["dev", "seed", "--members", "5", "--years", "1", "--seed", "9"]).exit_code == 0
+
+    result = runner.invoke(cli, ["dev", "seed", "--members", "5", "--years", "1", "--seed", "9"])
+
+    assert result.exit_code == 1
+    assert "Seed 9 has already been generated" in result.output
+
+
+def test_dev_seed_refuses_production(runner, app, monkeypatch):
+    monkeypatch.setattr(get_settings(), "app_env", "production")
+
+    result = runner.invoke(cli, ["dev", "seed", "--members", "5"])
+
+    assert result.exit_code == 1
+    assert "Refusing to generate synthetic data in production" in result.output
+
+
+def test_seeded_admin_can_log_in(runner, client):
+    runner.invoke(cli, ["dev", "seed", "--members", "5", "--years", "1", "--seed", "11", "--password", "letmein1"])
+
+    login(client, seed_email("admin", 0, 11), "letmein1")
+
+    assert client.get("/admin/dashboard").status_code == 200
+
+
+def test_dev_seed_keeps_the_leading_members_active(app):
+    seed_club(db.session, members=40, years=1, admins=1, seed=5)
+    db.session.commit()
+
+    inactive = db.session.scalars(select(User.email).where(User.is_active.is_(False)).order_by(User.id)).all()
+
+    assert active_member_count(40) == 38
+    assert inactive == [seed_email("member", 38, 5), seed_email("member", 39, 5)]
+
+
+@pytest.mark.parametrize("args", [["--members", "0"], ["--years", "0"]])
+def test_dev_seed_validates_sizes(runner, app, args):
+    assert runner.invoke(cli, ["dev", "seed", *args]).exit_code == 2
@@ -204,3 +204,10 @@ class TestUsersCreateServiceFailure:
 
         assert result.exit_code == 1
         assert "✗ Something went wrong" in result.output
+
+
+def test_reindex_search_rebuilds_tokens(runner, app, test_user):
+    result = runner.invoke(cli, ["users", "reindex-search"])
+
+    assert result.exit_code == 0
+    assert "Search index rebuilt" in result.output
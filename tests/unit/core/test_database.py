@@ -1,13 +1,37 @@
 import asyncio
+import time
 
 import pytest
+from fastapi import Request
+from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app import db
+from app.core.database import PRIMARY_UNTIL_KEY, get_db, read_only, read_write
+from app.db import ReadOnlySessionError, get_current_session, is_read_only
+from app.db.session import LazySession
+from app.models import News
+
+
+def _request(method: str = "GET", endpoint=None, session: dict | None = None) -> Request:
+    return Request({"type": "http", "method": method, "headers": [], "session": {} if session is None else session, "endpoint": endpoint})
+
+
+def _session_for(request: Request) -> Session:
+    """Run get_db for ``request`` and return the session it bound."""
+
+    async def _run() -> Session:
+        dependency = get_db(request)
+        await anext(dependency)
+        session = get_current_session()
+        await dependency.aclose()
+        return session
+
+    return asyncio.run(_run())
 
 
 def test_get_db_yields_session_and_closes():
     async def _run():
-        agen = get_db()
+        agen = get_db(_request())
         session = await agen.__anext__()
         assert session is not None
         await agen.aclose()
@@ -17,9 +41,84 @@ def test_get_db_yields_session_and_closes():
 
 def test_get_db_rolls_back_on_exception():
     async def _run():
-        agen = get_db()
+        agen = get_db(_request())
         await agen.__anext__()
         with pytest.raises(RuntimeError, match="boom"):
             await agen.athrow(RuntimeError("boom"))
 
     asyncio.run(_run())
+
+
+def test_get_db_only_opens_a_session_when_the_request_uses_it(app, monkeypatch):
+    opened = []
+
+    def _factory():
+        opened.append(db.create_session())
+        return opened[-1]
+
+    monkeypatch.setattr(db, "lazy_session", lambda **_mode: LazySession(_factory))
+
+    async def _handle(uses_db: bool) -> None:
+        dependency = get_db(_request())
+        await anext(dependency)
+        if uses_db:
+            assert isinstance(get_current_session(), Session)
+        await dependency.aclose()
+
+    current = get_current_session()
+    asyncio.run(_handle(uses_db=False))
+    assert opened == []
+
+    asyncio.run(_handle(uses_db=True))
+    assert len(opened) == 1
+    assert get_current_session() is current
+
+
+def test_get_requests_get_a_session_that_refuses_writes(app):
+    session = _session_for(_request("GET"))
+
+    assert is_read_only(session)
+    session.add(News(title="Hello", content="Body", published=True))
+    with pytest.raises(ReadOnlySessionError):
+        session.flush()
+    session.rollback()
+
+    assert not is_read_only(_session_for(_request("POST")))
+
+
+def test_routes_can_override_the_method_default(app):
+    @read_write
+    def confirm(): ...
+
+    @read_only
+    def report(): ...
+
+    assert not is_read_only(_session_for(_request("GET", endpoint=confirm)))
+    assert is_read_only(_session_for(_request("POST", endpoint=report)))
+
+
+def test_reads_go_to_the_replica_until_the_visitor_writes(app, monkeypatch):
+    replica_sessions = []
+
+    def _replica_factory():
+        replica_sessions.append(db._session_factory())
+        return replica_sessions[-1]
+
+    monkeypatch.setattr(db, "_replica_session_factory", _replica_factory)
+    visitor: dict = {}
+
+    assert _session_for(_request("GET", session=visitor)) is replica_sessions[-1]
+    assert is_read_only(replica_sessions[-1])
+
+    _session_for(_request("POST", session=visitor))
+    assert len(replica_sessions) == 1
+    assert visitor[PRIMARY_UNTIL_KEY] > time.time()
+
+    # The page after the redirect must see the write, so it reads from the primary.
+    after_redirect = _session_for(_request("GET", session=visitor))
+    assert len(replica_sessions) == 1
+    assert is_read_only(after_redirect)
+
+    visitor[PRIMARY_UNTIL_KEY] = time.time() - 1
+    assert _session_for(_request("GET", session=visitor)) is replica_sessions[-1]
+    assert len(replica_sessions) == 2
@@ -0,0 +1,29 @@
+from sqlalchemy import text
+
+from app import db
+from app.db.session import LazySession
+
+
+class _Factory:
+    def __init__(self):
+        self.sessions = []
+
+    def __call__(self):
+        session = db.create_session()
+        self.sessions.append(session)
+        return session
+
+
+def test_lazy_session_is_created_on_first_use(app):
+    factory = _Factory()
+    lazy = LazySession(factory)
+
+    lazy.rollback()
+    lazy.close()
+    assert not lazy.opened
+    assert factory.sessions == []
+
+    assert lazy.execute(text("SELECT 1")).scalar() == 1
+    assert lazy.opened
+    assert lazy.get() is factory.sessions[0]
+    lazy.close()
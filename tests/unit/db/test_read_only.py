@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import update
+
+from app import db
+from app.core.config import get_settings
+from app.db import Database, ReadOnlySessionError, is_read_only, mark_read_only
+from app.db.read_only import _begin_read_only
+from app.models import News
+
+
+def test_read_only_session_refuses_flushes_and_bulk_writes(app):
+    session = mark_read_only(db.create_session())
+
+    session.add(News(title="Hello", content="Body", published=True))
+    with pytest.raises(ReadOnlySessionError):
+        session.flush()
+    session.rollback()
+    with pytest.raises(ReadOnlySessionError):
+        session.execute(update(News).values(title="Renamed"))
+    session.close()
+
+
+def test_read_only_session_can_query_and_commit_without_changes(app):
+    session = db.create_session(read_only=True)
+
+    assert is_read_only(session)
+    assert session.query(News).count() == 0
+    session.commit()
+    session.close()
+
+
+def test_replica_sessions_fall_back_to_the_primary_read_only(app):
+    session = db.create_session(replica=True)
+
+    assert is_read_only(session)
+    assert session.query(News).count() == 0
+    session.close()
+
+
+def test_database_binds_replica_sessions_to_the_replica_engine():
+    database = Database()
+    database.init(get_settings().model_copy(update={"database_url": "sqlite://", "database_replica_url": "sqlite://"}))
+
+    replica = database.create_session(replica=True)
+    primary = database.create_session(read_only=True)
+
+    assert database.has_replica
+    assert replica.get_bind() is database.replica_engine
+    assert primary.get_bind() is database.engine
+    assert is_read_only(replica)
+    replica.close()
+    primary.close()
+    database.replica_engine.dispose()
+    database.engine.dispose()
+
+
+@pytest.mark.parametrize(("dialect", "statements"), [("mysql", ["SET TRANSACTION READ ONLY"]), ("sqlite", [])])
+def test_mysql_transactions_start_read_only(app, dialect, statements):
+    sent = []
+    connection = SimpleNamespace(dialect=SimpleNamespace(name=dialect), exec_driver_sql=sent.append)
+    session = mark_read_only(db.create_session())
+
+    _begin_read_only(session, SimpleNamespace(parent=None), connection)
+    _begin_read_only(session, SimpleNamespace(parent=object()), connection)
+    _begin_read_only(mark_read_only(db.create_session(), False), SimpleNamespace(parent=None), connection)
+
+    assert sent == statements
+    session.close()
@@ -0,0 +1,57 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+
+from app import db
+from app.db.statement_timeouts import _is_timeout, _limit_statement
+from app.exceptions import DeadlineExceeded
+from app.utils.deadline import deadline
+
+# Counts to a billion, far longer than any budget here.
+_SLOW_QUERY = text("WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 1000000000) SELECT count(*) FROM n")
+_MYSQL = SimpleNamespace(dialect=SimpleNamespace(name="mysql"))
+
+
+def test_statements_run_normally_within_budget(app):
+    with deadline(5):
+        assert db.session.execute(text("SELECT 1")).scalar() == 1
+
+
+def test_overrunning_statement_is_interrupted(app):
+    started = time.monotonic()
+    with deadline(0.05), pytest.raises(DeadlineExceeded):
+        db.session.execute(_SLOW_QUERY)
+
+    assert time.monotonic() - started < 2
+    db.session.rollback()
+    assert db.session.execute(text("SELECT 1")).scalar() == 1
+
+
+def test_spent_budget_refuses_further_statements(app):
+    with deadline(0.001):
+        time.sleep(0.002)
+        with pytest.raises(DeadlineExceeded):
+            db.session.execute(text("SELECT 1"))
+    db.session.rollback()
+
+
+def test_mysql_selects_carry_the_remaining_budget():
+    with deadline(2):
+        statement, params = _limit_statement(_MYSQL, None, "  select id FROM users WHERE id = %s", (1,), None, False)
+        update, _ = _limit_statement(_MYSQL, None, "UPDATE users SET name = %s", ("x",), None, False)
+
+    milliseconds = int(statement.split("MAX_EXECUTION_TIME(")[1].split(")")[0])
+    assert statement.startswith("SELECT /*+ MAX_EXECUTION_TIME(")
+    assert statement.endswith(" id FROM users WHERE id = %s")
+    assert 1000 < milliseconds <= 2000
+    assert params == (1,)
+    assert update == "UPDATE users SET name = %s"
+    assert _limit_statement(_MYSQL, None, "SELECT 1", (), None, False) == ("SELECT 1", ())
+
+
+def test_mysql_statement_timeout_is_recognised():
+    assert _is_timeout(Exception(3024, "Query execution was interrupted, maximum statement execution time exceeded"))
+    assert not _is_timeout(Exception(1213, "Deadlock found"))
+    assert not _is_timeout(None)
@@ -0,0 +1,54 @@
+from sqlalchemy import update
+
+from app import db
+from app.db import write_tracking
+from app.models import Membership, News
+
+
+def _track(monkeypatch, tables):
+    calls = []
+    monkeypatch.setattr(write_tracking, "_listeners", [])
+    write_tracking.on_commit_writing(tables, lambda: calls.append(1))
+    return calls
+
+
+def test_commit_of_flushed_write_runs_listener(app, monkeypatch, test_user):
+    calls = _track(monkeypatch, ["users"])
+
+    test_user.name = "Renamed"
+    db.session.commit()
+
+    assert calls == [1]
+
+
+def test_bulk_update_counts_as_write(app, monkeypatch, test_user):
+    calls = _track(monkeypatch, ["memberships"])
+
+    db.session.execute(update(Membership).where(Membership.user_id == test_user.id).values(purchased_credits=3))
+    db.session.commit()
+
+    assert calls == [1]
+
+
+def test_unrelated_and_rolled_back_writes_are_ignored(app, monkeypatch, test_user):
+    calls = _track(monkeypatch, ["users"])
+
+    test_user.name = "Rolled back"
+    db.session.flush()
+    db.session.rollback()
+    db.session.commit()
+    db.session.add(News(title="Hello", content="Body", published=True))
+    db.session.commit()
+
+    assert calls == []
+
+
+def test_failing_listener_does_not_break_commit(app, monkeypatch, test_user, caplog):
+    monkeypatch.setattr(write_tracking, "_listeners", [])
+    write_tracking.on_commit_writing(["users"], lambda: 1 / 0)
+
+    test_user.name = "Still saved"
+    db.session.commit()
+
+    assert "Commit listener" in caplog.text
+    assert db.session.get(type(test_user), test_user.id).name == "Still saved"
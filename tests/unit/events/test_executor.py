@@ -0,0 +1,120 @@
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+from starlette.responses import Response
+
+from app.events.background import DeferredHandler, Priority, defer_handler
+from app.events.executor import SideEffectExecutor, get_side_effect_executor, shutdown_side_effect_executor
+from app.main import run_deferred_event_handlers
+from app.metrics import DEFERRED_HANDLERS_PENDING, SIDE_EFFECT_QUEUE_WAIT, SIDE_EFFECT_TIMEOUTS, SIDE_EFFECTS_REJECTED
+from app.utils.deadline import remaining
+
+
+@pytest.fixture
+def executor():
+    executor = SideEffectExecutor(workers=1, queue_limit=3, timeout_seconds=5)
+    yield executor
+    executor.shutdown(timeout=5)
+
+
+def _block(executor: SideEffectExecutor) -> threading.Event:
+    """Occupy the only worker until the returned event is set."""
+    started, release = threading.Event(), threading.Event()
+
+    def blocker() -> None:
+        started.set()
+        release.wait(5)
+
+    executor.submit(DeferredHandler(blocker, (), {}))
+    assert started.wait(5)
+    return release
+
+
+def test_receipts_and_ledger_run_before_notifications(app, executor):
+    ran: list[str] = []
+
+    def record(name: str) -> None:
+        ran.append(name)
+
+    release = _block(executor)
+    executor.submit(DeferredHandler(record, ("admin notification",), {}, Priority.NOTIFICATION))
+    executor.submit(DeferredHandler(record, ("reset email",), {}, Priority.MEMBER))
+    executor.submit(DeferredHandler(record, ("receipt",), {}, Priority.LEDGER))
+    release.set()
+    executor.shutdown(timeout=5)
+
+    assert ran == ["receipt", "reset email", "admin notification"]
+    assert SIDE_EFFECT_QUEUE_WAIT.count(priority="ledger") >= 1
+
+
+def test_full_queue_drops_the_handler(app, executor):
+    def send_mail() -> None:
+        pass
+
+    rejected = SIDE_EFFECTS_REJECTED.value(handler="send_mail")
+    pending = DEFERRED_HANDLERS_PENDING.value()
+    release = _block(executor)
+
+    accepted = [executor.submit(DeferredHandler(send_mail, (), {})) for _ in range(4)]
+    release.set()
+
+    assert accepted == [True, True, True, False]
+    assert executor.pending() <= 3
+    assert SIDE_EFFECTS_REJECTED.value(handler="send_mail") == rejected + 1
+    executor.shutdown(timeout=5)
+    assert DEFERRED_HANDLERS_PENDING.value() == pending
+
+
+def test_handlers_run_within_their_time_budget(app):
+    budgets: list[float | None] = []
+
+    def slow_smtp() -> None:
+        budgets.append(remaining())
+        threading.Event().wait(0.05)
+
+    def quick() -> None:
+        budgets.append(remaining())
+
+    executor = SideEffectExecutor(workers=1, queue_limit=5, timeout_seconds=5, handler_timeouts={"slow_smtp": 0.01})
+    timeouts = SIDE_EFFECT_TIMEOUTS.value(handler="slow_smtp")
+
+    executor.submit(DeferredHandler(slow_smtp, (), {}))
+    executor.submit(DeferredHandler(quick, (), {}))
+    executor.shutdown(timeout=5)
+
+    assert budgets[0] is not None and budgets[0] <= 0.01
+    assert budgets[1] is not None and 0.01 < budgets[1] <= 5
+    assert SIDE_EFFECT_TIMEOUTS.value(handler="slow_smtp") == timeouts + 1
+
+
+def test_shared_executor_uses_settings_and_restarts_after_shutdown():
+    shared = get_side_effect_executor()
+
+    assert get_side_effect_executor() is shared
+    assert shared.workers == 4
+    assert shared.queue_limit == 1000
+
+    shutdown_side_effect_executor()
+    assert get_side_effect_executor() is not shared
+    shutdown_side_effect_executor()
+
+
+def test_middleware_hands_deferred_handlers_to_the_executor(monkeypatch):
+    submitted: list[DeferredHandler] = []
+    monkeypatch.setattr("app.main.settings", Mock(is_testing=False))
+    monkeypatch.setattr("app.events.executor.get_side_effect_executor", lambda: Mock(submit=submitted.append))
+
+    def send_receipt(payment_id: int) -> None:
+        pass
+
+    async def call_next(_request):
+        defer_handler(send_receipt, payment_id=7, priority=Priority.LEDGER)
+        return Response("ok")
+
+    async def _request():
+        return await run_deferred_event_handlers(Mock(), call_next)
+
+    assert asyncio.run(_request()).body == b"ok"
+    assert submitted == [DeferredHandler(send_receipt, (), {"payment_id": 7}, Priority.LEDGER)]
@@ -0,0 +1,150 @@
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from sqlalchemy import text
+
+from app import db
+from app.metrics import (
+    DB_CONNECTION_HOLD,
+    DB_STATEMENT_DURATION,
+    DEFERRED_HANDLER_DURATION,
+    DEFERRED_HANDLER_FAILURES,
+    DEFERRED_HANDLERS_PENDING,
+    SCHEDULER_JOB_DURATION,
+    SMTP_SEND_DURATION,
+    SUMUP_ERRORS,
+    SUMUP_REQUEST_DURATION,
+    Histogram,
+    Registry,
+    observe_duration,
+)
+from app.metrics.database import BACKGROUND, connection_owner, instrument_engine, statement_operation
+from app.utils.mail import send_email
+
+
+@pytest.mark.parametrize(
+    ("statement", "operation"),
+    [("SELECT 1", "SELECT"), ("  insert into x values (1)", "INSERT"), ("SAVEPOINT sa_1", "OTHER"), ("", "OTHER")],
+)
+def test_statement_operation(statement, operation):
+    assert statement_operation(statement) == operation
+
+
+def test_database_statements_are_timed(app):
+    before = DB_STATEMENT_DURATION.count(operation="SELECT")
+
+    db.session.execute(text("SELECT 1"))
+
+    assert DB_STATEMENT_DURATION.count(operation="SELECT") == before + 1
+
+
+def test_failed_statements_are_still_timed(app):
+    before = DB_STATEMENT_DURATION.count(operation="SELECT")
+
+    with pytest.raises(Exception):
+        db.session.execute(text("SELECT * FROM no_such_table"))
+    db.session.rollback()
+
+    assert DB_STATEMENT_DURATION.count(operation="SELECT") == before + 1
+
+
+def test_connection_hold_time_is_labelled_by_owner():
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import QueuePool
+
+    engine = create_engine("sqlite://", poolclass=QueuePool)
+    instrument_engine(engine)
+    before_route = DB_CONNECTION_HOLD.count(route="member.dashboard")
+    before_background = DB_CONNECTION_HOLD.count(route=BACKGROUND)
+    try:
+        with connection_owner(lambda: "member.dashboard"), engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    finally:
+        engine.dispose()
+
+    assert DB_CONNECTION_HOLD.count(route="member.dashboard") == before_route + 1
+    assert DB_CONNECTION_HOLD.count(route=BACKGROUND) == before_background + 1
+
+
+def test_observe_duration_records_outcome():
+    histogram = Histogram("sea_test_seconds", "Test.", ["op", "outcome"], registry=Registry())
+
+    with observe_duration(histogram, op="a"):
+        pass
+    with pytest.raises(RuntimeError), observe_duration(histogram, op="a"):
+        raise RuntimeError("boom")
+    with observe_duration(histogram, op="a") as labels:
+        labels["outcome"] = "skipped"
+
+    assert histogram.count(op="a", outcome="ok") == 1
+    assert histogram.count(op="a", outcome="error") == 1
+    assert histogram.count(op="a", outcome="skipped") == 1
+
+
+def test_deferred_handler_failures_and_pending_depth_are_recorded(app):
+    from app.events.background import mark_handler_pending, run_pending_handler
+
+    def broken_handler() -> None:
+        raise RuntimeError("boom")
+
+    failures = DEFERRED_HANDLER_FAILURES.value(handler="broken_handler")
+    mark_handler_pending()
+    assert DEFERRED_HANDLERS_PENDING.value() >= 1
+    pending = DEFERRED_HANDLERS_PENDING.value()
+
+    run_pending_handler(broken_handler)
+
+    assert DEFERRED_HANDLER_FAILURES.value(handler="broken_handler") == failures + 1
+    assert DEFERRED_HANDLER_DURATION.count(handler="broken_handler") >= 1
+    assert DEFERRED_HANDLERS_PENDING.value() == pending - 1
+
+
+def test_smtp_send_latency_is_recorded():
+    mock_settings = Mock(
+        mail_default_sender="noreply@example.com",
+        mail_server="smtp.example.com",
+        mail_port=587,
+        mail_use_ssl=False,
+        mail_use_tls=False,
+        mail_username=None,
+        mail_password=None,
+    )
+    mock_smtp = MagicMock()
+    mock_smtp.__enter__.return_value.send_message.side_effect = OSError("refused")
+    before = SMTP_SEND_DURATION.count(outcome="error")
+
+    with (
+        patch("app.utils.mail.get_settings", return_value=mock_settings),
+        patch("app.utils.mail.smtplib.SMTP", return_value=mock_smtp),
+    ):
+        send_email("Subject", ["a@example.com"], "Body")
+
+    assert SMTP_SEND_DURATION.count(outcome="error") == before + 1
+
+
+@patch("sumup.Sumup")
+def test_sumup_errors_are_counted(mock_sumup_class):
+    from app.services.sumup import SumUpService
+
+    mock_client = Mock()
+    mock_client.checkouts.get.side_effect = RuntimeError("timeout")
+    mock_sumup_class.return_value = mock_client
+    errors = SUMUP_ERRORS.value(operation="get_checkout")
+    calls = SUMUP_REQUEST_DURATION.count(operation="get_checkout", outcome="error")
+
+    assert SumUpService(api_key="key").get_checkout("abc") is None
+
+    assert SUMUP_ERRORS.value(operation="get_checkout") == errors + 1
+    assert SUMUP_REQUEST_DURATION.count(operation="get_checkout", outcome="error") == calls + 1
+
+
+def test_scheduler_event_run_is_timed():
+    from app.scheduler import Event
+
+    before = SCHEDULER_JOB_DURATION.count(job="nightly", outcome="ok")
+
+    Event(lambda: None, "nightly").run()
+
+    assert SCHEDULER_JOB_DURATION.count(job="nightly", outcome="ok") == before + 1
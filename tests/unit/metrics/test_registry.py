@@ -0,0 +1,157 @@
+import json
+import os
+import time
+
+import pytest
+
+from app.metrics import registry as registry_module
+from app.metrics.registry import Counter, Gauge, Histogram, Registry
+
+
+@pytest.fixture
+def registry():
+    registry = Registry()
+    yield registry
+    registry.stop()
+
+
+def test_counter_renders_with_labels(registry):
+    requests = Counter("sea_test_total", "Test counter.", ["route"], registry=registry)
+    requests.inc(route="home")
+    requests.inc(2, route="home")
+
+    text = registry.render()
+
+    assert "# TYPE sea_test_total counter" in text
+    assert 'sea_test_total{route="home"} 3.0' in text
+    assert requests.value(route="home") == 3
+
+
+def test_counter_rejects_wrong_labels_and_negative_amounts(registry):
+    counter = Counter("sea_test_total", "Test counter.", ["route"], registry=registry)
+
+    with pytest.raises(ValueError):
+        counter.inc(path="/")
+    with pytest.raises(ValueError):
+        counter.inc(-1, route="home")
+
+
+def test_duplicate_metric_names_are_rejected(registry):
+    Counter("sea_test_total", "Test counter.", registry=registry)
+
+    with pytest.raises(ValueError):
+        Counter("sea_test_total", "Again.", registry=registry)
+
+
+def test_gauge_moves_both_ways(registry):
+    gauge = Gauge("sea_test_pending", "Test gauge.", registry=registry)
+    gauge.inc(3)
+    gauge.dec()
+
+    assert "sea_test_pending 2.0" in registry.render()
+    gauge.set(7)
+    assert "sea_test_pending 7.0" in registry.render()
+
+
+def test_histogram_renders_cumulative_buckets(registry):
+    histogram = Histogram("sea_test_seconds", "Test histogram.", ["op"], buckets=(0.1, 1.0), registry=registry)
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value, op="read")
+
+    text = registry.render()
+
+    assert 'sea_test_seconds_bucket{op="read",le="0.1"} 1' in text
+    assert 'sea_test_seconds_bucket{op="read",le="1.0"} 3' in text
+    assert 'sea_test_seconds_bucket{op="read",le="+Inf"} 4' in text
+    assert 'sea_test_seconds_sum{op="read"} 4.05' in text
+    assert 'sea_test_seconds_count{op="read"} 4' in text
+    assert histogram.count(op="read") == 4
+
+
+def test_label_values_and_help_are_escaped(registry):
+    counter = Counter("sea_test_total", "Line one\nline two.", ["path"], registry=registry)
+    counter.inc(path='say "hi"\\')
+
+    text = registry.render()
+
+    assert "# HELP sea_test_total Line one\\nline two." in text
+    assert 'sea_test_total{path="say \\"hi\\"\\\\"} 1.0' in text
+
+
+def test_reset_clears_samples(registry):
+    counter = Counter("sea_test_total", "Test counter.", registry=registry)
+    counter.inc()
+    registry.reset()
+
+    assert counter.value() == 0
+
+
+def test_multiprocess_merges_snapshots_and_drops_dead_gauges(registry, tmp_path):
+    counter = Counter("sea_test_total", "Test counter.", ["route"], registry=registry)
+    gauge = Gauge("sea_test_pending", "Test gauge.", registry=registry)
+    histogram = Histogram("sea_test_seconds", "Test histogram.", buckets=(1.0,), registry=registry)
+    registry.configure(tmp_path / "metrics")
+
+    counter.inc(route="home")
+    gauge.inc(2)
+    histogram.observe(0.5)
+    dead_worker = {
+        "pid": 2**22 + 1,
+        "metrics": {
+            "sea_test_total": [[["home"], 4.0]],
+            "sea_test_pending": [[[], 5.0]],
+            "sea_test_seconds": [[[], [[0, 1], 2.0]]],
+            "sea_retired_total": [[[], 1.0]],
+        },
+    }
+    (tmp_path / "metrics" / "dead.json").write_text(json.dumps(dead_worker))
+    (tmp_path / "metrics" / "broken.json").write_text("{")
+
+    text = registry.render()
+
+    assert list((tmp_path / "metrics").glob(f"{os.getpid()}-*.json"))
+    assert 'sea_test_total{route="home"} 5.0' in text
+    assert "sea_test_pending 2.0" in text
+    assert 'sea_test_seconds_bucket{le="1.0"} 1' in text
+    assert "sea_test_seconds_count 2" in text
+    assert "sea_retired_total" not in text
+
+
+def test_recording_a_sample_does_not_write_a_snapshot(registry, tmp_path):
+    counter = Counter("sea_test_total", "Test counter.", registry=registry)
+    registry.configure(tmp_path)
+
+    counter.inc()
+
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_background_thread_flushes_to_the_multiprocess_directory(registry, tmp_path, monkeypatch):
+    monkeypatch.setattr(registry_module, "FLUSH_INTERVAL_SECONDS", 0.01)
+    counter = Counter("sea_test_total", "Test counter.", registry=registry)
+    registry.configure(tmp_path)
+
+    counter.inc()
+    deadline = time.monotonic() + 5
+    while not list(tmp_path.glob("*.json")) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    (path,) = tmp_path.glob("*.json")
+    snapshot = json.loads(path.read_text())
+    assert path.name == f"{os.getpid()}-{snapshot['started']}.json"
+    assert snapshot["metrics"]["sea_test_total"] == [[[], 1.0]]
+
+
+def test_reused_pid_keeps_exited_worker_totals_but_not_its_gauges(registry, tmp_path):
+    counter = Counter("sea_test_total", "Test counter.", registry=registry)
+    gauge = Gauge("sea_test_pending", "Test gauge.", registry=registry)
+    registry.configure(tmp_path)
+    counter.inc()
+    gauge.set(1)
+    exited = {"pid": os.getpid(), "started": 1, "metrics": {"sea_test_total": [[[], 4.0]], "sea_test_pending": [[[], 5.0]]}}
+    (tmp_path / f"{os.getpid()}-1.json").write_text(json.dumps(exited))
+
+    text = registry.render()
+
+    assert "sea_test_total 5.0" in text
+    assert "sea_test_pending 1.0" in text
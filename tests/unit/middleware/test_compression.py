@@ -0,0 +1,265 @@
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import HTMLResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.middleware import compression
+from app.middleware.compression import CompressionMiddleware, is_compressible, negotiate_encoding
+
+BIG_HTML = "<tr><td>Member</td><td>member@example.com</td></tr>" * 200
+
+
+def _app(minimum_size: int = 500) -> Starlette:
+    async def big(_request):
+        return HTMLResponse(BIG_HTML)
+
+    async def small(_request):
+        return HTMLResponse("<p>hi</p>")
+
+    async def pdf(_request):
+        return Response(b"%PDF" * 500, media_type="application/pdf")
+
+    async def encoded(_request):
+        return Response(gzip.compress(BIG_HTML.encode()), media_type="text/html", headers={"content-encoding": "gzip"})
+
+    async def no_transform(_request):
+        return HTMLResponse(BIG_HTML, headers={"cache-control": "no-transform"})
+
+    async def empty(_request):
+        return Response(status_code=204)
+
+    async def partial(_request):
+        return HTMLResponse(BIG_HTML[:1000], status_code=206, headers={"content-range": f"bytes 0-999/{len(BIG_HTML)}"})
+
+    async def ranged(_request):
+        return HTMLResponse(BIG_HTML, headers={"content-range": f"bytes 0-{len(BIG_HTML) - 1}/{len(BIG_HTML)}"})
+
+    async def tagged(_request):
+        return HTMLResponse(BIG_HTML, headers={"etag": '"v1"'})
+
+    async def stream(_request):
+        async def chunks():
+            for i in range(3):
+                yield f"<p>chunk {i}</p>".encode()
+
+        return StreamingResponse(chunks(), media_type="text/html")
+
+    app = Starlette(
+        routes=[
+            Route("/big", big),
+            Route("/small", small),
+            Route("/pdf", pdf),
+            Route("/encoded", encoded),
+            Route("/no-transform", no_transform),
+            Route("/empty", empty),
+            Route("/partial", partial),
+            Route("/ranged", ranged),
+            Route("/tagged", tagged),
+            Route("/stream", stream),
+        ]
+    )
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size)
+    return app
+
+
+@pytest.fixture
+def http():
+    with TestClient(_app()) as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip, deflate", "gzip"),
+        ("GZIP", "gzip"),
+        ("identity", None),
+        ("", None),
+        ("gzip;q=0", None),
+        ("gzip;q=bogus", None),
+        ("*", "gzip"),
+        ("*;q=0.5, gzip;q=0", None),
+        ("deflate, , gzip;q=0.4", "gzip"),
+    ],
+)
+def test_negotiate_encoding_without_brotli(monkeypatch, header, expected):
+    monkeypatch.setattr(compression, "_brotli", None)
+    assert negotiate_encoding(header) == expected
+
+
+def test_negotiate_encoding_prefers_brotli_when_available(monkeypatch):
+    monkeypatch.setattr(compression, "_brotli", object())
+    assert negotiate_encoding("gzip, br") == "br"
+    assert negotiate_encoding("gzip, br;q=0.1") == "gzip"
+    assert compression.supported_encodings() == ("br", "gzip")
+
+
+def test_is_compressible():
+    assert is_compressible("text/html; charset=utf-8")
+    assert is_compressible("application/json")
+    assert not is_compressible("application/pdf")
+    assert not is_compressible("")
+
+
+def test_large_html_is_gzipped_with_exact_length(http):
+    response = http.get("/big", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == response.num_bytes_downloaded
+    assert response.num_bytes_downloaded < len(BIG_HTML) / 10
+    assert response.text == BIG_HTML
+
+
+def test_small_body_below_threshold_is_not_compressed(http):
+    response = http.get("/small", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text == "<p>hi</p>"
+
+
+def test_identity_client_gets_plain_body(http):
+    response = http.get("/big", headers={"accept-encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.num_bytes_downloaded == len(BIG_HTML)
+
+
+@pytest.mark.parametrize("path", ["/pdf", "/encoded", "/no-transform", "/empty", "/partial", "/ranged"])
+def test_ineligible_responses_pass_through(http, path):
+    response = http.get(path, headers={"accept-encoding": "gzip"})
+    if path == "/encoded":
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == BIG_HTML
+    else:
+        assert "content-encoding" not in response.headers
+
+
+def test_strong_etag_is_weakened_on_encoded_body(http):
+    response = http.get("/tagged", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == 'W/"v1"'
+
+    plain = http.get("/tagged", headers={"accept-encoding": "identity"})
+    assert plain.headers["etag"] == '"v1"'
+
+
+def test_streaming_response_is_compressed_incrementally():
+    messages: list[dict] = []
+
+    async def inner(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/html")]})
+        for i in range(3):
+            await send({"type": "http.response.body", "body": f"<p>chunk {i}</p>".encode(), "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", b"gzip")]}
+    asyncio.run(CompressionMiddleware(inner)(scope, receive, send))
+
+    start, *bodies = messages
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    assert len(bodies) == 4
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for i, message in enumerate(bodies[:3]):
+        assert message["more_body"] is True
+        assert message["body"], "each chunk must be flushed immediately"
+        assert decompressor.decompress(message["body"]) == f"<p>chunk {i}</p>".encode()
+    assert bodies[3]["more_body"] is False
+    decompressor.decompress(bodies[3]["body"])
+    assert decompressor.eof
+
+
+def test_streaming_response_round_trips_through_client(http):
+    response = http.get("/stream", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == "<p>chunk 0</p><p>chunk 1</p><p>chunk 2</p>"
+
+
+def test_non_http_scope_passes_through():
+    called = []
+
+    async def inner(scope, receive, send):
+        called.append(scope["type"])
+
+    asyncio.run(CompressionMiddleware(inner)({"type": "lifespan"}, None, None))
+    assert called == ["lifespan"]
+
+
+def test_non_body_messages_are_forwarded():
+    messages: list[dict] = []
+
+    async def inner(scope, receive, send):
+        await send({"type": "http.response.trailers", "headers": []})
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", b"gzip")]}
+    asyncio.run(CompressionMiddleware(inner)(scope, None, send))
+    assert messages == [{"type": "http.response.trailers", "headers": []}]
+
+
+def test_held_start_is_flushed_before_pathsend():
+    messages: list[dict] = []
+    start = {"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/html")]}
+
+    async def inner(scope, receive, send):
+        await send(start)
+        await send({"type": "http.response.pathsend", "path": "/srv/static/index.html"})
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", b"gzip")]}
+    asyncio.run(CompressionMiddleware(inner)(scope, None, send))
+    assert messages == [start, {"type": "http.response.pathsend", "path": "/srv/static/index.html"}]
+
+
+def test_brotli_encoding_uses_brotli_compressor(monkeypatch):
+    class FakeCompressor:
+        def __init__(self, quality):
+            self.quality = quality
+
+        def process(self, data):
+            return b"[" + data
+
+        def flush(self):
+            return b"|"
+
+        def finish(self):
+            return b"]"
+
+    monkeypatch.setattr(compression, "_brotli", type("FakeBrotli", (), {"Compressor": FakeCompressor}))
+    messages: list[dict] = []
+
+    async def inner(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/html")]})
+        await send({"type": "http.response.body", "body": b"a", "more_body": True})
+        await send({"type": "http.response.body", "body": b"b", "more_body": False})
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", b"br, gzip")]}
+    asyncio.run(CompressionMiddleware(inner)(scope, None, send))
+
+    assert dict(messages[0]["headers"])[b"content-encoding"] == b"br"
+    assert b"".join(m["body"] for m in messages[1:]) == b"[a|[b]"
+
+
+def test_app_pages_are_compressed_for_browsers(client):
+    response = client.get("/auth/login", headers={"accept-encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "csrf_token" in response.text
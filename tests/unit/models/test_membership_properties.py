@@ -49,47 +49,20 @@ def test_credits_remaining_equals_initial_plus_purchased(initial, purchased):
 
 
 @pytest.mark.parametrize(
-    "initial,purchased,expected_result,expected_remaining",
+    "initial,purchased,expected_bucket",
     [
-        (5, 0, True, 4),
-        (0, 3, True, 2),
-        (0, 0, False, 0),
-        (-2, 0, False, -2),
-        (0, -1, False, -1),
+        (10, 5, "initial_credits"),
+        (1, 20, "initial_credits"),
+        (-2, 4, "purchased_credits"),
     ],
 )
-def test_use_credit_decreases_total_by_one_when_successful(initial, purchased, expected_result, expected_remaining):
-    m = _make_membership(initial=initial, purchased=purchased)
-    before = m.credits_remaining()
-
-    result = m.use_credit()
-
-    assert result is expected_result
-    assert m.credits_remaining() == expected_remaining
-    if expected_result:
-        assert m.credits_remaining() == before - 1
-
-
-@pytest.mark.parametrize(
-    "initial,purchased,expected_initial,expected_purchased",
-    [
-        (10, 5, 9, 5),
-        (1, 20, 0, 20),
-    ],
-)
-def test_use_credit_takes_initial_first(initial, purchased, expected_initial, expected_purchased):
-    m = _make_membership(initial=initial, purchased=purchased)
-    m.use_credit()
-    assert m.initial_credits == expected_initial
-    assert m.purchased_credits == expected_purchased
+def test_credit_bucket_takes_initial_first(initial, purchased, expected_bucket):
+    assert Membership.credit_bucket(initial, purchased, active=True) == expected_bucket
 
 
 @pytest.mark.parametrize("purchased", [1, 5, 20])
-def test_use_credit_takes_purchased_when_initial_zero(purchased):
-    m = _make_membership(initial=0, purchased=purchased)
-    m.use_credit()
-    assert m.initial_credits == 0
-    assert m.purchased_credits == purchased - 1
+def test_credit_bucket_takes_purchased_when_initial_zero(purchased):
+    assert Membership.credit_bucket(0, purchased, active=True) == "purchased_credits"
 
 
 @pytest.mark.parametrize(
@@ -99,14 +72,12 @@ def test_use_credit_takes_purchased_when_initial_zero(purchased):
         (-5, 0),
         (0, -2),
         (-10, -3),
+        (-2, 0),
+        (0, -1),
     ],
 )
-def test_use_credit_no_mutation_on_false(initial, purchased):
-    m = _make_membership(initial=initial, purchased=purchased)
-    result = m.use_credit(allow_negative=False)
-    assert result is False
-    assert m.initial_credits == initial
-    assert m.purchased_credits == purchased
+def test_credit_bucket_is_none_without_credit_to_spend(initial, purchased):
+    assert Membership.credit_bucket(initial, purchased, active=True, allow_negative=False) is None
 
 
 @pytest.mark.parametrize(
@@ -147,19 +118,17 @@ def test_remove_credits_deducts_initial_first(initial, purchased, amount, expect
 @pytest.mark.parametrize(
     "initial,purchased,operations",
     [
-        (10, 5, [("use", None), ("use", None), ("add", 3)]),
-        (5, 5, [("add", 10), ("remove", 4), ("use", None)]),
-        (0, 10, [("use", None), ("use", None), ("remove", 2), ("add", 5)]),
-        (20, 0, [("remove", 15), ("use", None), ("add", 1), ("use", None)]),
+        (10, 5, [("remove", 1), ("remove", 1), ("add", 3)]),
+        (5, 5, [("add", 10), ("remove", 4), ("remove", 1)]),
+        (0, 10, [("remove", 1), ("remove", 1), ("remove", 2), ("add", 5)]),
+        (20, 0, [("remove", 15), ("remove", 1), ("add", 1), ("remove", 1)]),
     ],
 )
 def test_credits_remaining_invariant_after_operations(initial, purchased, operations):
     m = _make_membership(initial=initial, purchased=purchased)
 
     for op, arg in operations:
-        if op == "use":
-            m.use_credit()
-        elif op == "add":
+        if op == "add":
             m.add_credits(arg)
         elif op == "remove":
             m.remove_credits(arg)
@@ -126,3 +126,23 @@ def test_updated_at_changes(app):
     # Note: updated_at may not change if onupdate isn't triggered in test
     # This test verifies the field exists and is tracked
     assert news.updated_at is not None
+
+
+def test_content_is_rendered_on_insert_and_when_it_changes(app):
+    from app import db
+
+    news = News(title="Rendered", content="Line <one>\n\nLine two", published=False)
+    db.session.add(news)
+    db.session.commit()
+
+    assert news.content_html == "<p>Line &lt;one&gt;</p>\n<p>Line two</p>"
+    first_hash = news.content_hash
+
+    news.title = "Renamed"
+    db.session.commit()
+    assert news.content_hash == first_hash
+
+    news.content = "Changed"
+    db.session.commit()
+    assert news.content_html == "<p>Changed</p>"
+    assert news.content_hash != first_hash
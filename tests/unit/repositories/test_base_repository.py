@@ -3,6 +3,7 @@ from unittest.mock import patch
 import pytest
 
 from app import db
+from app.core.config import get_settings
 from app.models import User
 from app.repositories import BaseRepository
 
@@ -104,3 +105,45 @@ def test_transaction_session_usable_after_rollback(app):
 
     assert User.query.filter_by(email="good@example.com").first() is not None
     assert User.query.filter_by(email="bad@example.com").first() is None
+
+
+def test_pool_status_reports_queue_pool_saturation(monkeypatch):
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import QueuePool
+
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=2, max_overflow=2)
+    monkeypatch.setattr(db, "engine", engine)
+    monkeypatch.setattr(get_settings(), "database_max_overflow", 2)
+    connection = engine.connect()
+    try:
+        status = BaseRepository.pool_status()
+    finally:
+        connection.close()
+        engine.dispose()
+
+    assert status == {"size": 2, "checked_out": 1, "overflow": 0, "saturation": 0.25}
+
+
+def test_pool_status_without_fixed_limit(monkeypatch):
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+
+    monkeypatch.setattr(db, "engine", create_engine("sqlite://", poolclass=StaticPool))
+
+    assert BaseRepository.pool_status() == {"saturation": None}
+
+
+def test_warm_pool_opens_connections_up_to_the_pool_size(monkeypatch):
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import QueuePool
+
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=2, max_overflow=2)
+    monkeypatch.setattr(db, "engine", engine)
+    try:
+        opened = BaseRepository.warm_pool(5)
+        checked_in = engine.pool.checkedin()
+    finally:
+        engine.dispose()
+
+    assert opened == 2
+    assert checked_in == 2
@@ -1,16 +1,36 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
 from app import db
 from app.models import Event
 from app.repositories import EventRepository
 from app.utils.datetime_utils import utc_now
 
 
-def test_event_repository_get_all(app):
-    event = Event(title="Repo Event", description="Test", start_date=utc_now())
-    db.session.add(event)
+def test_event_repository_get_all_paginated_skips_descriptions(app):
+    db.session.add_all(Event(title=f"Repo Event {n}", description="Long " * 500, start_date=utc_now()) for n in range(3))
     db.session.commit()
+    db.session.expunge_all()
+
+    page = EventRepository.get_all_paginated(page=2, per_page=2)
+
+    assert page.total == 3
+    assert len(page.items) == 1
+    assert page.items[0].title.startswith("Repo Event")
+    with pytest.raises(InvalidRequestError):
+        _ = page.items[0].description
+
+
+def test_event_repository_get_upcoming_published_returns_excerpts(app):
+    db.session.add(Event(title="Soon", description="x" * 5000, start_date=datetime(2099, 1, 1), published=True))
+    db.session.commit()
+
+    (row,) = EventRepository.get_upcoming_published()
 
-    events = EventRepository.get_all()
-    assert len(events) >= 1
+    assert row.title == "Soon"
+    assert len(row.excerpt) == 200
 
 
 def test_event_repository_get_by_id(app):
@@ -1,22 +1,38 @@
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
 from app import db
 from app.models import News
 from app.repositories import NewsRepository
 from app.utils.datetime_utils import utc_now
 
 
-def test_news_repository_get_all(app):
-    article = News(title="Repo News", content="Test content")
-    db.session.add(article)
+def test_news_repository_get_all_paginated_skips_content(app):
+    db.session.add_all(News(title=f"Repo News {n}", content="Long " * 500) for n in range(3))
     db.session.commit()
+    db.session.expunge_all()
+
+    page = NewsRepository.get_all_paginated(page=1, per_page=2)
 
-    articles = NewsRepository.get_all()
-    assert len(articles) >= 1
+    assert page.total == 3
+    assert len(page.items) == 2
+    assert page.has_next
+    with pytest.raises(InvalidRequestError):
+        _ = page.items[0].content
 
 
-def test_news_repository_get_published(app):
-    article = News(title="Published News", content="Content", published=True, published_at=utc_now())
-    db.session.add(article)
+def test_news_repository_get_published_paginated_returns_excerpts(app):
+    db.session.add_all(
+        [
+            News(title="Published News", content="y" * 5000, published=True, published_at=utc_now()),
+            News(title="Draft News", content="Content", published=False),
+        ]
+    )
     db.session.commit()
 
-    published = NewsRepository.get_published()
-    assert len(published) >= 1
+    page = NewsRepository.get_published_paginated(page=1, per_page=10)
+
+    assert page.total == 1
+    (row,) = page.items
+    assert row.title == "Published News"
+    assert row.excerpt == "y" * 200
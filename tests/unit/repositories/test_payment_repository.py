@@ -36,22 +36,6 @@ def test_payment_repository_get_pending_cash(app, test_user):
     assert len(pending) >= 1
 
 
-def test_payment_repository_count_pending_cash(app, test_user):
-    payment = Payment(
-        user_id=test_user.id,
-        amount_cents=5000,
-        currency="EUR",
-        payment_type="credits",
-        payment_method="cash",
-        status="pending",
-    )
-    db.session.add(payment)
-    db.session.commit()
-
-    count = PaymentRepository.count_pending_cash()
-    assert count >= 1
-
-
 def test_payment_repository_get_by_user(app, test_user):
     payment = Payment(
         user_id=test_user.id,
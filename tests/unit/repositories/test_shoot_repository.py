@@ -13,3 +13,20 @@ def test_shoot_repository_get_all(app):
 
     shoots = ShootRepository.get_all()
     assert len(shoots) >= 1
+
+
+def test_shoot_repository_attendance_for_user(app, test_user, admin_user):
+    from datetime import timedelta
+
+    shoots = [Shoot(date=date.today() - timedelta(days=7 * weeks), location=ShootLocation.HALL) for weeks in range(3)]
+    shoots[0].users.append(test_user)
+    shoots[2].users.append(test_user)
+    shoots[1].users.append(admin_user)
+    db.session.add_all(shoots)
+    db.session.commit()
+
+    assert ShootRepository.count_attended_by_user(test_user.id) == 2
+    page = ShootRepository.get_attended_by_user_paginated(test_user.id, page=1, per_page=1)
+    assert page.total == 2
+    assert page.items == [shoots[0]]
+    assert ShootRepository.get_attended_by_user_paginated(test_user.id, page=2, per_page=1).items == [shoots[2]]
@@ -34,11 +34,6 @@ def test_user_repository_count(app, test_user):
     assert count >= 1
 
 
-def test_user_repository_get_recent(app, test_user):
-    recent = UserRepository.get_recent(limit=5)
-    assert len(recent) >= 1
-
-
 def test_user_repository_crud(app):
     user = User(name="Repo User", email="repo@example.com", qualification="none")
     user.set_password("test123")
@@ -109,19 +104,6 @@ def test_user_repository_count_admins(app, admin_user):
     assert count >= 1
 
 
-def test_user_repository_count_pending(app):
-    """Test counting pending users"""
-    from app import db
-
-    user = User(name="Pending", email="pending@example.com", qualification="none", is_active=False)
-    user.set_password("test123")
-    db.session.add(user)
-    db.session.commit()
-
-    count = UserRepository.count_pending_users()
-    assert count >= 1
-
-
 def test_user_repository_get_active_with_membership(app, test_user):
     """Test getting active users with membership"""
     users = UserRepository.get_active_with_membership()
@@ -136,3 +118,76 @@ def test_user_repository_get_all_with_permission(app, admin_user):
     """Test getting users with specific permission"""
     users = UserRepository.get_all_with_permission("members.manage_membership")
     assert len(users) >= 1
+
+
+def _make_user(name, email, phone=None):
+    from app import db
+
+    user = User(name=name, email=email, phone=phone)
+    user.set_password("password123")
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def test_user_repository_search_matches_prefixes_across_fields(app):
+    ann = _make_user("Ann Kelly", "ann.kelly@example.ie", "087 123 4567")
+    _make_user("Brian Murphy", "brian@example.ie")
+
+    for search in ("kel", "ann kel", "ann.kelly@example.ie", "087 123", "+353 87 123"):
+        result = UserRepository.get_all_paginated(search=search)
+        assert [user.id for user in result.items] == [ann.id], search
+
+
+def test_user_repository_search_requires_every_term(app):
+    _make_user("Ann Kelly", "ann@example.ie")
+
+    assert UserRepository.get_all_paginated(search="ann murphy").total == 0
+    assert UserRepository.get_all_paginated(search="@@@").total == 0
+
+
+def test_user_repository_search_ranks_exact_tokens_first(app):
+    annette = _make_user("Annette Byrne", "annette@example.ie")
+    ann = _make_user("Ann Walsh", "walsh@example.ie")
+
+    result = UserRepository.get_all_paginated(search="ann")
+
+    assert [user.id for user in result.items] == [ann.id, annette.id]
+
+
+def test_user_repository_search_follows_updates_and_deletes(app):
+    from app import db
+
+    user = _make_user("Ann Kelly", "ann@example.ie")
+    user.name = "Ann Doyle"
+    db.session.commit()
+
+    assert UserRepository.get_all_paginated(search="kelly").total == 0
+    assert UserRepository.get_all_paginated(search="doyle").total == 1
+
+    db.session.delete(user)
+    db.session.commit()
+    assert UserRepository.get_all_paginated(search="doyle").total == 0
+
+
+def test_user_repository_search_typeahead_limits_results(app):
+    for index in range(3):
+        _make_user(f"Archer {index}", f"archer{index}@example.ie")
+
+    rows = UserRepository.search_typeahead("archer", limit=2)
+
+    assert len(rows) == 2
+    assert rows[0].name == "Archer 0"
+
+
+def test_user_repository_rebuild_search_tokens(app, test_user):
+    from sqlalchemy import delete
+
+    from app import db
+    from app.models import user_search_tokens
+
+    db.session.execute(delete(user_search_tokens))
+    assert UserRepository.get_all_paginated(search="test").total == 0
+
+    assert UserRepository.rebuild_search_tokens() >= 1
+    assert UserRepository.get_all_paginated(search="test").total >= 1
@@ -16,3 +16,60 @@ def test_dashboard_stats_includes_pending_payments(app, admin_user, test_user):
     assert result.success is True
     assert result.data["pending_cash_payments"] >= 1
     assert len(result.data["pending_payments_data"]) >= 1
+
+
+def _count_statements(func):
+    from sqlalchemy import event
+
+    from app import db
+
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db.session.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        result = func()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    return result, statements
+
+
+def test_dashboard_counters_come_from_one_query(app, admin_user, test_user):
+    from app.services import admin
+
+    result, statements = _count_statements(admin.get_dashboard_stats)
+
+    selects = [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 3
+    assert selects[0].count("count(*)") == 4
+    assert result.data["total_members"] == 2
+    assert result.data["active_memberships"] == 1
+    assert result.data["count_pending_users"] == 0
+    assert result.data["pending_cash_payments"] == 0
+    assert {member.name for member in result.data["recent_members"]} == {admin_user.name, test_user.name}
+
+
+def test_dashboard_stats_are_cached_between_calls(app, test_user):
+    from app.services import admin
+
+    admin.get_dashboard_stats()
+    result, statements = _count_statements(admin.get_dashboard_stats)
+
+    assert not [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+    assert result.data["total_members"] == 1
+
+
+def test_dashboard_cache_is_dropped_when_payments_commit(app, test_user):
+    from app import db
+    from app.services import admin
+
+    assert admin.get_dashboard_stats().data["pending_cash_payments"] == 0
+    payment = create_payment_for_user(db, user=test_user, payment_method="cash", status="pending", payment_type="membership")
+
+    data = admin.get_dashboard_stats().data
+    assert data["pending_cash_payments"] == 1
+    assert data["pending_payments_data"][0].id == payment.id
+    assert data["pending_payments_data"][0].user_name == test_user.name
@@ -9,3 +9,82 @@ def test_get_user_credits(app, test_user):
     rows = credits.get_user_credits(test_user.id)
     assert len(rows) == 1
     assert rows[0].amount == 2
+
+
+def _ledger(membership):
+    from app.repositories import CreditLedgerRepository
+
+    return [(entry.bucket, entry.delta, entry.balance_after, entry.reason) for entry in CreditLedgerRepository.get_for_membership(membership.id)]
+
+
+def test_new_membership_opens_ledger_with_its_balances(app, test_user):
+    assert _ledger(test_user.membership) == [("initial", 20, 20, "opening_balance")]
+
+
+def test_add_and_remove_credits_append_entries(app, test_user, admin_user):
+    membership = test_user.membership
+
+    credits.add_credits(membership, 3, reason="purchase")
+    credits.remove_credits(membership, 22, reason="admin_adjustment", actor_id=admin_user.id)
+    db.session.commit()
+
+    assert membership.initial_credits == 0
+    assert membership.purchased_credits == 1
+    assert _ledger(membership)[1:] == [
+        ("purchased", 3, 3, "purchase"),
+        ("initial", -20, 0, "admin_adjustment"),
+        ("purchased", -2, 1, "admin_adjustment"),
+    ]
+
+
+def test_changes_start_from_the_committed_balance(app, test_user):
+    """A stale in-memory balance is re-read under lock before it is changed."""
+    from sqlalchemy import update
+
+    from app.models import Membership
+
+    membership = test_user.membership
+    db.session.execute(update(Membership).where(Membership.id == membership.id).values(purchased_credits=5).execution_options(synchronize_session=False))
+    assert membership.purchased_credits == 0
+
+    credits.add_credits(membership, 1, reason="purchase")
+
+    assert membership.purchased_credits == 6
+    assert _ledger(membership)[-1] == ("purchased", 1, 6, "purchase")
+
+
+def test_renew_expire_and_set_balances_are_ledgered(app, test_user):
+    from datetime import date, timedelta
+
+    membership = test_user.membership
+
+    credits.expire_initial_credits(membership)
+    credits.renew(membership, date.today() + timedelta(days=365), initial_credits=12)
+    credits.set_balances(membership, reason="admin_edit", purchased_credits=4)
+    credits.set_balances(membership, reason="admin_edit", initial_credits=12)
+    db.session.commit()
+
+    assert _ledger(membership)[1:] == [
+        ("initial", -20, 0, "year_end_expiry"),
+        ("initial", 12, 12, "renewal"),
+        ("purchased", 4, 4, "admin_edit"),
+    ]
+    assert credits.find_balance_mismatches() == []
+
+
+def test_reconcile_rebuilds_drifted_balances(app, test_user):
+    from sqlalchemy import update
+
+    from app.models import Membership
+
+    membership = test_user.membership
+    db.session.execute(update(Membership).where(Membership.id == membership.id).values(initial_credits=7, purchased_credits=2))
+    db.session.commit()
+
+    mismatches = credits.find_balance_mismatches()
+    assert {(m.bucket, m.balance, m.ledger_total) for m in mismatches} == {("initial", 7, 20), ("purchased", 2, 0)}
+
+    assert credits.reconcile_balances() == mismatches
+    db.session.refresh(membership)
+    assert (membership.initial_credits, membership.purchased_credits) == (20, 0)
+    assert credits.find_balance_mismatches() == []
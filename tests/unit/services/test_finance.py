@@ -25,6 +25,36 @@ def test_create_expense(app, admin_user):
     assert result.data.receipt_reference == "INV-001"
 
 
+def test_add_transactions_stages_batch(app, admin_user):
+    entry = {
+        "txn_type": "income",
+        "txn_date": date(2026, 1, 15),
+        "category": "shoot_fees",
+        "created_by_id": admin_user.id,
+    }
+    result = finance.add_transactions(
+        [
+            {**entry, "amount_cents": 500, "description": "Visitor A", "source": "Cash"},
+            {**entry, "amount_cents": 700, "description": "Visitor B"},
+        ]
+    )
+
+    assert result.success is True
+    assert result.data == 2
+    rows = FinancialTransaction.query.order_by(FinancialTransaction.amount_cents).all()
+    assert [(row.amount_cents, row.source, row.currency) for row in rows] == [(500, "Cash", "EUR"), (700, None, "EUR")]
+    assert rows[0].created_at is not None
+
+
+def test_add_transactions_reports_failure(app, admin_user, mocker):
+    mocker.patch("app.repositories.FinancialTransactionRepository.insert_many", side_effect=RuntimeError("boom"))
+
+    result = finance.add_transactions([])
+
+    assert result.success is False
+    assert "boom" in result.message
+
+
 def test_create_income(app, admin_user):
     """Test creating an income transaction."""
     result = finance.create_transaction(
@@ -0,0 +1,47 @@
+from datetime import UTC, datetime
+
+from app.metrics import DEFERRED_HANDLERS_PENDING
+from app.services import health as health_service
+from app.services.health import DEGRADED, DOWN, OK, HealthReport, ProbeResult
+
+
+def _report(**checks):
+    return HealthReport(checks={name: ProbeResult(status) for name, status in checks.items()}, checked_at=datetime.now(UTC))
+
+
+def test_report_down_only_when_critical_check_down():
+    assert _report(database=OK, smtp=DOWN).status() == DEGRADED
+    assert _report(database=DOWN, smtp=OK).status() == DOWN
+    assert _report(database=OK, smtp=OK).status() == OK
+
+
+def test_report_status_limited_to_named_checks():
+    report = _report(database=OK, smtp=DOWN)
+
+    assert report.status(("database",)) == OK
+    assert list(report.as_dict(("database",))["checks"]) == ["database"]
+
+
+def test_slow_probe_is_degraded(monkeypatch):
+    monkeypatch.setattr(health_service, "_timed", lambda probe: (10_000.0, probe()))
+
+    results = health_service._run_probes({"database": lambda: {}})
+
+    assert results["database"] == ProbeResult(DEGRADED, 10_000.0, {})
+
+
+def test_saturated_pool_degrades_database(monkeypatch):
+    monkeypatch.setattr(health_service.BaseRepository, "pool_status", staticmethod(lambda: {"saturation": 1.0}))
+
+    result = health_service._database_with_pool(ProbeResult(OK, 1.0))
+
+    assert result.status == DEGRADED
+    assert result.detail["pool"] == {"saturation": 1.0}
+
+
+def test_deferred_handler_backlog_degrades(monkeypatch):
+    DEFERRED_HANDLERS_PENDING.set(1000)
+    try:
+        assert health_service._deferred_handlers_check() == ProbeResult(DEGRADED, detail={"pending": 1000})
+    finally:
+        DEFERRED_HANDLERS_PENDING.set(0)
@@ -17,8 +17,8 @@ def test_get_published_articles(app):
     )
     db.session.commit()
     articles = news.get_published_articles()
-    assert len(articles) == 1
-    assert articles[0].title == "Pub"
+    assert articles.total == 1
+    assert articles.items[0].title == "Pub"
 
 
 def test_create_article_success(app):
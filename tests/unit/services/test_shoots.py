@@ -434,16 +434,7 @@ def test_create_shoot_rolls_back_finance_on_visitor_fee_failure(app, admin_user,
     from app.services.result import ServiceResult
 
     settings.set("sumup_fee_percentage", "2.5")
-    call_count = 0
-
-    def add_transaction_side_effect(*args, **kwargs):
-        nonlocal call_count
-        call_count += 1
-        if call_count == 1:
-            return ServiceResult.ok(data=object())
-        return ServiceResult.fail("Fee recording failed")
-
-    mocker.patch("app.services.finance.add_transaction", side_effect=add_transaction_side_effect)
+    mocker.patch("app.services.finance.add_transactions", return_value=ServiceResult.fail("Fee recording failed"))
 
     result = shoots.create_shoot(
         shoot_date=date.today(),
@@ -512,3 +503,83 @@ def test_update_shoot_removes_visitor(app, admin_user):
     )
     assert result.success is True
     assert len(shoot.visitors) == 0
+
+
+# ---------------------------------------------------------------------------
+# Bulk attendance
+# ---------------------------------------------------------------------------
+
+
+def _count_statements(func):
+    from sqlalchemy import event
+
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db.session.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        result = func()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    return result, statements
+
+
+def test_create_shoot_attendance_statement_count_is_flat(app, admin_user):
+    members = [_create_member(name=f"Bulk {i}", email=f"bulk{i}@test.com", initial_credits=i % 3, purchased_credits=i % 2) for i in range(40)]
+    visitors = [{"name": f"Guest {i}", "club": "Club", "affiliation": "AI", "payment_method": "sumup"} for i in range(10)]
+    from app.services import settings
+
+    settings.set("sumup_fee_percentage", "2.5")
+
+    attendee_ids = [member.id for member in members]
+    result, statements = _count_statements(
+        lambda: shoots.create_shoot(
+            shoot_date=date.today(),
+            location="HALL",
+            attendee_ids=attendee_ids,
+            visitors=visitors,
+            created_by_id=admin_user.id,
+        )
+    )
+
+    assert result.success is True
+    assert len(result.data.users) == 40
+    attendance_writes = [sql for sql in statements if sql.lstrip().upper().startswith(("INSERT INTO USER_SHOOTS", "UPDATE MEMBERSHIPS"))]
+    assert len(attendance_writes) <= 3
+    ledger_writes = [sql for sql in statements if sql.lstrip().upper().startswith("INSERT INTO FINANCIAL_TRANSACTIONS")]
+    assert len(ledger_writes) == 1
+    assert members[0].membership.credits_remaining() == -1
+    assert members[1].membership.initial_credits == 0
+    assert members[3].membership.purchased_credits == 0
+
+
+def test_create_shoot_ignores_duplicate_and_unknown_attendees(app):
+    user = _create_member(name="Twice", email="twice@test.com", initial_credits=2)
+
+    result = shoots.create_shoot(shoot_date=date.today(), location="HALL", attendee_ids=[user.id, user.id, 99999])
+
+    assert result.success is True
+    assert [attendee.id for attendee in result.data.users] == [user.id]
+    assert user.membership.credits_remaining() == 1
+
+
+def test_attendance_and_refunds_are_ledgered(app):
+    from app.repositories import CreditLedgerRepository
+    from app.services import credits
+
+    user = _create_member(name="Ledger", email="ledger@test.com", initial_credits=1, purchased_credits=1)
+    created = shoots.create_shoot(shoot_date=date.today(), location="HALL", attendee_ids=[user.id])
+    second = shoots.create_shoot(shoot_date=date.today(), location="HALL", attendee_ids=[user.id])
+    shoots.update_shoot(created.data, shoot_date=date.today(), location="HALL", attendee_ids=[])
+
+    entries = CreditLedgerRepository.get_for_membership(user.membership.id)
+    assert [(e.bucket, e.delta, e.balance_after, e.reason) for e in entries[2:]] == [
+        ("initial", -1, 0, "shoot_attendance"),
+        ("purchased", -1, 0, "shoot_attendance"),
+        ("purchased", 1, 1, "shoot_refund"),
+    ]
+    assert entries[3].shoot_id == second.data.id
+    assert credits.find_balance_mismatches() == []
@@ -1,7 +1,12 @@
+import time
 from unittest.mock import Mock, patch
 
+import pytest
+
 from app.core.config import get_settings
+from app.exceptions import DeadlineExceeded
 from app.services.sumup import SumUpService
+from app.utils.deadline import deadline
 
 
 class MockAPIError(Exception):
@@ -23,7 +28,7 @@ def test_init_without_api_key_uses_config(monkeypatch):
     assert service.api_key == "config_key"
 
 
-@patch("app.services.sumup.Sumup")
+@patch("sumup.Sumup")
 def test_create_checkout_success(mock_sumup_class, monkeypatch):
     monkeypatch.setenv("SUMUP_MERCHANT_CODE", "TEST_MERCHANT")
     get_settings.cache_clear()
@@ -51,7 +56,7 @@ def test_create_checkout_success(mock_sumup_class, monkeypatch):
     assert result["status"] == "PENDING"
 
 
-@patch("app.services.sumup.Sumup")
+@patch("sumup.Sumup")
 def test_create_checkout_auto_generates_reference(mock_sumup_class, monkeypatch):
     monkeypatch.setenv("SUMUP_MERCHANT_CODE", "TEST_MERCHANT")
     get_settings.cache_clear()
@@ -72,7 +77,7 @@ def test_create_checkout_auto_generates_reference(mock_sumup_class, monkeypatch)
     assert result["id"] == "checkout_123"
 
 
-@patch("app.services.sumup.Sumup")
+@patch("sumup.Sumup")
 def test_create_checkout_uses_merchant_code_from_config(mock_sumup_class, monkeypatch):
     monkeypatch.setenv("SUMUP_MERCHANT_CODE", "CONFIG_MERCHANT")
     get_settings.cache_clear()
@@ -91,7 +96,7 @@ def test_create_checkout_uses_merchant_code_from_config(mock_sumup_class, monkey
     assert result is not None
 
 
-@patch("app.services.sumup.Sumup")
+@patch("sumup.Sumup")
 def test_create_checkout_no_merchant_code_raises_error(mock_sumup_class, monkeypatch):
     monkeypatch.setenv("SUMUP_MERCHANT_CODE", "")
     get_settings.cache_clear()
@@ -103,8 +108,8 @@ def test_create_checkout_no_merchant_code_raises_error(mock_sumup_class, monkeyp
     assert result is None
 
 
-@patch("app.services.sumup.APIError", MockAPIError)
-@patch("app.services.sumup.Sumup")
+@patch("sumup.APIError", MockAPIError)
+@patch("sumup.Sumup")
 def test_create_checkout_api_error(mock_sumup_class, monkeypatch):
     monkeypatch.setenv("SUMUP_MERCHANT_CODE", "TEST_MERCHANT")
     get_settings.cache_clear()
@@ -119,7 +124,7 @@ def test_create_checkout_api_error(mock_sumup_class, monkeypatch):
     assert result is None
 
 
-@patch("app.services.sumup.Sumup")
+@patch("sumup.Sumup")
 def test_create_checkout_response_without_id(mock_sumup_class, monkeypatch):
     monkeypatch.setenv("SUMUP_MERCHANT_CODE", "TEST_MERCHANT")
     get_settings.cache_clear()
@@ -135,7 +140,7 @@ def test_create_checkout_response_without_id(mock_sumup_class, monkeypatch):
     assert result is None
 
 
-@patch("app.services.sumup.Sumup")
+@patch("sumup.Sumup")
 def test_create_checkout_generic_exception(mock_sumup_class, monkeypatch):
     monkeypatch.setenv("SUMUP_MERCHANT_CODE", "TEST_MERCHANT")
     get_settings.cache_clear()
@@ -150,7 +155,7 @@ def test_create_checkout_generic_exception(mock_sumup_class, monkeypatch):
     assert result is None
 
 
-@patch("app.services.sumup.Sumup")
+@patch("sumup.Sumup")
 def test_get_checkout_success(mock_sumup_class):
     mock_checkout = Mock()
     mock_checkout.id = "checkout_123"
@@ -168,8 +173,8 @@ def test_get_checkout_success(mock_sumup_class):
     assert result.status == "PAID"
 
 
-@patch("app.services.sumup.APIError", MockAPIError)
-@patch("app.services.sumup.Sumup")
+@patch("sumup.APIError", MockAPIError)
+@patch("sumup.Sumup")
 def test_get_checkout_api_error(mock_sumup_class):
     mock_client = Mock()
     mock_client.checkouts.get.side_effect = MockAPIError("Not found")
@@ -181,7 +186,7 @@ def test_get_checkout_api_error(mock_sumup_class):
     assert result is None
 
 
-@patch("app.services.sumup.Sumup")
+@patch("sumup.Sumup")
 def test_get_checkout_generic_exception(mock_sumup_class):
     mock_client = Mock()
     mock_client.checkouts.get.side_effect = Exception("Network error")
@@ -193,7 +198,7 @@ def test_get_checkout_generic_exception(mock_sumup_class):
     assert result is None
 
 
-@patch("app.services.sumup.Sumup")
+@patch("sumup.Sumup")
 def test_verify_payment_success_paid(mock_sumup_class):
     mock_checkout = Mock()
     mock_checkout.status = "PAID"
@@ -208,7 +213,7 @@ def test_verify_payment_success_paid(mock_sumup_class):
     assert result is True
 
 
-@patch("app.services.sumup.Sumup")
+@patch("sumup.Sumup")
 def test_verify_payment_not_paid(mock_sumup_class):
     mock_checkout = Mock()
     mock_checkout.status = "PENDING"
@@ -223,7 +228,7 @@ def test_verify_payment_not_paid(mock_sumup_class):
     assert result is False
 
 
-@patch("app.services.sumup.Sumup")
+@patch("sumup.Sumup")
 def test_verify_payment_checkout_not_found(mock_sumup_class):
     mock_client = Mock()
     mock_client.checkouts.get.return_value = None
@@ -235,7 +240,7 @@ def test_verify_payment_checkout_not_found(mock_sumup_class):
     assert result is False
 
 
-@patch("app.services.sumup.Sumup")
+@patch("sumup.Sumup")
 def test_verify_payment_no_status_attribute(mock_sumup_class):
     mock_checkout = Mock(spec=[])
 
@@ -249,7 +254,7 @@ def test_verify_payment_no_status_attribute(mock_sumup_class):
     assert result is False
 
 
-@patch("app.services.sumup.Sumup")
+@patch("sumup.Sumup")
 def test_verify_payment_exception(mock_sumup_class):
     mock_client = Mock()
     mock_client.checkouts.get.side_effect = Exception("Error")
@@ -261,7 +266,7 @@ def test_verify_payment_exception(mock_sumup_class):
     assert result is False
 
 
-@patch("app.services.sumup.Sumup")
+@patch("sumup.Sumup")
 def test_verify_payment_exception_during_check(mock_sumup_class):
     mock_checkout = Mock()
     mock_checkout.status = property(lambda self: (_ for _ in ()).throw(Exception("Status check error")))
@@ -274,3 +279,23 @@ def test_verify_payment_exception_during_check(mock_sumup_class):
     result = service.verify_payment("checkout_123")
 
     assert result is False
+
+
+@patch("sumup.Sumup")
+def test_calls_are_limited_to_the_request_budget(mock_sumup_class):
+    SumUpService(api_key="test_key")
+    assert mock_sumup_class.call_args.kwargs["timeout"].read == get_settings().sumup_timeout_seconds
+
+    with deadline(2):
+        SumUpService(api_key="test_key")
+    assert 0 < mock_sumup_class.call_args.kwargs["timeout"].read <= 2
+
+
+@patch("sumup.Sumup")
+def test_spent_budget_skips_the_call(mock_sumup_class):
+    service = SumUpService(api_key="test_key")
+    with deadline(0.001), pytest.raises(DeadlineExceeded):
+        time.sleep(0.002)
+        service.get_checkout("checkout_123")
+
+    mock_sumup_class.return_value.checkouts.get.assert_not_called()
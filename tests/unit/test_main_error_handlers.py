@@ -27,6 +27,36 @@ def test_unknown_route_returns_404_not_500(client):
     assert response.status_code == 404
 
 
+def test_anonymous_404_is_served_from_cache_without_the_database(client, monkeypatch):
+    first = client.get("/wp-login.php")
+
+    def _boom(*_args, **_kwargs):
+        raise AssertionError("anonymous 404 must not query the database")
+
+    monkeypatch.setattr("sqlalchemy.orm.Session.execute", _boom)
+    second = client.get("/.env")
+
+    assert second.status_code == 404
+    assert "Page Not Found" in second.text
+    assert second.text == first.text
+    assert "set-cookie" not in second.headers
+
+
+def test_logged_in_404_still_renders_for_the_user(member_client):
+    response = member_client.get("/this-route-does-not-exist-xyz")
+
+    assert response.status_code == 404
+    assert "/member/dashboard" in response.text
+
+
+def test_repeated_anonymous_404s_are_throttled(client, monkeypatch):
+    monkeypatch.setattr("app.main.settings.not_found_rate_limit", 2)
+
+    statuses = [client.get(f"/scan-{index}").status_code for index in range(3)]
+
+    assert statuses == [404, 404, 429]
+
+
 def test_configure_app_logging_adds_handler_outside_tests():
     """_configure_app_logging must attach a StreamHandler when not in test mode."""
     app_logger = logging.getLogger("app")
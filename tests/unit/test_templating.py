@@ -49,3 +49,33 @@ def test_anonymous_user_permissions():
 
 def test_url_for_external():
     assert url_for("health", _external=True).startswith("http")
+
+
+def test_precompile_templates_loads_every_template():
+    from app.templating import TEMPLATES_DIR, precompile_templates, templates
+
+    count = precompile_templates()
+
+    assert count == sum(1 for path in TEMPLATES_DIR.rglob("*") if path.is_file())
+    assert templates.env.cache is not None
+    assert len(templates.env.cache) >= count
+
+
+def test_templates_do_not_auto_reload_outside_development():
+    from app.templating import templates
+
+    assert templates.env.auto_reload is False
+    assert templates.env.bytecode_cache is not None
+
+
+def test_bytecode_cache_uses_configured_directory(tmp_path, monkeypatch):
+    from app.core.config import get_settings
+    from app.templating import _bytecode_cache
+
+    directory = tmp_path / "jinja"
+    monkeypatch.setattr(get_settings(), "template_cache_dir", str(directory))
+
+    cache = _bytecode_cache()
+
+    assert directory.is_dir()
+    assert cache.directory == str(directory)
@@ -0,0 +1,40 @@
+from app.core.config import get_settings
+from app.main import app as fastapi_app
+from app.services import health as health_service
+from app.services.health import DEGRADED, DOWN, OK
+from app.warmup import run_warmup, warmup_steps
+
+
+def test_warmup_runs_each_step_and_marks_the_worker_warm(app, monkeypatch):
+    monkeypatch.setattr(health_service, "_warmup", health_service.WARMING_UP)
+
+    results = run_warmup(fastapi_app)
+
+    assert set(results) == {"routes", "templates", "database", "settings"}
+    assert all(result.status == OK for result in results.values())
+    assert results["templates"].detail["templates"] > 0
+    assert health_service._warmup.status == OK
+
+
+def test_failed_warmup_step_degrades_instead_of_blocking(app, monkeypatch):
+    def _boom():
+        raise RuntimeError("no settings table")
+
+    monkeypatch.setattr("app.warmup._settings", _boom)
+
+    results = run_warmup(fastapi_app)
+
+    assert results["settings"].status == DOWN
+    assert results["settings"].detail == {"error": "RuntimeError: no settings table"}
+    assert health_service._warmup.status == DEGRADED
+
+
+def test_optional_clients_are_warmed_only_when_configured(app, monkeypatch):
+    monkeypatch.setattr(get_settings(), "redis_url", "redis://localhost:6379/0")
+    monkeypatch.setattr(get_settings(), "sumup_api_key", "key")
+
+    steps = warmup_steps(fastapi_app)
+
+    assert {"redis", "sumup"} <= set(steps)
+    assert steps["redis"]() == {"backend": "memory"}
+    assert steps["sumup"]() == {}
@@ -0,0 +1,26 @@
+import io
+import json
+
+import pytest
+
+from app import tracing
+
+
+class CapturedSpans:
+    def __init__(self) -> None:
+        self.stream = io.StringIO()
+
+    @property
+    def spans(self) -> list[dict]:
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def named(self, name: str) -> dict:
+        return next(span for span in self.spans if span["name"] == name)
+
+
+@pytest.fixture
+def captured_spans():
+    captured = CapturedSpans()
+    tracing.set_exporter(tracing.JsonLinesExporter(captured.stream))
+    yield captured
+    tracing.set_exporter(None)
@@ -0,0 +1,115 @@
+import pytest
+from sqlalchemy import text
+
+from app import db
+from app.services.result import ServiceResult
+from app.tracing import start_span
+from app.tracing.instrumentation import instrument_repositories, instrument_services, trace_repository_call, trace_service_call
+from tests.helpers import create_payment_for_user
+
+
+def test_sql_statements_become_child_spans(app, captured_spans):
+    with start_span("request"):
+        db.session.execute(text("SELECT 1"))
+
+    span = captured_spans.named("db SELECT")
+    assert span["parentSpanId"] == captured_spans.named("request")["spanId"]
+    assert span["kind"] == "SPAN_KIND_CLIENT"
+    assert span["attributes"]["db.statement"] == "SELECT 1"
+
+
+def test_sql_outside_a_span_is_not_traced(app, captured_spans):
+    db.session.execute(text("SELECT 1"))
+
+    assert captured_spans.spans == []
+
+
+def test_failed_sql_span_is_marked_as_error(app, captured_spans):
+    with pytest.raises(Exception), start_span("request"):
+        db.session.execute(text("SELECT * FROM no_such_table"))
+    db.session.rollback()
+
+    assert captured_spans.named("db SELECT")["status"]["code"] == "STATUS_CODE_ERROR"
+
+
+def test_service_calls_record_their_outcome(captured_spans):
+    def create_thing() -> ServiceResult[None]:
+        return ServiceResult.fail("Nope", error_code="not_found")
+
+    traced = trace_service_call(create_thing, "service things.create_thing")
+
+    assert traced().success is False
+    span = captured_spans.named("service things.create_thing")
+    assert span["attributes"] == {"service.success": False, "service.error_code": "not_found"}
+
+
+def test_service_wrapper_is_transparent_while_disabled():
+    def ping() -> ServiceResult[str]:
+        return ServiceResult.ok(data="pong")
+
+    assert trace_service_call(ping, "service x.ping")().data == "pong"
+
+
+def test_instrument_services_wraps_public_service_result_functions():
+    from app.services import admin, users
+
+    instrument_services()
+
+    assert getattr(admin.get_dashboard_stats, "__traced__", False) is True
+    assert getattr(users.activate_account, "__traced__", False) is True
+    assert not getattr(users.get_user_by_id, "__traced__", False)
+    assert instrument_services() == 0
+
+
+def test_payment_processing_reaches_the_traced_fulfill_payment(app, test_user, captured_spans, mocker):
+    from app.services import payment_processing
+
+    mocker.patch("app.services.payment_processing.emit_payment_side_effects")
+    instrument_services()
+    instrument_repositories()
+    payment = create_payment_for_user(db, test_user, payment_type="membership", status="pending")
+
+    with start_span("GET /payment/checkout/{checkout_id}/complete"):
+        assert payment_processing.handle_signup_payment(test_user.id, payment.id, "txn_traced").success
+
+    handler = captured_spans.named("service payment_processing.handle_signup_payment")
+    fulfill = captured_spans.named("service payment_fulfillment.fulfill_payment")
+    lookup = captured_spans.named("repository PaymentRepository.get_by_id")
+    assert fulfill["parentSpanId"] == handler["spanId"]
+    assert lookup["parentSpanId"] == handler["spanId"]
+    assert fulfill["attributes"] == {"service.success": True}
+
+
+def test_instrument_repositories_wraps_static_methods_but_not_transactions():
+    from app.repositories import BaseRepository, UserRepository
+
+    instrument_repositories()
+
+    assert getattr(UserRepository.get_by_email, "__traced__", False) is True
+    assert getattr(BaseRepository.save, "__traced__", False) is True
+    assert not getattr(BaseRepository.transaction, "__traced__", False)
+    assert instrument_repositories() == 0
+
+
+def test_repository_calls_outside_a_span_are_not_traced(captured_spans):
+    assert trace_repository_call(lambda: 3, "repository X.three")() == 3
+    assert captured_spans.spans == []
+
+
+def test_deferred_handler_span_links_back_to_request(app, captured_spans):
+    from app.events.background import defer_handler, take_deferred_handlers
+    from app.events.executor import SideEffectExecutor
+
+    def send_receipt() -> None:
+        pass
+
+    executor = SideEffectExecutor(workers=1, queue_limit=10, timeout_seconds=5)
+    with start_span("GET /payment"):
+        defer_handler(send_receipt)
+    # Submitted after the request span has ended, as the outermost middleware does.
+    for deferred in take_deferred_handlers():
+        executor.submit(deferred)
+    executor.shutdown(timeout=5)
+
+    handler = captured_spans.named("handler send_receipt")
+    assert handler["parentSpanId"] == captured_spans.named("GET /payment")["spanId"]
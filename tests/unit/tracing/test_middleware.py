@@ -0,0 +1,42 @@
+def test_request_span_is_named_after_the_route(client, captured_spans):
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    server = captured_spans.named("GET health")
+    assert server["kind"] == "SPAN_KIND_SERVER"
+    assert server["attributes"]["http.route"] == "health"
+    assert server["attributes"]["http.status_code"] == 200
+
+
+def test_sql_spans_belong_to_the_request_trace(member_client, captured_spans):
+    member_client.get("/member/dashboard")
+
+    server = captured_spans.named("GET member.dashboard")
+    sql = [span for span in captured_spans.spans if span["name"].startswith("db ")]
+    assert sql
+    assert all(span["traceId"] == server["traceId"] for span in sql)
+
+
+def test_incoming_traceparent_is_continued(client, captured_spans):
+    trace_id, parent_id = "1" * 32, "2" * 16
+
+    client.get("/health", headers={"traceparent": f"00-{trace_id}-{parent_id}-01"})
+
+    server = captured_spans.named("GET health")
+    assert server["traceId"] == trace_id
+    assert server["parentSpanId"] == parent_id
+
+
+def test_server_errors_mark_the_span(client, captured_spans, monkeypatch):
+    def _boom(*_args, **_kwargs):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr("sqlalchemy.orm.Session.execute", _boom)
+
+    client.get("/health")
+
+    assert captured_spans.named("GET health")["status"]["code"] == "STATUS_CODE_ERROR"
+
+
+def test_untraced_requests_skip_the_middleware(client):
+    assert client.get("/health").status_code == 200
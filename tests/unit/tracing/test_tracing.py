@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from app import tracing
+from app.tracing import SpanContext, parse_traceparent, start_span
+
+
+def test_spans_are_noops_while_disabled():
+    with start_span("ignored") as span:
+        span.set_attribute("key", "value")
+        assert tracing.current_span_context() is None
+
+    assert span is tracing.NOOP_SPAN
+    assert tracing.is_enabled() is False
+
+
+def test_nested_spans_share_a_trace(captured_spans):
+    with start_span("outer") as outer, start_span("inner", attributes={"step": 1}):
+        assert tracing.current_span_context().trace_id == outer.context.trace_id
+
+    inner, parent = captured_spans.named("inner"), captured_spans.named("outer")
+    assert inner["traceId"] == parent["traceId"]
+    assert inner["parentSpanId"] == parent["spanId"]
+    assert "parentSpanId" not in parent
+    assert inner["attributes"] == {"step": 1}
+    assert len(parent["traceId"]) == 32
+    assert len(parent["spanId"]) == 16
+    assert parent["endTimeUnixNano"] >= parent["startTimeUnixNano"]
+    assert tracing.current_span_context() is None
+
+
+def test_exceptions_mark_the_span_as_error(captured_spans):
+    with pytest.raises(ValueError), start_span("failing"):
+        raise ValueError("bad input")
+
+    assert captured_spans.named("failing")["status"] == {"code": "STATUS_CODE_ERROR", "message": "ValueError: bad input"}
+
+
+def test_unsampled_traces_are_not_exported(captured_spans):
+    tracing.set_exporter(tracing.JsonLinesExporter(captured_spans.stream), sample_ratio=0.0)
+
+    with start_span("dropped"), start_span("child"):
+        pass
+
+    assert captured_spans.spans == []
+
+
+def test_explicit_parent_continues_a_remote_trace(captured_spans):
+    parent = SpanContext("a" * 32, "b" * 16)
+
+    with start_span("continued", parent=parent):
+        pass
+
+    span = captured_spans.named("continued")
+    assert span["traceId"] == "a" * 32
+    assert span["parentSpanId"] == "b" * 16
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("00-" + "a" * 32 + "-" + "b" * 16 + "-01", SpanContext("a" * 32, "b" * 16, sampled=True)),
+        ("00-" + "A" * 32 + "-" + "B" * 16 + "-00", SpanContext("a" * 32, "b" * 16, sampled=False)),
+        ("00-" + "0" * 32 + "-" + "b" * 16 + "-01", None),
+        ("garbage", None),
+        (None, None),
+    ],
+)
+def test_parse_traceparent(header, expected):
+    assert parse_traceparent(header) == expected
+
+
+def test_traceparent_round_trips():
+    context = SpanContext("c" * 32, "d" * 16, sampled=False)
+    assert parse_traceparent(context.traceparent) == context
+
+
+def test_span_context_follows_to_thread(captured_spans):
+    def _in_thread():
+        with start_span("in thread"):
+            pass
+
+    async def _request():
+        with start_span("request"):
+            await asyncio.to_thread(_in_thread)
+
+    asyncio.run(_request())
+
+    assert captured_spans.named("in thread")["parentSpanId"] == captured_spans.named("request")["spanId"]
+
+
+def test_configure_writes_to_a_file(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    tracing.configure(str(path))
+    try:
+        with start_span("to file"):
+            pass
+    finally:
+        tracing.configure(None)
+
+    assert '"name": "to file"' in path.read_text()
+
+
+def test_configure_stdout(capsys):
+    tracing.configure("stdout")
+    try:
+        with start_span("to stdout"):
+            pass
+    finally:
+        tracing.configure(None)
+
+    assert '"name": "to stdout"' in capsys.readouterr().out
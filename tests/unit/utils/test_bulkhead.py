@@ -0,0 +1,78 @@
+import asyncio
+
+from app import db
+from app.cli.bench import run_load
+from app.cli.seed import seed_club
+from app.core.config import get_settings
+from app.main import app as fastapi_app
+from app.metrics import BULKHEAD_IN_FLIGHT, BULKHEAD_LIMIT, BULKHEAD_REJECTIONS
+from app.utils.bulkhead import Bulkhead, get_bulkhead
+from tests.http_helpers import login
+
+
+def test_bulkhead_turns_requests_away_at_its_limit():
+    bulkhead = Bulkhead("test.heavy", 2)
+    rejections = BULKHEAD_REJECTIONS.value(route="test.heavy")
+
+    assert [bulkhead.try_acquire() for _ in range(3)] == [True, True, False]
+    assert BULKHEAD_IN_FLIGHT.value(route="test.heavy") == 2
+    assert BULKHEAD_LIMIT.value(route="test.heavy") == 2
+    assert BULKHEAD_REJECTIONS.value(route="test.heavy") == rejections + 1
+
+    bulkhead.release()
+    assert bulkhead.try_acquire()
+    bulkhead.release()
+    bulkhead.release()
+    assert BULKHEAD_IN_FLIGHT.value(route="test.heavy") == 0
+
+
+def test_settings_override_the_declared_limit(monkeypatch):
+    monkeypatch.setattr(get_settings(), "route_concurrency_limits", {"test.overridden": 7})
+
+    assert get_bulkhead("test.overridden", 2).limit == 7
+    assert get_bulkhead("test.declared", 2).limit == 2
+    assert get_bulkhead("test.declared", 5) is get_bulkhead("test.declared", 2)
+
+
+def test_busy_route_answers_503_and_frees_its_slot(admin_client):
+    pdf = get_bulkhead("admin.financial_statement_pdf", 2)
+    path = "/admin/finance/statement/pdf?start_date=2025-01-01&end_date=2025-12-31"
+
+    assert admin_client.get(path).status_code == 200
+    assert pdf.in_flight == 0
+
+    for _ in range(pdf.limit):
+        pdf.try_acquire()
+    response = admin_client.get(path)
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "5"
+    assert admin_client.get("/admin/finance").status_code == 200
+
+
+def test_load_harness_sees_503s_only_on_saturated_routes(client):
+    seed_club(db.session, members=3, years=1, admins=1, seed=46)
+    db.session.commit()
+    # Hold every PDF export and statement slot, as long-running exports would.
+    for name in ("admin.financial_statement_pdf", "admin.financial_statement_post"):
+        bulkhead = get_bulkhead(name, 2)
+        for _ in range(bulkhead.limit):
+            bulkhead.try_acquire()
+
+    report = asyncio.run(run_load(concurrency=1, max_requests=40, admin_share=1, members=3, admins=1, seed=46, asgi_app=fastapi_app)).as_dict()
+
+    routes = report["routes"]
+    assert report["login_failures"] == []
+    assert routes["admin.financial_statement_pdf"]["busy"] == routes["admin.financial_statement_pdf"]["requests"] > 0
+    assert routes["admin.financial_statement_post"]["busy"] == routes["admin.financial_statement_post"]["requests"] > 0
+    assert all(row["busy"] == 0 and row["errors"] == 0 for name, row in routes.items() if "statement" not in name or name == "admin.financial_statement")
+
+
+def test_member_login_is_unaffected_by_a_saturated_admin_route(client, test_user):
+    bulkhead = get_bulkhead("admin.member_search", 4)
+    for _ in range(bulkhead.limit):
+        bulkhead.try_acquire()
+
+    login(client, "test@example.com", "password123")
+
+    assert client.get("/member/dashboard").status_code == 200
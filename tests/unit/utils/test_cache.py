@@ -0,0 +1,281 @@
+from datetime import UTC, date, datetime
+from typing import Self
+from unittest.mock import patch
+
+import pytest
+
+from app import db
+from app.core.config import get_settings
+from app.db import Pagination
+from app.metrics import CACHE_EVICTIONS, CACHE_HITS, CACHE_MISSES
+from app.models import News
+from app.repositories import SettingsRepository
+from app.services import news, settings
+from app.utils import cache as cache_module
+from app.utils.cache import TTLCache, cached, clear_all_caches, invalidate_tags
+from app.utils.datetime_utils import utc_now
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _counter():
+    calls = []
+
+    def _factory():
+        calls.append(1)
+        return len(calls)
+
+    return _factory, calls
+
+
+def test_get_or_set_reuses_value_until_ttl_expires():
+    clock = _Clock()
+    cache = TTLCache(ttl_seconds=5, clock=clock)
+    factory, calls = _counter()
+
+    assert cache.get_or_set("key", factory) == 1
+    clock.now = 4.9
+    assert cache.get_or_set("key", factory) == 1
+    clock.now = 5.0
+    assert cache.get_or_set("key", factory) == 2
+    assert len(calls) == 2
+
+
+def test_invalidate_and_clear_force_recompute():
+    cache = TTLCache(ttl_seconds=60)
+    factory, _calls = _counter()
+
+    cache.get_or_set("a", factory)
+    cache.invalidate("a")
+    assert cache.get_or_set("a", factory) == 2
+    cache.clear()
+    assert cache.get_or_set("a", factory) == 3
+
+
+def test_zero_ttl_disables_caching():
+    cache = TTLCache(ttl_seconds=0)
+    factory, calls = _counter()
+
+    cache.get_or_set("a", factory)
+    cache.get_or_set("a", factory)
+    assert len(calls) == 2
+
+
+def test_value_computed_across_an_invalidation_is_not_stored():
+    cache = TTLCache(ttl_seconds=60)
+
+    def _stale():
+        cache.clear()
+        return "stale"
+
+    assert cache.get_or_set("a", _stale) == "stale"
+    assert cache.get_or_set("a", lambda: "fresh") == "fresh"
+
+
+def test_clear_all_caches_empties_every_cache():
+    first, second = TTLCache(ttl_seconds=60), TTLCache(ttl_seconds=60)
+    first.get_or_set("a", lambda: 1)
+    second.get_or_set("b", lambda: 2)
+
+    clear_all_caches()
+
+    assert first.get_or_set("a", lambda: 10) == 10
+    assert second.get_or_set("b", lambda: 20) == 20
+
+
+def test_maxsize_evicts_the_least_recently_used_key():
+    evictions = []
+    cache = TTLCache(ttl_seconds=60, maxsize=2, on_evict=lambda: evictions.append(1))
+    cache.get_or_set("a", lambda: 1)
+    cache.get_or_set("b", lambda: 2)
+    cache.get_or_set("a", lambda: 10)
+
+    cache.get_or_set("c", lambda: 3)
+
+    assert len(cache) == 2
+    assert evictions == [1]
+    assert cache.get_or_set("a", lambda: 10) == 1
+    assert cache.get_or_set("b", lambda: 20) == 20
+
+
+def test_cached_reuses_results_per_arguments_and_counts_hits():
+    calls = []
+
+    @cached(ttl_seconds=60, maxsize=2, tags=("test_cached",))
+    def _square(value: int) -> int:
+        calls.append(value)
+        return value * value
+
+    name = f"{__name__}.{_square.__qualname__}"
+    hits, misses, evictions = CACHE_HITS.value(function=name, tier="local"), CACHE_MISSES.value(function=name), CACHE_EVICTIONS.value(function=name)
+
+    assert [_square(2), _square(2), _square(3), _square(value=2)] == [4, 4, 9, 4]
+    assert calls == [2, 3, 2]
+    assert CACHE_HITS.value(function=name, tier="local") == hits + 1
+    assert CACHE_MISSES.value(function=name) == misses + 3
+    assert CACHE_EVICTIONS.value(function=name) == evictions + 1
+
+    invalidate_tags({"test_cached", "unrelated"})
+    _square(2)
+    assert calls == [2, 3, 2, 2]
+
+
+def test_service_ttl_override_can_turn_caching_off(monkeypatch):
+    name = f"{__name__}.test_service_ttl_override_can_turn_caching_off.<locals>._uncached"
+    monkeypatch.setattr(get_settings(), "service_cache_ttls", {name: 0})
+    calls = []
+
+    @cached(ttl_seconds=60)
+    def _uncached() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert [_uncached(), _uncached()] == [1, 2]
+
+
+def test_commit_invalidates_reads_tagged_with_the_written_table(app):
+    assert news.get_published_articles().items == []
+
+    db.session.add(News(title="Fresh", content="Body", published=True, published_at=utc_now()))
+    db.session.flush()
+    assert news.get_published_articles().items == []
+
+    db.session.commit()
+    assert [article.title for article in news.get_published_articles().items] == ["Fresh"]
+
+
+def test_rolled_back_writes_keep_the_cached_value(app):
+    assert settings.get("news_enabled") is False
+    SettingsRepository.set_value("news_enabled", "true")
+    db.session.flush()
+    db.session.rollback()
+
+    with patch("app.services.settings.SettingsRepository.get_all") as get_all:
+        assert settings.get("news_enabled") is False
+    get_all.assert_not_called()
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.mget_calls = 0
+
+    def ping(self) -> bool:
+        return True
+
+    def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    def set(self, key: str, value: bytes, ex: int) -> None:
+        self.values[key] = value
+
+    def mget(self, keys: list[str]) -> list[bytes | None]:
+        self.mget_calls += 1
+        return [self.values.get(key) for key in keys]
+
+    def incr(self, key: str) -> None:
+        self.values[key] = str(int(self.values.get(key, b"0")) + 1).encode()
+
+    def pipeline(self, transaction: bool = True) -> Self:
+        return self
+
+    def execute(self) -> None:
+        return None
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = _FakeRedis()
+    monkeypatch.setattr(get_settings(), "app_env", "production")
+    monkeypatch.setattr(get_settings(), "service_cache_redis", True)
+    monkeypatch.setattr(get_settings(), "redis_url", "redis://cache.invalid:6379/0")
+    cache_module.reset_redis_tier()
+    with patch("redis.Redis.from_url", return_value=client):
+        yield client
+    cache_module.reset_redis_tier()
+
+
+def test_redis_tier_shares_values_and_invalidations_between_workers(fake_redis):
+    calls = []
+
+    def _load() -> list[str]:
+        calls.append(1)
+        return [f"v{len(calls)}"]
+
+    first_worker = cached(ttl_seconds=60, tags=("test_redis",))(_load)
+    second_worker = cached(ttl_seconds=60, tags=("test_redis",))(_load)
+    name = f"{__name__}.{_load.__qualname__}"
+    redis_hits = CACHE_HITS.value(function=name, tier="redis")
+
+    assert first_worker() == ["v1"]
+    assert second_worker() == ["v1"]
+    assert CACHE_HITS.value(function=name, tier="redis") == redis_hits + 1
+
+    # A commit in the first worker bumps the tag; the second worker's local
+    # copy stops matching on its next call.
+    invalidate_tags(["test_redis"])
+    assert second_worker() == ["v2"]
+    assert first_worker() == ["v2"]
+    assert len(calls) == 2
+
+
+def test_redis_tier_falls_back_to_in_process_when_unreachable(fake_redis):
+    fake_redis.ping = lambda: (_ for _ in ()).throw(ConnectionError("down"))
+    calls = []
+
+    @cached(ttl_seconds=60)
+    def _local() -> int:
+        calls.append(1)
+        return 1
+
+    assert [_local(), _local()] == [1, 1]
+    assert calls == [1]
+
+
+def test_redis_tier_rereads_tag_versions_at_most_once_per_interval(fake_redis, monkeypatch):
+    calls = []
+
+    @cached(ttl_seconds=60, tags=("test_versions",))
+    def _load() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert [_load(), _load(), _load()] == [1, 1, 1]
+    assert fake_redis.mget_calls == 1
+
+    # Another worker commits: this one keeps its copy until the interval ends.
+    fake_redis.incr("cache:tag:test_versions")
+    assert _load() == 1
+    monkeypatch.setattr(get_settings(), "service_cache_version_check_ms", 0)
+    assert _load() == 2
+    assert fake_redis.mget_calls == 2
+
+
+def test_redis_tier_stores_rows_and_pages_as_json(fake_redis, app):
+    article = News(title="Club night", content="Body", published=True, published_at=utc_now())
+    db.session.add(article)
+    db.session.commit()
+    news.get_published_articles()
+    (key,) = [key for key in fake_redis.values if key.startswith("cache:news.get_published_articles:")]
+    clear_all_caches()
+
+    page = news.get_published_articles()
+
+    assert fake_redis.values[key].startswith(b"{")
+    assert isinstance(page, Pagination)
+    assert page.total == 1
+    assert page.items[0].title == "Club night"
+    assert isinstance(page.items[0].published_at, datetime)
+
+
+def test_json_codec_round_trips_dates_and_rejects_unknown_types():
+    value = {"when": datetime(2026, 10, 19, 9, 30, tzinfo=UTC), "day": date(2026, 10, 19), "pairs": [[1, "a"]]}
+    assert cache_module._loads(cache_module._dumps(value)) == value
+    with pytest.raises(TypeError):
+        cache_module._dumps(object())
@@ -0,0 +1,24 @@
+from app.utils.content import content_hash, render_article_html
+
+
+def test_render_article_html_splits_paragraphs_and_line_breaks():
+    assert render_article_html("First line\r\nsecond line\n\n\n  Next paragraph  \n") == "<p>First line<br>\nsecond line</p>\n<p>Next paragraph</p>"
+
+
+def test_render_article_html_escapes_markup():
+    html = render_article_html('<script>alert("x")</script> & <b onclick=1>bold</b>')
+
+    assert "<script>" not in html
+    assert "<b " not in html
+    assert html == "<p>&lt;script&gt;alert(&#34;x&#34;)&lt;/script&gt; &amp; &lt;b onclick=1&gt;bold&lt;/b&gt;</p>"
+
+
+def test_render_article_html_of_empty_content():
+    assert render_article_html("") == ""
+    assert render_article_html(None) == ""
+
+
+def test_content_hash_is_stable_and_content_sensitive():
+    assert content_hash("<p>a</p>") == content_hash("<p>a</p>")
+    assert content_hash("<p>a</p>") != content_hash("<p>b</p>")
+    assert len(content_hash("")) == 64
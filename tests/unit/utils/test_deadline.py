@@ -0,0 +1,28 @@
+import time
+
+from app.utils.deadline import deadline, expired, remaining
+
+
+def test_remaining_outside_a_deadline_returns_the_default():
+    assert remaining() is None
+    assert remaining(3.0) == 3.0
+    assert not expired()
+
+
+def test_nested_deadlines_only_shorten_the_budget():
+    with deadline(10):
+        assert 9 < remaining() <= 10
+        with deadline(60):
+            assert remaining() <= 10
+        with deadline(1):
+            assert remaining() <= 1
+        with deadline(None):
+            assert 9 < remaining() <= 10
+    assert remaining() is None
+
+
+def test_spent_budget_is_expired():
+    with deadline(0.001):
+        time.sleep(0.002)
+        assert expired()
+        assert remaining() == 0.001
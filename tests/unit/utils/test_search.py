@@ -0,0 +1,55 @@
+from app.utils.search import fold, phone_tokens, query_tokens, text_tokens, user_tokens
+
+
+def test_fold_strips_accents_and_case():
+    assert fold("Seán Ó Súilleabháin") == "sean o suilleabhain"
+
+
+def test_text_tokens_splits_words_and_squashes_punctuation():
+    assert text_tokens("Mary O'Brien") == {"mary", "o", "brien", "obrien"}
+
+
+def test_text_tokens_splits_email():
+    assert text_tokens("ann.k@example.ie") == {"ann", "k", "example", "ie", "annkexampleie"}
+
+
+def test_text_tokens_empty():
+    assert text_tokens(None) == set()
+    assert text_tokens("") == set()
+
+
+def test_phone_tokens_national_number_gets_international_form():
+    assert phone_tokens("087 123 4567") == {"0871234567", "353871234567"}
+
+
+def test_phone_tokens_international_number_gets_national_form():
+    assert phone_tokens("+353 (87) 123-4567") == {"353871234567", "0871234567"}
+    assert phone_tokens("00353871234567") == {"00353871234567", "353871234567", "0871234567"}
+
+
+def test_phone_tokens_without_digits():
+    assert phone_tokens(None) == set()
+    assert phone_tokens("n/a") == set()
+
+
+def test_user_tokens_combines_fields():
+    tokens = user_tokens("Ann Kelly", "ann@example.ie", "0871234567")
+    assert {"ann", "kelly", "example", "0871234567", "353871234567"} <= tokens
+
+
+def test_query_tokens_phone_query_is_single_digit_token():
+    assert query_tokens("087 123") == ["087123"]
+    assert query_tokens("+353 87") == ["35387"]
+    assert query_tokens("0035387") == ["35387"]
+
+
+def test_query_tokens_short_number_is_a_word():
+    assert query_tokens("12") == ["12"]
+
+
+def test_query_tokens_words_longest_first():
+    assert query_tokens("  Ann  Kelly-Smith ") == ["kelly", "smith", "ann"]
+
+
+def test_query_tokens_punctuation_only():
+    assert query_tokens("@@@") == []